@@ -10,10 +10,27 @@ try:
 except ImportError:
     raise ImportError("Click not installed. Run: pip install 'mealie-mcp[bulk-import]'")
 
-from . import sitemap, ocr, matcher, importer
+from . import sitemap, ocr, matcher, importer, llm_cache
 from .qa import runner as qa_runner
 
 
+def _disable_llm_cache(ctx: click.Context, param: click.Parameter, value: bool) -> bool:
+    """Click callback that turns off the shared LLM response cache."""
+    if value:
+        llm_cache.configure(enabled=False)
+    return value
+
+
+# Shared by every command that calls Claude
+no_llm_cache_option = click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    expose_value=False,
+    callback=_disable_llm_cache,
+    help="Always query Claude instead of reusing cached responses",
+)
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
@@ -144,6 +161,7 @@ def ocr_pdf(pdf_file: str, output: str, dpi: int):
     default="claude-haiku-4-5-20251001",
     help="Anthropic model to use",
 )
+@no_llm_cache_option
 def match(titles_file: str, output: str, country: str, batch_size: int, model: str):
     """Match OCR'd titles to HelloFresh URLs using Claude.
 
@@ -281,6 +299,7 @@ def import_recipes(
     default=".",
     help="Directory for intermediate files (default: current)",
 )
+@no_llm_cache_option
 def run(
     pdf_file: str,
     country: str,
@@ -411,12 +430,33 @@ def search_sitemap(country: str, search_term: str):
     type=click.Path(),
     help="Directory to save QA results",
 )
+@click.option(
+    "--batch-api",
+    is_flag=True,
+    help="Submit all LLM work via the Message Batches API and wait (for large overnight runs)",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-check every recipe, not just those changed since they last passed QA",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=qa_runner.DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of recipes fetched from or written to Mealie in parallel",
+)
+@no_llm_cache_option
 def qa(
     phase: str | None,
     category: str | None,
     limit: int | None,
     dry_run: bool,
     output: str | None,
+    batch_api: bool,
+    full: bool,
+    concurrency: int,
 ):
     """Run QA/QC pipeline on imported recipes.
 
@@ -444,6 +484,16 @@ def qa(
     \b
     # Process first 10 recipes
     python -m scripts.bulk_import_hellofresh.cli qa --limit 10
+
+    \b
+    # Full-library overnight run at batch pricing
+    python -m scripts.bulk_import_hellofresh.cli qa --category "" --batch-api
+
+    Claude responses are cached on disk, so rerunning after a --dry-run
+    reuses them. Pass --no-llm-cache to force fresh responses.
+
+    Recipes that already passed a phase are skipped until their name,
+    yield or ingredients change. Pass --full to re-check everything.
     """
     async def run():
         if dry_run:
@@ -456,6 +506,9 @@ def qa(
             dry_run=dry_run,
             verbose=True,
             output_dir=output,
+            use_batch_api=batch_api,
+            concurrency=concurrency,
+            full=full,
         )
         
         if "error" in results:
@@ -471,6 +524,24 @@ def qa(
             click.echo(f"\n{phase_name.title()}:")
             for key, value in phase_results.items():
                 click.echo(f"  {key}: {value}")
+        
+        updates = results.get("updates")
+        if updates:
+            click.echo("\nRecipe updates (one PATCH per recipe):")
+            for key, value in updates.items():
+                click.echo(f"  {key}: {value}")
+        
+        usage = results.get("llm_usage", {})
+        if usage:
+            click.echo("\nLLM usage (uncached / cache-read / cache-write input tokens, TTFT):")
+            for phase_name, stats in usage.items():
+                click.echo(
+                    f"  {phase_name}: {stats['uncached_input_tokens']} / "
+                    f"{stats['cache_read_input_tokens']} / {stats['cache_creation_input_tokens']} "
+                    f"(hit rate {stats['prompt_cache_hit_rate']}), "
+                    f"TTFT median {stats['ttft_ms_median']} ms, "
+                    f"{stats['local_cache_hits']} local cache hits"
+                )
 
     asyncio.run(run())
 
@@ -0,0 +1,275 @@
+"""Disk-backed cache for Claude responses, keyed by prompt fingerprint.
+
+Every LLM phase in the importer (title matching, nutrition, measurements,
+tagging) sends deterministic prompts built from the same inputs, so a rerun
+or a ``--dry-run`` → real run cycle repeats identical requests. Responses
+are stored in a small SQLite database under ``.cache`` keyed by a SHA-256 of
+the model, prompt and request parameters, and reused until they expire.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from . import llm_usage
+
+# Cache location alongside the sitemap cache
+CACHE_DIR = Path(__file__).parent / ".cache"
+DEFAULT_CACHE_PATH = CACHE_DIR / "llm_responses.sqlite3"
+
+# Entries older than this are treated as misses and purged
+DEFAULT_TTL_HOURS = 24 * 30
+
+# Upper bound on stored response text; least recently used entries go first
+DEFAULT_MAX_MB = 200
+
+# Bump to invalidate every existing entry when the key format changes
+KEY_VERSION = 1
+
+
+class LLMResponseCache:
+    """Content-addressed store of LLM response text."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_mb: float = DEFAULT_MAX_MB,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_hours: Maximum age of a reusable entry
+            max_mb: Maximum total size of cached response text
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, messages: list[dict], **params: Any) -> str:
+        """Fingerprint a request.
+
+        Args:
+            model: Model name
+            messages: Messages payload
+            **params: Any other request parameters (max_tokens, system, ...)
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        payload = {
+            "v": KEY_VERSION,
+            "model": model,
+            "messages": messages,
+            "params": params,
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Request fingerprint from make_key
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, model: str, response: str) -> None:
+        """Store a response and enforce TTL/size limits.
+
+        Args:
+            key: Request fingerprint from make_key
+            model: Model that produced the response
+            response: Response text
+        """
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the size cap."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Module-level cache shared by all phases
+_cache: LLMResponseCache | None = None
+_enabled = True
+
+
+def configure(
+    enabled: bool = True,
+    path: str | Path | None = None,
+    ttl_hours: float | None = None,
+    max_mb: float | None = None,
+) -> None:
+    """Configure the shared response cache.
+
+    Args:
+        enabled: Set False to always query the model (``--no-llm-cache``)
+        path: Override the database location
+        ttl_hours: Override the entry lifetime
+        max_mb: Override the size cap
+    """
+    global _cache, _enabled
+
+    _enabled = enabled
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+    if enabled and (path or ttl_hours is not None or max_mb is not None):
+        _cache = LLMResponseCache(
+            path=path or DEFAULT_CACHE_PATH,
+            ttl_hours=DEFAULT_TTL_HOURS if ttl_hours is None else ttl_hours,
+            max_mb=DEFAULT_MAX_MB if max_mb is None else max_mb,
+        )
+
+
+def get_cache() -> LLMResponseCache | None:
+    """Get the shared cache, or None when caching is disabled."""
+    global _cache
+    if not _enabled:
+        return None
+    if _cache is None:
+        _cache = LLMResponseCache()
+    return _cache
+
+
+def create_message_text(
+    client: Any,
+    *,
+    model: str,
+    max_tokens: int,
+    messages: list[dict],
+    phase: str = "default",
+    **params: Any,
+) -> str:
+    """Call the Messages API through the response cache.
+
+    Misses are sent as a streaming request so time-to-first-token can be
+    measured; token usage (including prompt-cache reads and writes) is
+    recorded in llm_usage under ``phase``. Only complete responses
+    (``stop_reason == "end_turn"``) are stored, so a reply truncated by
+    ``max_tokens`` is retried on the next run.
+
+    Args:
+        client: anthropic.Anthropic instance
+        model: Model name
+        max_tokens: Maximum output tokens
+        messages: Messages payload
+        phase: Label for usage accounting (not part of the cache key)
+        **params: Additional request parameters (e.g. system), included in the cache key
+
+    Returns:
+        Text of the first content block
+    """
+    cache = get_cache()
+    key = LLMResponseCache.make_key(model, messages, max_tokens=max_tokens, **params)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            llm_usage.record_local_hit(phase)
+            return cached
+
+    started = time.perf_counter()
+    ttft_ms = None
+
+    with client.messages.stream(
+        model=model,
+        max_tokens=max_tokens,
+        messages=messages,
+        **params,
+    ) as stream:
+        for _ in stream.text_stream:
+            if ttft_ms is None:
+                ttft_ms = (time.perf_counter() - started) * 1000
+        response = stream.get_final_message()
+
+    llm_usage.record_usage(phase, response.usage, ttft_ms)
+    text = response.content[0].text
+
+    if cache is not None and response.stop_reason == "end_turn":
+        cache.set(key, model, text)
+
+    return text
@@ -0,0 +1,89 @@
+"""Per-phase accounting of Claude token usage and latency.
+
+Tracks, for each labelled phase (e.g. "nutrition", "tags"), how many input
+tokens were billed at the full rate versus served from or written to the
+prompt cache, plus time-to-first-token for interactive calls. Responses
+answered by the local LLM response cache are counted separately since they
+never reach the API.
+"""
+
+import threading
+from statistics import median
+from typing import Any
+
+_stats: dict[str, dict[str, Any]] = {}
+
+# Phases may record from worker threads (see asyncio.to_thread in the QA phases)
+_lock = threading.Lock()
+
+
+def _phase_stats(phase: str) -> dict[str, Any]:
+    if phase not in _stats:
+        _stats[phase] = {
+            "requests": 0,
+            "local_cache_hits": 0,
+            "input_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "output_tokens": 0,
+            "ttft_ms": [],
+        }
+    return _stats[phase]
+
+
+def record_usage(phase: str, usage: Any, ttft_ms: float | None = None) -> None:
+    """Record the usage block of one API response.
+
+    Args:
+        phase: Phase label
+        usage: ``response.usage`` from the Anthropic SDK
+        ttft_ms: Time to first streamed token, if measured
+    """
+    with _lock:
+        stats = _phase_stats(phase)
+        stats["requests"] += 1
+        stats["input_tokens"] += getattr(usage, "input_tokens", 0) or 0
+        stats["cache_read_input_tokens"] += getattr(usage, "cache_read_input_tokens", 0) or 0
+        stats["cache_creation_input_tokens"] += getattr(usage, "cache_creation_input_tokens", 0) or 0
+        stats["output_tokens"] += getattr(usage, "output_tokens", 0) or 0
+        if ttft_ms is not None:
+            stats["ttft_ms"].append(ttft_ms)
+
+
+def record_local_hit(phase: str) -> None:
+    """Record a request answered by the local response cache."""
+    with _lock:
+        _phase_stats(phase)["local_cache_hits"] += 1
+
+
+def summary() -> dict[str, dict[str, Any]]:
+    """Summarize usage per phase.
+
+    Returns:
+        Dict mapping phase to counters, the share of input tokens read from
+        the prompt cache, and median/max time-to-first-token in ms
+    """
+    result = {}
+    for phase, stats in _stats.items():
+        cached = stats["cache_read_input_tokens"]
+        total_input = stats["input_tokens"] + cached + stats["cache_creation_input_tokens"]
+        ttft = stats["ttft_ms"]
+
+        result[phase] = {
+            "requests": stats["requests"],
+            "local_cache_hits": stats["local_cache_hits"],
+            "uncached_input_tokens": stats["input_tokens"],
+            "cache_read_input_tokens": cached,
+            "cache_creation_input_tokens": stats["cache_creation_input_tokens"],
+            "output_tokens": stats["output_tokens"],
+            "prompt_cache_hit_rate": f"{cached / total_input * 100:.1f}%" if total_input else "n/a",
+            "ttft_ms_median": round(median(ttft), 1) if ttft else None,
+            "ttft_ms_max": round(max(ttft), 1) if ttft else None,
+        }
+    return result
+
+
+def reset() -> None:
+    """Clear all recorded usage."""
+    with _lock:
+        _stats.clear()
@@ -1,12 +1,13 @@
-from __future__ import annotations
-
 """LLM-powered matching of OCR'd recipe titles to HelloFresh URLs."""
 
+from __future__ import annotations
+
 import json
 import re
-import os
 from pathlib import Path
 
+from .llm_cache import create_message_text
+
 try:
     import anthropic
 except ImportError:
@@ -14,7 +15,6 @@ except ImportError:
         "Anthropic SDK not installed. Run: pip install 'mealie-mcp[bulk-import]'"
     )
 
-
 # Default model for matching - Haiku is fast/cheap and sufficient for this task
 DEFAULT_MODEL = "claude-haiku-4-5-20251001"
 
@@ -253,14 +253,16 @@ async def match_titles_batch(
 
     prompt = create_matching_prompt(scanned_titles, sitemap_recipes)
 
-    response = client.messages.create(
+    response_text = create_message_text(
+        client,
         model=model,
         max_tokens=4096,
         messages=[{"role": "user", "content": prompt}],
+        phase="match",
     )
 
     # Parse JSON response
-    response_text = response.content[0].text.strip()
+    response_text = response_text.strip()
 
     # Handle potential markdown code blocks
     if response_text.startswith("```"):
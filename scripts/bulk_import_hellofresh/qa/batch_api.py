@@ -0,0 +1,215 @@
+"""Offline QA execution through the Anthropic Message Batches API.
+
+Instead of calling ``messages.create`` batch after batch, every prompt from
+every requested phase is built up front, submitted as a single Message
+Batch, polled until processing ends, and the results are parsed back into
+the same per-phase update lists the interactive path produces. Batches are
+processed asynchronously on Anthropic's side (typically well under an hour,
+at most 24h) at half the per-token price, which suits overnight full-library
+runs. Requests that error or expire inside the batch fall back to an
+interactive call so a transient failure doesn't drop recipes from the run.
+
+The Anthropic client honours ``ANTHROPIC_BASE_URL``, so the whole flow can
+be pointed at a local stand-in for the batch endpoint; alternatively pass a
+preconfigured ``client`` into run_phases_via_batch_api.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any
+
+import anthropic
+
+from .. import llm_usage
+from ..llm_cache import LLMResponseCache, create_message_text, get_cache
+from .measurements import build_measurement_requests, parse_measurement_response
+from .nutrition import build_nutrition_requests, parse_nutrition_response
+from .tagging import build_tagging_requests, parse_tagging_response
+
+# How often to check whether a submitted batch has finished
+POLL_INTERVAL_SECONDS = 30.0
+
+# API limit on requests per Message Batch
+MAX_REQUESTS_PER_BATCH = 100_000
+
+# phase -> (request builder, response parser)
+PHASE_HANDLERS = {
+    "nutrition": (build_nutrition_requests, parse_nutrition_response),
+    "measurements": (build_measurement_requests, parse_measurement_response),
+    "tags": (build_tagging_requests, parse_tagging_response),
+}
+
+
+def _create_client() -> anthropic.Anthropic:
+    """Create an Anthropic client from the environment."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable required")
+    return anthropic.Anthropic(api_key=api_key)
+
+
+async def run_message_batch(
+    requests: list[dict],
+    client: Any | None = None,
+    poll_interval: float = POLL_INTERVAL_SECONDS,
+    verbose: bool = False,
+    retry_failed: bool = True,
+) -> dict[str, str | None]:
+    """Submit requests as Message Batches and wait for the results.
+
+    Requests already present in the LLM response cache are answered locally
+    and never submitted; fresh results are written back to the cache. Token
+    usage of each result is recorded in llm_usage under the request's
+    optional "phase" label.
+
+    Args:
+        requests: List of {"custom_id": str, "params": messages.create kwargs,
+            "phase": optional usage label}
+        client: anthropic.Anthropic instance (created from env if omitted)
+        poll_interval: Seconds between status checks
+        verbose: Print progress
+        retry_failed: Resend requests that errored, expired, were canceled
+            or are missing from the results as interactive calls
+
+    Returns:
+        Dict mapping custom_id to response text, or None if that request
+        failed in the batch (and in the interactive retry, if enabled)
+    """
+    cache = get_cache()
+    texts: dict[str, str | None] = {}
+    keys: dict[str, str] = {}
+    phases: dict[str, str] = {}
+    pending = []
+
+    for request in requests:
+        params = dict(request["params"])
+        key = LLMResponseCache.make_key(
+            params.pop("model"), params.pop("messages"), **params
+        )
+        phase = request.get("phase", "batch")
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            texts[request["custom_id"]] = cached
+            llm_usage.record_local_hit(phase)
+        else:
+            keys[request["custom_id"]] = key
+            phases[request["custom_id"]] = phase
+            pending.append({"custom_id": request["custom_id"], "params": request["params"]})
+
+    if verbose and texts:
+        print(f"  {len(texts)}/{len(requests)} requests answered from the LLM cache")
+
+    if not pending:
+        return texts
+
+    if client is None:
+        client = _create_client()
+
+    for start in range(0, len(pending), MAX_REQUESTS_PER_BATCH):
+        chunk = pending[start:start + MAX_REQUESTS_PER_BATCH]
+        batch = client.messages.batches.create(requests=chunk)
+
+        if verbose:
+            print(f"  Submitted message batch {batch.id} ({len(chunk)} requests)")
+
+        started = time.monotonic()
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = client.messages.batches.retrieve(batch.id)
+            if verbose:
+                counts = batch.request_counts
+                elapsed = time.monotonic() - started
+                print(
+                    f"  [{elapsed:.0f}s] {batch.id}: {batch.processing_status} "
+                    f"(processing={counts.processing}, succeeded={counts.succeeded}, "
+                    f"errored={counts.errored})"
+                )
+
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                texts[entry.custom_id] = None
+                if verbose:
+                    print(f"  ✗ {entry.custom_id}: {entry.result.type}")
+                continue
+
+            message = entry.result.message
+            llm_usage.record_usage(phases[entry.custom_id], message.usage)
+            text = message.content[0].text
+            texts[entry.custom_id] = text
+
+            if cache is not None and message.stop_reason == "end_turn":
+                cache.set(keys[entry.custom_id], message.model, text)
+
+    failed = [request for request in pending if texts.get(request["custom_id"]) is None]
+    if failed and retry_failed and verbose:
+        print(f"  Retrying {len(failed)} failed batch requests interactively")
+    for request in failed:
+        custom_id = request["custom_id"]
+        texts[custom_id] = None
+        if not retry_failed:
+            continue
+        try:
+            texts[custom_id] = await asyncio.to_thread(
+                create_message_text, client, phase=phases[custom_id], **request["params"]
+            )
+        except anthropic.APIError as e:
+            if verbose:
+                print(f"  ✗ {custom_id}: {e}")
+
+    return texts
+
+
+async def run_phases_via_batch_api(
+    recipes: list[dict],
+    phases: list[str],
+    client: Any | None = None,
+    poll_interval: float = POLL_INTERVAL_SECONDS,
+    verbose: bool = False,
+    recipes_by_phase: dict[str, list[dict]] | None = None,
+) -> dict[str, list[dict]]:
+    """Run the LLM step of several QA phases as one Message Batch.
+
+    Args:
+        recipes: Full recipe dicts to process
+        phases: Phase names ("nutrition", "measurements", "tags")
+        client: anthropic.Anthropic instance (created from env if omitted)
+        poll_interval: Seconds between status checks
+        verbose: Print progress
+        recipes_by_phase: Per-phase recipe lists overriding ``recipes``
+            (e.g. only recipes changed since they last passed that phase)
+
+    Returns:
+        Dict mapping phase name to the same result list its interactive
+        *_for_recipes function would return
+    """
+    jobs = []
+    for phase in phases:
+        build_requests, _ = PHASE_HANDLERS[phase]
+        phase_recipes = (recipes_by_phase or {}).get(phase, recipes)
+        for i, request in enumerate(build_requests(phase_recipes)):
+            jobs.append((phase, f"{phase}-{i}", request))
+
+    if verbose:
+        by_phase = {p: sum(1 for job in jobs if job[0] == p) for p in phases}
+        print(f"Message Batches mode: {len(jobs)} requests {by_phase}")
+
+    texts = await run_message_batch(
+        [
+            {"custom_id": custom_id, "params": request["params"], "phase": phase}
+            for phase, custom_id, request in jobs
+        ],
+        client=client,
+        poll_interval=poll_interval,
+        verbose=verbose,
+    )
+
+    results: dict[str, list[dict]] = {phase: [] for phase in phases}
+    for phase, custom_id, request in jobs:
+        text = texts.get(custom_id)
+        if text is None:
+            continue
+        _, parse_response = PHASE_HANDLERS[phase]
+        results[phase].extend(parse_response(text, request["context"]))
+
+    return results
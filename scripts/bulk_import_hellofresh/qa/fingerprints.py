@@ -0,0 +1,131 @@
+"""Content fingerprints for incremental QA.
+
+Each QA phase only looks at a few fields of a recipe (name, yield,
+ingredient text, plus existing nutrition for the nutrition phase and times
+and step count for tagging). After a recipe
+passes a phase, a hash of those inputs plus the phase version is stored per
+slug in ``.cache/qa_fingerprints.json``. Later runs skip a recipe for that
+phase while its hash still matches, so routine QA only sends new or edited
+recipes to Claude.
+
+Bump a phase's entry in PHASE_VERSIONS when its prompt or logic changes to
+reprocess every recipe for that phase.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+DEFAULT_STORE_PATH = CACHE_DIR / "qa_fingerprints.json"
+
+# Bump to invalidate stored fingerprints for one phase
+PHASE_VERSIONS = {
+    "nutrition": 1,
+    "measurements": 1,
+    "tags": 1,
+}
+
+
+def _ingredient_texts(recipe: dict) -> list[str]:
+    """Ingredient lines as the phase prompts see them."""
+    return [
+        ing.get("display") or ing.get("note") or ing.get("originalText") or ""
+        for ing in recipe.get("recipeIngredient", [])
+    ]
+
+
+def phase_inputs(recipe: dict, phase: str) -> dict:
+    """Select the recipe fields a phase's output depends on.
+
+    Args:
+        recipe: Full recipe dict (by_alias)
+        phase: Phase name ("nutrition", "measurements", "tags")
+
+    Returns:
+        Dict of the phase's inputs
+    """
+    inputs = {
+        "name": recipe.get("name"),
+        "recipeYield": recipe.get("recipeYield"),
+        "ingredients": _ingredient_texts(recipe),
+    }
+
+    if phase == "nutrition":
+        inputs["nutrition"] = recipe.get("nutrition")
+    elif phase == "tags":
+        inputs["times"] = [recipe.get("prepTime"), recipe.get("cookTime"), recipe.get("totalTime")]
+        inputs["steps"] = len(recipe.get("recipeInstructions", []))
+
+    return inputs
+
+
+def recipe_fingerprint(recipe: dict, phase: str) -> str:
+    """Hash a recipe's inputs for one phase.
+
+    Args:
+        recipe: Full recipe dict (by_alias)
+        phase: Phase name
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = {
+        "phase": phase,
+        "version": PHASE_VERSIONS.get(phase, 1),
+        "inputs": phase_inputs(recipe, phase),
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """Persistent slug -> {phase: fingerprint} map."""
+
+    def __init__(self, path: str | Path = DEFAULT_STORE_PATH):
+        """Load the store, starting empty if the file is missing or unreadable.
+
+        Args:
+            path: JSON file backing the store
+        """
+        self.path = Path(path)
+        self.entries: dict[str, dict[str, str]] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.entries = {}
+
+    def is_current(self, recipe: dict, phase: str) -> bool:
+        """Check whether a recipe already passed a phase with its current inputs.
+
+        Args:
+            recipe: Full recipe dict (by_alias)
+            phase: Phase name
+
+        Returns:
+            True if the stored fingerprint matches
+        """
+        stored = self.entries.get(recipe.get("slug"), {}).get(phase)
+        return stored is not None and stored == recipe_fingerprint(recipe, phase)
+
+    def record(self, recipe: dict, phases: list[str]) -> None:
+        """Mark a recipe as having passed the given phases in its current state.
+
+        Args:
+            recipe: Full recipe dict (by_alias), after any QA update
+            phases: Phase names it passed
+        """
+        entry = self.entries.setdefault(recipe["slug"], {})
+        for phase in phases:
+            entry[phase] = recipe_fingerprint(recipe, phase)
+
+    def save(self) -> None:
+        """Write the store to disk atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        tmp_path.replace(self.path)
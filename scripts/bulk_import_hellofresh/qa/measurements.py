@@ -1,5 +1,6 @@
 """Phase 2: Normalize proprietary measurements to standard cooking units."""
 
+import asyncio
 import json
 import os
 import re
@@ -7,6 +8,8 @@ from typing import Any
 
 import anthropic
 
+from ..llm_cache import create_message_text
+
 # Model for measurement normalization
 MODEL = "claude-haiku-4-5-20251001"
 MAX_TOKENS = 8192
@@ -77,16 +80,9 @@ def _get_proprietary_ingredients(recipe: dict) -> list[dict]:
     return result
 
 
-def _build_measurement_prompt(recipes_with_ingredients: list[dict]) -> str:
-    """Build prompt for measurement normalization.
-    
-    Args:
-        recipes_with_ingredients: List of dicts with recipe info and proprietary ingredients
-        
-    Returns:
-        Formatted prompt string
-    """
-    prompt = """You are a cooking expert converting proprietary meal-kit measurements to standard cooking units.
+# Static instructions, sent as a cacheable system block so only the
+# per-batch recipe payload varies between requests
+MEASUREMENT_INSTRUCTIONS = """You are a cooking expert converting proprietary meal-kit measurements to standard cooking units.
 
 ## HelloFresh/Meal Kit Typical Sizes
 
@@ -132,9 +128,19 @@ Return a JSON array using the EXACT recipe index number provided:
 
 IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modify slugs.
 
-## Recipes to Normalize
+Return ONLY the JSON array, no other text."""
 
-"""
+
+def _build_measurement_prompt(recipes_with_ingredients: list[dict]) -> str:
+    """Build the per-batch part of the measurement prompt.
+    
+    Args:
+        recipes_with_ingredients: List of dicts with recipe info and proprietary ingredients
+        
+    Returns:
+        Formatted prompt string listing the ingredients to normalize
+    """
+    prompt = "## Recipes to Normalize\n\n"
     
     for i, item in enumerate(recipes_with_ingredients, 1):
         recipe = item["recipe"]
@@ -153,23 +159,15 @@ IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modif
     return prompt, recipes_with_ingredients
 
 
-async def normalize_measurements_batch(
-    recipes: list[dict],
-    dry_run: bool = False,
-) -> list[dict]:
-    """Normalize proprietary measurements for a batch of recipes.
+def _collect_proprietary(recipes: list[dict]) -> list[dict]:
+    """Pair each recipe with its proprietary ingredients, dropping clean ones.
     
     Args:
-        recipes: List of recipe dicts from Mealie
-        dry_run: If True, return what would be normalized without making changes
+        recipes: List of recipe dicts
         
     Returns:
-        List of normalization results with slugs and updated ingredients
+        List of dicts with "recipe" and "proprietary_ingredients"
     """
-    if not recipes:
-        return []
-    
-    # Build list of recipes with their proprietary ingredients
     recipes_with_ingredients = []
     for recipe in recipes:
         proprietary = _get_proprietary_ingredients(recipe)
@@ -178,37 +176,43 @@ async def normalize_measurements_batch(
                 "recipe": recipe,
                 "proprietary_ingredients": proprietary,
             })
+    return recipes_with_ingredients
+
+
+def _measurement_params(recipes_with_ingredients: list[dict]) -> dict:
+    """Build Messages API parameters for a measurement batch.
     
-    if not recipes_with_ingredients:
-        return []
-    
-    if dry_run:
-        return [
+    Args:
+        recipes_with_ingredients: Output of _collect_proprietary
+        
+    Returns:
+        Keyword arguments for messages.create
+    """
+    prompt, _ = _build_measurement_prompt(recipes_with_ingredients)
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
             {
-                "slug": item["recipe"].get("slug"),
-                "ingredients_to_normalize": len(item["proprietary_ingredients"]),
-                "would_normalize": True,
+                "type": "text",
+                "text": MEASUREMENT_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"},
             }
-            for item in recipes_with_ingredients
-        ]
-    
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable required")
-    
-    client = anthropic.Anthropic(api_key=api_key)
-    
-    prompt, indexed_recipes = _build_measurement_prompt(recipes_with_ingredients)
-    
-    response = client.messages.create(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    
-    # Parse response
-    content = response.content[0].text
+        ],
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
+def parse_measurement_response(content: str, indexed_recipes: list[dict]) -> list[dict]:
+    """Parse an LLM measurement response and map results back to slugs.
     
+    Args:
+        content: Raw response text
+        indexed_recipes: The recipes_with_ingredients list the prompt was built from
+        
+    Returns:
+        List of normalization results with slugs and updated ingredients
+    """
     # Extract JSON from response
     if "```json" in content:
         content = content.split("```json")[1].split("```")[0]
@@ -233,6 +237,82 @@ async def normalize_measurements_batch(
     return results
 
 
+def build_measurement_requests(recipes: list[dict], batch_size: int = 10) -> list[dict]:
+    """Build one request per batch of recipes with proprietary measurements.
+    
+    Used by the Message Batches execution mode, which submits every request
+    up front instead of calling the model batch by batch.
+    
+    Args:
+        recipes: List of recipe dicts
+        batch_size: Number of recipes per request
+        
+    Returns:
+        List of dicts with "params" (messages.create kwargs) and "context"
+        (passed back to parse_measurement_response)
+    """
+    recipes_needing = [r for r in recipes if has_proprietary_measurements(r)]
+    
+    requests = []
+    for i in range(0, len(recipes_needing), batch_size):
+        recipes_with_ingredients = _collect_proprietary(recipes_needing[i:i + batch_size])
+        if recipes_with_ingredients:
+            requests.append({
+                "params": _measurement_params(recipes_with_ingredients),
+                "context": recipes_with_ingredients,
+            })
+    return requests
+
+
+async def normalize_measurements_batch(
+    recipes: list[dict],
+    dry_run: bool = False,
+) -> list[dict]:
+    """Normalize proprietary measurements for a batch of recipes.
+    
+    Args:
+        recipes: List of recipe dicts from Mealie
+        dry_run: If True, return what would be normalized without making changes
+        
+    Returns:
+        List of normalization results with slugs and updated ingredients
+    """
+    if not recipes:
+        return []
+    
+    # Build list of recipes with their proprietary ingredients
+    recipes_with_ingredients = _collect_proprietary(recipes)
+    
+    if not recipes_with_ingredients:
+        return []
+    
+    if dry_run:
+        return [
+            {
+                "slug": item["recipe"].get("slug"),
+                "ingredients_to_normalize": len(item["proprietary_ingredients"]),
+                "would_normalize": True,
+            }
+            for item in recipes_with_ingredients
+        ]
+    
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable required")
+    
+    client = anthropic.Anthropic(api_key=api_key)
+    
+    # Run the blocking API call off the event loop so phases can overlap
+    content = await asyncio.to_thread(
+        create_message_text,
+        client,
+        phase="measurements",
+        **_measurement_params(recipes_with_ingredients),
+    )
+    
+    return parse_measurement_response(content, recipes_with_ingredients)
+
+
 async def normalize_measurements_for_recipes(
     recipes: list[dict],
     batch_size: int = 10,
@@ -1,11 +1,14 @@
 """Phase 1: Nutrition calculation for recipes with missing nutrition data."""
 
+import asyncio
 import json
 import os
 from typing import Any
 
 import anthropic
 
+from ..llm_cache import create_message_text
+
 # Model for nutrition calculation - needs detailed reasoning
 MODEL = "claude-haiku-4-5-20251001"
 MAX_TOKENS = 8192
@@ -34,16 +37,9 @@ def needs_nutrition(recipe: dict) -> bool:
     return False
 
 
-def _build_nutrition_prompt(recipes: list[dict]) -> str:
-    """Build prompt for nutrition calculation.
-    
-    Args:
-        recipes: List of recipe dicts to calculate nutrition for
-        
-    Returns:
-        Formatted prompt string
-    """
-    prompt = """You are a nutritionist calculating accurate PER-SERVING nutrition for recipes.
+# Static instructions, sent as a cacheable system block so only the
+# per-batch recipe payload varies between requests
+NUTRITION_INSTRUCTIONS = """You are a nutritionist calculating accurate PER-SERVING nutrition for recipes.
 
 CRITICAL: All values must be PER SINGLE SERVING, not for the entire recipe.
 
@@ -82,9 +78,19 @@ Return a JSON array with one object per recipe, using the EXACT recipe index num
 
 IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modify slugs.
 
-## Recipes to Calculate
+Return ONLY the JSON array, no other text."""
+
 
-"""
+def _build_nutrition_prompt(recipes: list[dict]) -> str:
+    """Build the per-batch part of the nutrition prompt.
+    
+    Args:
+        recipes: List of recipe dicts to calculate nutrition for
+        
+    Returns:
+        Formatted prompt string listing the recipes
+    """
+    prompt = "## Recipes to Calculate\n\n"
     
     for i, recipe in enumerate(recipes, 1):
         prompt += f"\n### Recipe {i} (index={i}): {recipe.get('name', 'Unknown')}\n"
@@ -104,42 +110,39 @@ IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modif
     return prompt
 
 
-async def calculate_nutrition_batch(
-    recipes: list[dict],
-    dry_run: bool = False,
-) -> list[dict]:
-    """Calculate nutrition for a batch of recipes using LLM.
+def _nutrition_params(recipes: list[dict]) -> dict:
+    """Build Messages API parameters for a nutrition batch.
     
     Args:
-        recipes: List of recipe dicts from Mealie
-        dry_run: If True, return what would be calculated without making changes
+        recipes: List of recipe dicts to calculate nutrition for
         
     Returns:
-        List of nutrition results with slugs
+        Keyword arguments for messages.create
     """
-    if not recipes:
-        return []
-    
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable required")
-    
-    client = anthropic.Anthropic(api_key=api_key)
-    
-    prompt = _build_nutrition_prompt(recipes)
-    
-    if dry_run:
-        return [{"slug": r.get("slug"), "would_calculate": True} for r in recipes]
-    
-    response = client.messages.create(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    
-    # Parse response
-    content = response.content[0].text
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {
+                "type": "text",
+                "text": NUTRITION_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [{"role": "user", "content": _build_nutrition_prompt(recipes)}],
+    }
+
+
+def parse_nutrition_response(content: str, recipes: list[dict]) -> list[dict]:
+    """Parse an LLM nutrition response and map results back to slugs.
     
+    Args:
+        content: Raw response text
+        recipes: The recipe batch the prompt was built from
+        
+    Returns:
+        List of nutrition results with slugs
+    """
     # Extract JSON from response (handle markdown code blocks)
     if "```json" in content:
         content = content.split("```json")[1].split("```")[0]
@@ -169,6 +172,64 @@ async def calculate_nutrition_batch(
     return valid_results
 
 
+def build_nutrition_requests(recipes: list[dict], batch_size: int = 8) -> list[dict]:
+    """Build one request per batch of recipes needing nutrition.
+    
+    Used by the Message Batches execution mode, which submits every request
+    up front instead of calling the model batch by batch.
+    
+    Args:
+        recipes: List of recipe dicts
+        batch_size: Number of recipes per request
+        
+    Returns:
+        List of dicts with "params" (messages.create kwargs) and "context"
+        (the recipe batch, passed back to parse_nutrition_response)
+    """
+    recipes_needing = [r for r in recipes if needs_nutrition(r)]
+    
+    return [
+        {
+            "params": _nutrition_params(recipes_needing[i:i + batch_size]),
+            "context": recipes_needing[i:i + batch_size],
+        }
+        for i in range(0, len(recipes_needing), batch_size)
+    ]
+
+
+async def calculate_nutrition_batch(
+    recipes: list[dict],
+    dry_run: bool = False,
+) -> list[dict]:
+    """Calculate nutrition for a batch of recipes using LLM.
+    
+    Args:
+        recipes: List of recipe dicts from Mealie
+        dry_run: If True, return what would be calculated without making changes
+        
+    Returns:
+        List of nutrition results with slugs
+    """
+    if not recipes:
+        return []
+    
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable required")
+    
+    client = anthropic.Anthropic(api_key=api_key)
+    
+    if dry_run:
+        return [{"slug": r.get("slug"), "would_calculate": True} for r in recipes]
+    
+    # Run the blocking API call off the event loop so phases can overlap
+    content = await asyncio.to_thread(
+        create_message_text, client, phase="nutrition", **_nutrition_params(recipes)
+    )
+    
+    return parse_nutrition_response(content, recipes)
+
+
 async def calculate_nutrition_for_recipes(
     recipes: list[dict],
     batch_size: int = 8,
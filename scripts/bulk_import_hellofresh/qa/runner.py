@@ -2,88 +2,188 @@
 
 import asyncio
 import json
-import os
 import sys
+import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
+from .. import llm_usage
+from .batch_api import run_phases_via_batch_api
+from .fingerprints import FingerprintStore
+from .measurements import has_proprietary_measurements, normalize_measurements_for_recipes
+from .nutrition import calculate_nutrition_for_recipes, needs_nutrition
+from .tagging import apply_tags_for_recipes, needs_tags
+
 # Load environment variables from repo root
 load_dotenv(Path(__file__).parent.parent.parent.parent / ".env")
 
 # Add src to path for MealieClient
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
 
-from mealie_mcp.client import MealieClient
+from mealie_mcp.client import MealieClient  # noqa: E402
+from mealie_mcp.models import ErrorResponse  # noqa: E402
+from mealie_mcp.organizers import OrganizerIndex, organizer_payload  # noqa: E402
 
-from .nutrition import calculate_nutrition_for_recipes, needs_nutrition
-from .measurements import normalize_measurements_for_recipes, has_proprietary_measurements
-from .tagging import apply_tags_for_recipes
+# Default number of concurrent Mealie requests when hydrating or updating recipes
+DEFAULT_CONCURRENCY = 8
 
+# phase -> interactive LLM step
+PHASE_RUNNERS = {
+    "nutrition": calculate_nutrition_for_recipes,
+    "measurements": normalize_measurements_for_recipes,
+    "tags": apply_tags_for_recipes,
+}
 
-class TagCategoryCache:
-    """Cache for existing tags and categories to avoid repeated API calls."""
-    
-    def __init__(self):
-        self.tags: dict[str, dict] = {}  # slug -> full tag object
-        self.categories: dict[str, dict] = {}  # slug -> full category object
-        self.group_id: str | None = None
-        self._loaded = False
+# phase -> whether a recipe still needs work
+PHASE_NEEDS = {
+    "nutrition": needs_nutrition,
+    "measurements": has_proprietary_measurements,
+    "tags": needs_tags,
+}
+
+# phase -> (result count key, dry-run result count key)
+PHASE_RESULT_KEYS = {
+    "nutrition": ("calculated", "would_calculate"),
+    "measurements": ("normalized", "would_normalize"),
+    "tags": ("tagged", "would_tag"),
+}
+
+PHASE_LABELS = {
+    "nutrition": "Nutrition Calculation",
+    "measurements": "Measurement Normalization",
+    "tags": "Tagging & Categorization",
+}
+
+# Per-recipe outcome status -> summary counter
+OUTCOME_COUNTERS = {"updated": "success", "failed": "failed", "conflict": "conflicts"}
+
+
+async def _list_recipe_slugs(
+    client: MealieClient,
+    category: str | None = None,
+    limit: int | None = None,
+) -> list[str]:
+    """List recipe slugs, optionally filtered by category.
     
-    async def load(self, client: MealieClient) -> None:
-        """Load all existing tags and categories."""
-        if self._loaded:
-            return
+    Args:
+        client: MealieClient instance
+        category: Category slug to filter by, empty string for all
+        limit: Maximum number of recipes to list
         
-        self.group_id = await client.get_group_id()
+    Returns:
+        Slugs in search order (empty on error)
+    """
+    # Search with category filter if provided (empty string means no filter)
+    categories = [category] if category else None
+    
+    # Fetch recipe summaries
+    summaries = await client.search_recipes(
+        query="",
+        categories=categories,
+        per_page=limit or 500,
+    )
+    
+    if hasattr(summaries, "model_dump"):
+        # ErrorResponse
+        print(f"Error fetching recipes: {summaries}")
+        return []
+    
+    return [
+        summary.slug if hasattr(summary, "slug") else summary.get("slug")
+        for summary in summaries
+    ]
+
+
+async def _load_recipe(client: MealieClient, slug: str, verbose: bool = False) -> dict | None:
+    """Fetch one full recipe as a dict.
+    
+    Args:
+        client: MealieClient instance
+        slug: Recipe slug from the search results
+        verbose: Print why a recipe is skipped
         
-        # Load tags
-        tags_result = await client._request("GET", "/organizers/tags", params={"perPage": 500})
-        if isinstance(tags_result, dict) and "items" in tags_result:
-            for tag in tags_result["items"]:
-                self.tags[tag["slug"]] = tag
+    Returns:
+        Recipe dict, or None if it could not be loaded
+    """
+    try:
+        recipe = await client.get_recipe(slug)
         
-        # Load categories
-        cats_result = await client._request("GET", "/organizers/categories", params={"perPage": 500})
-        if isinstance(cats_result, dict) and "items" in cats_result:
-            for cat in cats_result["items"]:
-                self.categories[cat["slug"]] = cat
+        # Check if it's an error response
+        if hasattr(recipe, "error") and recipe.error:
+            if verbose:
+                print(f"  Skipping {slug} (error loading)")
+            return None
         
-        self._loaded = True
-    
-    async def get_or_create_tag(self, client: MealieClient, name: str) -> dict:
-        """Get existing tag or create new one."""
-        slug = name.lower().replace(" ", "-")
+        if not hasattr(recipe, "model_dump"):
+            return None
         
-        if slug in self.tags:
-            return self.tags[slug]
+        recipe_dict = recipe.model_dump(by_alias=True)
         
-        # Create new tag
-        result = await client._request("POST", "/organizers/tags", json={"name": name})
-        if isinstance(result, dict) and "id" in result:
-            self.tags[slug] = result
-            return result
+        # Double-check for error in dict
+        if recipe_dict.get("error"):
+            if verbose:
+                print(f"  Skipping {slug} (error in data)")
+            return None
         
-        # If creation failed, return minimal object (will likely fail on update)
-        return {"name": name, "slug": slug, "groupId": self.group_id}
-    
-    async def get_or_create_category(self, client: MealieClient, name: str) -> dict:
-        """Get existing category or create new one."""
-        slug = name.lower().replace(" ", "-")
+        # IMPORTANT: Use the API slug (from summary) not the recipe's internal slug
+        # These can differ due to Mealie data inconsistencies
+        recipe_dict["slug"] = slug
         
-        if slug in self.categories:
-            return self.categories[slug]
+        return recipe_dict
         
-        # Create new category
-        result = await client._request("POST", "/organizers/categories", json={"name": name})
-        if isinstance(result, dict) and "id" in result:
-            self.categories[slug] = result
-            return result
+    except Exception as e:
+        if verbose:
+            print(f"  Skipping {slug} (exception: {e})")
+        return None
+
+
+async def hydrate_recipes(
+    client: MealieClient,
+    slugs: list[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    verbose: bool = False,
+) -> AsyncIterator[dict]:
+    """Fetch full recipes with bounded concurrency, yielding each as it arrives.
+    
+    Recipes are yielded in completion order, not slug order. Recipes that
+    fail to load are skipped and counted.
+    
+    Args:
+        client: MealieClient instance
+        slugs: Recipe slugs to fetch
+        concurrency: Maximum number of in-flight get_recipe calls
+        verbose: Print progress
         
-        # If creation failed, return minimal object
-        return {"name": name, "slug": slug, "groupId": self.group_id}
+    Yields:
+        Full recipe dicts
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def load(slug: str) -> dict | None:
+        async with semaphore:
+            return await _load_recipe(client, slug, verbose=verbose)
+    
+    tasks = [asyncio.create_task(load(slug)) for slug in slugs]
+    skipped = 0
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            recipe = await next_done
+            if recipe is None:
+                skipped += 1
+                continue
+            yield recipe
+    finally:
+        # Consumer stopped early - don't leave fetches running
+        for task in tasks:
+            task.cancel()
+    
+    if skipped > 0 and verbose:
+        print(f"  Skipped {skipped} recipes due to errors")
 
 
 async def fetch_recipes_by_category(
@@ -91,6 +191,7 @@ async def fetch_recipes_by_category(
     category: str | None = None,
     limit: int | None = None,
     verbose: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> list[dict]:
     """Fetch recipes from Mealie, optionally filtered by category.
     
@@ -99,210 +200,353 @@ async def fetch_recipes_by_category(
         category: Category slug to filter by (e.g., "hellofresh"), empty string for all
         limit: Maximum number of recipes to fetch
         verbose: Print progress
+        concurrency: Maximum number of in-flight get_recipe calls
         
     Returns:
-        List of full recipe dicts
+        List of full recipe dicts, in search order
     """
-    # Search with category filter if provided (empty string means no filter)
-    categories = [category] if category else None
+    slugs = await _list_recipe_slugs(client, category, limit)
+    recipes = [
+        recipe async for recipe in hydrate_recipes(client, slugs, concurrency, verbose=verbose)
+    ]
     
-    # Fetch recipe summaries
-    summaries = await client.search_recipes(
-        query="",
-        categories=categories,
-        per_page=limit or 500,
-    )
+    # Restore search order so batches (and LLM cache keys) are stable across runs
+    order = {slug: i for i, slug in enumerate(slugs)}
+    recipes.sort(key=lambda r: order[r["slug"]])
     
-    if hasattr(summaries, "model_dump"):
-        # ErrorResponse
-        print(f"Error fetching recipes: {summaries}")
-        return []
+    return recipes
+
+
+async def _build_update_data(
+    update: dict,
+    update_type: str,
+    recipe_dict: dict,
+    organizers: OrganizerIndex | None = None,
+) -> dict:
+    """Build the PATCH payload for one QA update.
     
-    # Fetch full details for each recipe, skipping any that fail
-    recipes = []
-    skipped = 0
-    for summary in summaries:
-        slug = summary.slug if hasattr(summary, "slug") else summary.get("slug")
-        try:
-            recipe = await client.get_recipe(slug)
-            
-            # Check if it's an error response
-            if hasattr(recipe, "error") and recipe.error:
-                skipped += 1
-                if verbose:
-                    print(f"  Skipping {slug} (error loading)")
-                continue
-            
-            if not hasattr(recipe, "model_dump"):
-                skipped += 1
-                continue
-            
-            recipe_dict = recipe.model_dump(by_alias=True)
-            
-            # Double-check for error in dict
-            if recipe_dict.get("error"):
-                skipped += 1
-                if verbose:
-                    print(f"  Skipping {slug} (error in data)")
-                continue
+    Args:
+        update: Update dict from a QA phase
+        update_type: One of "nutrition", "measurements", "tags"
+        recipe_dict: Current state of the recipe
+        organizers: Tag/category index (required for tags update_type)
+        
+    Returns:
+        Fields to PATCH (empty if there is nothing to change)
+    """
+    update_data = {}
+    
+    if update_type == "nutrition":
+        if "nutrition" in update:
+            update_data["nutrition"] = update["nutrition"]
+    
+    elif update_type == "measurements":
+        # For measurements, reformat ALL ingredients uniformly like MCP tool
+        if "ingredients" in update:
+            current_ingredients = recipe_dict.get("recipeIngredient", [])
             
-            # IMPORTANT: Use the API slug (from summary) not the recipe's internal slug
-            # These can differ due to Mealie data inconsistencies
-            recipe_dict["slug"] = slug
+            # Create a map of index -> normalized text for ingredients we're updating
+            updates_map = {
+                ing_update.get("index"): ing_update.get("normalized")
+                for ing_update in update["ingredients"]
+                if ing_update.get("index") is not None
+            }
             
-            recipes.append(recipe_dict)
+            # Reformat ALL ingredients uniformly (critical for validation)
+            formatted_ingredients = []
+            for idx, ing in enumerate(current_ingredients):
+                # Use normalized text if we have an update, otherwise preserve display
+                display_text = updates_map.get(idx, ing.get("display", ing.get("note", "")))
+                
+                # Format exactly like MCP tool does
+                formatted_ing = {
+                    "referenceId": str(uuid.uuid4()),
+                    "display": display_text,
+                    "note": display_text,
+                }
+                formatted_ingredients.append(formatted_ing)
             
-        except Exception as e:
-            skipped += 1
-            if verbose:
-                print(f"  Skipping {slug} (exception: {e})")
-            continue
+            update_data["recipeIngredient"] = formatted_ingredients
     
-    if skipped > 0 and verbose:
-        print(f"  Skipped {skipped} recipes due to errors")
+    elif update_type == "tags":
+        if organizers is None:
+            raise ValueError("organizers required for tags update")
+        
+        if "tags" in update:
+            # Merge with existing tags; the index deduplicates and creates missing ones
+            existing_tag_names = [tag.get("name") or tag.get("slug", "")
+                                  for tag in recipe_dict.get("tags", [])]
+            tags = await organizers.resolve_tags(existing_tag_names + list(update["tags"]))
+            if isinstance(tags, ErrorResponse):
+                raise ValueError(f"Could not resolve tags: {tags.message}")
+            update_data["tags"] = organizer_payload(tags)
+        
+        if "categories" in update:
+            # Merge with existing categories the same way
+            existing_cat_names = [cat.get("name") or cat.get("slug", "")
+                                  for cat in recipe_dict.get("recipeCategory", [])]
+            categories = await organizers.resolve_categories(
+                existing_cat_names + list(update["categories"])
+            )
+            if isinstance(categories, ErrorResponse):
+                raise ValueError(f"Could not resolve categories: {categories.message}")
+            update_data["recipeCategory"] = organizer_payload(categories)
     
-    return recipes
+    return update_data
 
 
-async def apply_updates_to_mealie(
+async def find_modified_since_snapshot(
     client: MealieClient,
-    updates: list[dict],
-    update_type: str,
-    tag_cache: TagCategoryCache | None = None,
+    recipes_by_slug: dict[str, dict],
+    page_size: int = 500,
+) -> set[str]:
+    """Find snapshot recipes that were changed in Mealie after they were fetched.
+    
+    Issues one paginated queryFilter search for recipes updated after the
+    oldest snapshot timestamp, then compares each hit's dateUpdated with
+    the snapshot's.
+    
+    Args:
+        client: MealieClient instance
+        recipes_by_slug: Snapshot of recipe dicts keyed by slug
+        page_size: Results per search page
+        
+    Returns:
+        Slugs whose dateUpdated no longer matches the snapshot
+    """
+    stamps = {
+        slug: recipe.get("dateUpdated")
+        for slug, recipe in recipes_by_slug.items()
+        if recipe.get("dateUpdated")
+    }
+    if not stamps:
+        return set()
+    
+    oldest = min(stamps.values())
+    stale = set()
+    page = 1
+    
+    while True:
+        summaries = await client.search_recipes(
+            page=page,
+            per_page=page_size,
+            query_filter=f'dateUpdated > "{oldest}"',
+        )
+        if hasattr(summaries, "model_dump"):
+            # ErrorResponse - can't verify, so treat nothing as stale
+            print(f"Warning: could not check for concurrent edits: {summaries}")
+            return set()
+        
+        for summary in summaries:
+            if summary.slug in stamps and summary.date_updated != stamps[summary.slug]:
+                stale.add(summary.slug)
+        
+        if len(summaries) < page_size:
+            return stale
+        page += 1
+
+
+async def _current_date_updated(client: MealieClient, slug: str) -> str | None | ErrorResponse:
+    """Look up a recipe's dateUpdated in Mealie with a one-result summary search.
+    
+    Args:
+        client: MealieClient instance
+        slug: Recipe slug
+        
+    Returns:
+        Current dateUpdated, None if the recipe is gone, or the search error
+    """
+    summaries = await client.search_recipes(per_page=1, query_filter=f'slug = "{slug}"')
+    if isinstance(summaries, ErrorResponse):
+        return summaries
+    return summaries[0].date_updated if summaries else None
+
+
+def _log_outcome(outcomes_path: Path | None, outcome: dict) -> None:
+    """Append one per-recipe outcome to the JSONL results file."""
+    if outcomes_path is None:
+        return
+    with open(outcomes_path, "a") as f:
+        f.write(json.dumps({"timestamp": datetime.now().isoformat(), **outcome}) + "\n")
+
+
+async def apply_merged_updates(
+    client: MealieClient,
+    updates_by_phase: dict[str, list[dict]],
+    organizers: OrganizerIndex | None = None,
     dry_run: bool = False,
     verbose: bool = False,
+    recipes_by_slug: dict[str, dict] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    outcomes_path: Path | None = None,
+    fingerprints: FingerprintStore | None = None,
 ) -> dict:
-    """Apply QA updates to Mealie recipes.
+    """Merge QA updates from every phase and PATCH each recipe once.
+    
+    Changes for the same slug (nutrition, rewritten recipeIngredient,
+    merged tags/categories) are combined into a single payload built
+    against the in-memory snapshot in ``recipes_by_slug`` rather than
+    re-fetching each recipe. Recipes edited in Mealie since the snapshot
+    (by dateUpdated) are skipped as conflicts: one bulk search drops those
+    already stale, and each remaining recipe's dateUpdated is re-checked
+    right before its PATCH. Mealie has no conditional update, so an edit
+    landing between that re-check and the PATCH is still overwritten; the
+    window is one request round trip per recipe. Successful PATCH responses
+    replace their snapshot entry.
     
     Args:
         client: MealieClient instance
-        updates: List of update dicts from QA phases
-        update_type: One of "nutrition", "measurements", "tags"
-        tag_cache: Cache for tags/categories (required for tags update_type)
+        updates_by_phase: Phase name ("nutrition", "measurements", "tags")
+            -> list of update dicts from that phase
+        organizers: Tag/category index (required for tags updates)
         dry_run: If True, don't make actual updates
         verbose: Print progress
+        recipes_by_slug: Snapshot of full recipe dicts keyed by slug; recipes
+            missing from it are fetched
+        concurrency: Maximum number of concurrent PATCH requests
+        outcomes_path: JSONL file to append each recipe's outcome to
+        fingerprints: Store to mark successfully updated recipes in
         
     Returns:
-        Summary of updates applied
+        Summary of updates applied, counted per recipe
     """
-    success = 0
-    failed = 0
+    if recipes_by_slug is None:
+        recipes_by_slug = {}
+    
+    counts = {"success": 0, "failed": 0, "conflicts": 0}
     
-    for update in updates:
-        slug = update.get("slug") or update.get("recipe_slug")
-        if not slug:
-            failed += 1
-            continue
+    def record(slug: str | None, phases: list[str], status: str, **details: Any) -> None:
+        counts[OUTCOME_COUNTERS[status]] += 1
+        _log_outcome(outcomes_path, {"slug": slug, "phases": phases, "status": status, **details})
+    
+    # Group every phase's updates by recipe
+    updates_by_slug: dict[str, list[tuple[str, dict]]] = {}
+    for update_type, updates in updates_by_phase.items():
+        for update in updates:
+            slug = update.get("slug") or update.get("recipe_slug")
+            if not slug:
+                record(None, [update_type], "failed", error="missing slug")
+                continue
+            updates_by_slug.setdefault(slug, []).append((update_type, update))
+    
+    stale = set() if dry_run else await find_modified_since_snapshot(client, recipes_by_slug)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def apply_one(slug: str, recipe_updates: list[tuple[str, dict]]) -> None:
+        phases = sorted({update_type for update_type, _ in recipe_updates})
         
-        try:
-            update_data = {}
-            
-            if update_type == "nutrition":
-                if "nutrition" in update:
-                    update_data["nutrition"] = update["nutrition"]
-            
-            elif update_type == "measurements":
-                # For measurements, reformat ALL ingredients uniformly like MCP tool
-                if "ingredients" in update:
-                    import uuid
+        if slug in stale:
+            record(slug, phases, "conflict", error="modified in Mealie since fetched")
+            if verbose:
+                print(f"  ! Skipping {slug}: modified in Mealie since fetched")
+            return
+        
+        async with semaphore:
+            try:
+                recipe_dict = recipes_by_slug.get(slug)
+                if recipe_dict is None:
                     recipe = await client.get_recipe(slug)
-                    if hasattr(recipe, "model_dump"):
-                        recipe_dict = recipe.model_dump(by_alias=True)
-                        current_ingredients = recipe_dict.get("recipeIngredient", [])
-                        
-                        # Create a map of index -> normalized text for ingredients we're updating
-                        updates_map = {
-                            ing_update.get("index"): ing_update.get("normalized")
-                            for ing_update in update["ingredients"]
-                            if ing_update.get("index") is not None
-                        }
-                        
-                        # Reformat ALL ingredients uniformly (critical for validation)
-                        formatted_ingredients = []
-                        for idx, ing in enumerate(current_ingredients):
-                            # Use normalized text if we have an update, otherwise preserve display
-                            display_text = updates_map.get(idx, ing.get("display", ing.get("note", "")))
-                            
-                            # Format exactly like MCP tool does
-                            formatted_ing = {
-                                "referenceId": str(uuid.uuid4()),
-                                "display": display_text,
-                                "note": display_text,
-                            }
-                            formatted_ingredients.append(formatted_ing)
-                        
-                        update_data["recipeIngredient"] = formatted_ingredients
-            
-            elif update_type == "tags":
-                if tag_cache is None:
-                    raise ValueError("tag_cache required for tags update")
-                
-                # Fetch current recipe to get existing tags/categories
-                recipe = await client.get_recipe(slug)
-                if not hasattr(recipe, "model_dump"):
-                    failed += 1
-                    if verbose:
-                        print(f"  ✗ Failed to fetch {slug}")
-                    continue
-                
-                recipe_dict = recipe.model_dump(by_alias=True)
+                    if not hasattr(recipe, "model_dump"):
+                        record(slug, phases, "failed", error=f"fetch failed: {recipe}")
+                        if verbose:
+                            print(f"  ✗ Failed to fetch {slug}")
+                        return
+                    recipe_dict = recipe.model_dump(by_alias=True)
                 
-                if "tags" in update:
-                    # Merge with existing tags to avoid duplicates
-                    existing_tag_names = {tag.get("name") or tag.get("slug", "") 
-                                         for tag in recipe_dict.get("tags", [])}
-                    new_tag_names = set(update["tags"])
-                    
-                    # Combine and deduplicate
-                    all_tag_names = existing_tag_names | new_tag_names
-                    
-                    # Get or create each tag with full object including ID
-                    tag_objects = []
-                    for tag_name in all_tag_names:
-                        if tag_name:  # Skip empty strings
-                            tag_obj = await tag_cache.get_or_create_tag(client, tag_name)
-                            tag_objects.append(tag_obj)
-                    update_data["tags"] = tag_objects
+                # Phases write disjoint fields, so their payloads merge cleanly
+                update_data = {}
+                for update_type, update in recipe_updates:
+                    update_data.update(
+                        await _build_update_data(update, update_type, recipe_dict, organizers)
+                    )
+                if not update_data:
+                    if fingerprints is not None and not dry_run:
+                        fingerprints.record(recipe_dict, phases)
+                    return
                 
-                if "categories" in update:
-                    # Merge with existing categories to avoid duplicates
-                    existing_cat_names = {cat.get("name") or cat.get("slug", "") 
-                                         for cat in recipe_dict.get("recipeCategory", [])}
-                    new_cat_names = set(update["categories"])
-                    
-                    # Combine and deduplicate
-                    all_cat_names = existing_cat_names | new_cat_names
-                    
-                    # Get or create each category with full object including ID
-                    cat_objects = []
-                    for cat_name in all_cat_names:
-                        if cat_name:  # Skip empty strings
-                            cat_obj = await tag_cache.get_or_create_category(client, cat_name)
-                            cat_objects.append(cat_obj)
-                    update_data["recipeCategory"] = cat_objects
-            
-            if update_data:
                 if dry_run:
                     if verbose:
                         print(f"  [DRY RUN] Would update {slug}: {list(update_data.keys())}")
-                    success += 1
-                else:
-                    result = await client.update_recipe(slug, update_data)
-                    if hasattr(result, "slug"):
-                        success += 1
+                    record(slug, phases, "updated", fields=list(update_data.keys()), dry_run=True)
+                    return
+                
+                if slug in recipes_by_slug and recipe_dict.get("dateUpdated"):
+                    current = await _current_date_updated(client, slug)
+                    if isinstance(current, ErrorResponse):
+                        record(slug, phases, "failed", error=f"could not re-check: {current}")
                         if verbose:
-                            print(f"  ✓ Updated {slug}")
-                    else:
-                        failed += 1
+                            print(f"  ✗ Could not re-check {slug} before updating")
+                        return
+                    if current != recipe_dict["dateUpdated"]:
+                        record(slug, phases, "conflict", error="modified in Mealie since fetched")
                         if verbose:
-                            print(f"  ✗ Failed to update {slug}: {result}")
+                            print(f"  ! Skipping {slug}: modified in Mealie since fetched")
+                        return
+                
+                result = await client.update_recipe(slug, update_data)
+                if hasattr(result, "slug"):
+                    refreshed = result.model_dump(by_alias=True)
+                    refreshed["slug"] = slug
+                    recipes_by_slug[slug] = refreshed
+                    if fingerprints is not None:
+                        fingerprints.record(refreshed, phases)
+                    record(slug, phases, "updated", fields=list(update_data.keys()))
+                    if verbose:
+                        print(f"  ✓ Updated {slug} ({', '.join(phases)})")
+                else:
+                    record(slug, phases, "failed", error=str(result))
+                    if verbose:
+                        print(f"  ✗ Failed to update {slug}: {result}")
             
-        except Exception as e:
-            failed += 1
-            if verbose:
-                print(f"  ✗ Error updating {slug}: {e}")
+            except Exception as e:
+                record(slug, phases, "failed", error=str(e))
+                if verbose:
+                    print(f"  ✗ Error updating {slug}: {e}")
+    
+    await asyncio.gather(
+        *(apply_one(slug, recipe_updates) for slug, recipe_updates in updates_by_slug.items())
+    )
+    
+    return counts
+
+
+async def apply_updates_to_mealie(
+    client: MealieClient,
+    updates: list[dict],
+    update_type: str,
+    organizers: OrganizerIndex | None = None,
+    dry_run: bool = False,
+    verbose: bool = False,
+    recipes_by_slug: dict[str, dict] | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    outcomes_path: Path | None = None,
+) -> dict:
+    """Apply QA updates from a single phase to Mealie recipes.
     
-    return {"success": success, "failed": failed}
+    Args:
+        client: MealieClient instance
+        updates: List of update dicts from QA phases
+        update_type: One of "nutrition", "measurements", "tags"
+        organizers: Tag/category index (required for tags update_type)
+        dry_run: If True, don't make actual updates
+        verbose: Print progress
+        recipes_by_slug: Snapshot of full recipe dicts keyed by slug
+        concurrency: Maximum number of concurrent PATCH requests
+        outcomes_path: JSONL file to append each recipe's outcome to
+        
+    Returns:
+        Summary of updates applied
+    """
+    return await apply_merged_updates(
+        client,
+        {update_type: updates},
+        organizers=organizers,
+        dry_run=dry_run,
+        verbose=verbose,
+        recipes_by_slug=recipes_by_slug,
+        concurrency=concurrency,
+        outcomes_path=outcomes_path,
+    )
 
 
 async def run_qa_pipeline(
@@ -312,6 +556,9 @@ async def run_qa_pipeline(
     dry_run: bool = False,
     verbose: bool = True,
     output_dir: str | None = None,
+    use_batch_api: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    full: bool = False,
 ) -> dict:
     """Run the full QA pipeline or a specific phase.
     
@@ -322,6 +569,11 @@ async def run_qa_pipeline(
         dry_run: If True, don't make actual updates
         verbose: Print progress
         output_dir: Directory to save QA results (optional)
+        use_batch_api: Submit all phase prompts through the Message Batches
+            API and wait for them, instead of calling Claude interactively
+        concurrency: Maximum number of concurrent recipe fetches and updates
+        full: Process every recipe, ignoring stored fingerprints of recipes
+            that already passed a phase unchanged
         
     Returns:
         Summary of QA results
@@ -342,7 +594,9 @@ async def run_qa_pipeline(
         if verbose:
             print(f"\nFetching recipes (category: {category or 'all'})...")
         
-        recipes = await fetch_recipes_by_category(client, category, limit, verbose=verbose)
+        recipes = await fetch_recipes_by_category(
+            client, category, limit, verbose=verbose, concurrency=concurrency,
+        )
         
         if verbose:
             print(f"Fetched {len(recipes)} recipes")
@@ -355,113 +609,109 @@ async def run_qa_pipeline(
             "total_recipes": len(recipes),
             "phases": {},
         }
+        llm_usage.reset()
+        
+        # Updates are built against this snapshot instead of re-fetching
+        recipes_by_slug = {recipe["slug"]: recipe for recipe in recipes}
+        
+        # Per-recipe update outcomes are streamed here as they happen
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        outcomes_path = None
+        if output_dir:
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            outcomes_path = output_path / f"qa_updates_{timestamp}.jsonl"
+            results["updates_file"] = str(outcomes_path)
         
-        # Phase 1: Nutrition
-        if "nutrition" in phases:
+        # Shared tag/category index, loaded once for the whole run
+        organizers = OrganizerIndex(client)
+        if "tags" in phases and not dry_run:
             if verbose:
-                print("\n" + "=" * 50)
-                print("PHASE 1: Nutrition Calculation")
-                print("=" * 50)
-            
-            nutrition_results = await calculate_nutrition_for_recipes(
-                recipes,
-                dry_run=dry_run,
-                verbose=verbose,
-            )
-            
-            if nutrition_results and not dry_run:
-                update_summary = await apply_updates_to_mealie(
-                    client, nutrition_results, "nutrition",
-                    dry_run=dry_run, verbose=verbose,
-                )
-                results["phases"]["nutrition"] = {
-                    "calculated": len(nutrition_results),
-                    **update_summary,
-                }
-            else:
-                results["phases"]["nutrition"] = {
-                    "would_calculate": len(nutrition_results) if dry_run else 0,
-                }
-            
+                print("Loading existing tags and categories...")
+            error = await organizers.ensure_loaded()
+            if error is not None:
+                return {"error": f"Could not load tags/categories: {error.message}"}
             if verbose:
-                print(f"Nutrition: {results['phases']['nutrition']}")
+                print(f"  Found {len(organizers.tags)} tags, {len(organizers.categories)} categories")
         
-        # Phase 2: Measurements
-        if "measurements" in phases:
-            if verbose:
-                print("\n" + "=" * 50)
-                print("PHASE 2: Measurement Normalization")
-                print("=" * 50)
-            
-            measurement_results = await normalize_measurements_for_recipes(
-                recipes,
-                dry_run=dry_run,
-                verbose=verbose,
+        # Skip recipes whose inputs haven't changed since they passed a phase
+        fingerprints = FingerprintStore()
+        phase_inputs = {
+            p: recipes if full else [r for r in recipes if not fingerprints.is_current(r, p)]
+            for p in phases
+        }
+        
+        if verbose:
+            print("\n" + "=" * 50)
+            print(f"LLM PHASES: {', '.join(PHASE_LABELS[p] for p in phases)}")
+            print("=" * 50)
+            for p in phases:
+                unchanged = len(recipes) - len(phase_inputs[p])
+                print(f"  {p}: {len(phase_inputs[p])} to check, {unchanged} unchanged since last QA")
+        
+        if use_batch_api and not dry_run:
+            # In batch mode, every phase's LLM work is done in one Message Batch
+            phase_results = await run_phases_via_batch_api(
+                recipes, phases, verbose=verbose, recipes_by_phase=phase_inputs,
             )
-            
-            if measurement_results and not dry_run:
-                update_summary = await apply_updates_to_mealie(
-                    client, measurement_results, "measurements",
-                    dry_run=dry_run, verbose=verbose,
-                )
-                results["phases"]["measurements"] = {
-                    "normalized": len(measurement_results),
-                    **update_summary,
-                }
+        else:
+            # The phases are independent, so their LLM calls run concurrently
+            phase_outputs = await asyncio.gather(*(
+                PHASE_RUNNERS[p](phase_inputs[p], dry_run=dry_run, verbose=verbose)
+                for p in phases
+            ))
+            phase_results = dict(zip(phases, phase_outputs, strict=True))
+        
+        for p in phases:
+            done_key, would_key = PHASE_RESULT_KEYS[p]
+            if dry_run:
+                results["phases"][p] = {would_key: len(phase_results[p])}
             else:
-                results["phases"]["measurements"] = {
-                    "would_normalize": len(measurement_results) if dry_run else 0,
-                }
-            
+                results["phases"][p] = {done_key: len(phase_results[p])}
+            results["phases"][p]["skipped_unchanged"] = len(recipes) - len(phase_inputs[p])
             if verbose:
-                print(f"Measurements: {results['phases']['measurements']}")
+                print(f"{PHASE_LABELS[p]}: {results['phases'][p]}")
         
-        # Phase 3: Tagging
-        if "tags" in phases:
+        # Merge stage: one PATCH per recipe covering every phase's changes
+        if not dry_run and any(phase_results.values()):
             if verbose:
                 print("\n" + "=" * 50)
-                print("PHASE 3: Tagging & Categorization")
+                print("APPLYING UPDATES")
                 print("=" * 50)
             
-            # Initialize tag/category cache
-            tag_cache = TagCategoryCache()
-            if not dry_run:
-                if verbose:
-                    print("Loading existing tags and categories...")
-                await tag_cache.load(client)
-                if verbose:
-                    print(f"  Found {len(tag_cache.tags)} tags, {len(tag_cache.categories)} categories")
-            
-            tagging_results = await apply_tags_for_recipes(
-                recipes,
+            results["updates"] = await apply_merged_updates(
+                client,
+                phase_results,
+                organizers=organizers,
                 dry_run=dry_run,
                 verbose=verbose,
+                recipes_by_slug=recipes_by_slug,
+                concurrency=concurrency,
+                outcomes_path=outcomes_path,
+                fingerprints=fingerprints,
             )
-            
-            if tagging_results and not dry_run:
-                update_summary = await apply_updates_to_mealie(
-                    client, tagging_results, "tags",
-                    tag_cache=tag_cache,
-                    dry_run=dry_run, verbose=verbose,
-                )
-                results["phases"]["tags"] = {
-                    "tagged": len(tagging_results),
-                    **update_summary,
-                }
-            else:
-                results["phases"]["tags"] = {
-                    "would_tag": len(tagging_results) if dry_run else 0,
-                }
-            
             if verbose:
-                print(f"Tags: {results['phases']['tags']}")
+                print(f"Updates: {results['updates']}")
+        
+        if not dry_run:
+            # Recipes a phase checked and found nothing to do have passed it too
+            for p in phases:
+                changed = {u.get("slug") or u.get("recipe_slug") for u in phase_results[p]}
+                for recipe in phase_inputs[p]:
+                    current = recipes_by_slug[recipe["slug"]]
+                    if recipe["slug"] not in changed and not PHASE_NEEDS[p](current):
+                        fingerprints.record(current, [p])
+            fingerprints.save()
+        
+        # Token usage per phase, split by prompt-cache status
+        results["llm_usage"] = llm_usage.summary()
+        if verbose and results["llm_usage"]:
+            print("\nLLM usage:")
+            for phase, usage in results["llm_usage"].items():
+                print(f"  {phase}: {usage}")
         
         # Save results if output dir specified
         if output_dir:
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             result_file = output_path / f"qa_results_{timestamp}.json"
             
             with open(result_file, "w") as f:
@@ -494,13 +744,28 @@ if __name__ == "__main__":
     parser.add_argument("--dry-run", action="store_true",
                         help="Don't make actual updates")
     parser.add_argument("--output", help="Directory to save results")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="Always query Claude instead of reusing cached responses")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Run LLM phases offline via the Message Batches API")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-check every recipe, not just those changed since their last QA")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Concurrent recipe fetches and updates against Mealie")
     
     args = parser.parse_args()
     
+    if args.no_llm_cache:
+        from ..llm_cache import configure
+        configure(enabled=False)
+    
     asyncio.run(run_qa_pipeline(
         phase=args.phase,
         category=args.category,
         limit=args.limit,
         dry_run=args.dry_run,
         output_dir=args.output,
+        use_batch_api=args.batch_api,
+        concurrency=args.concurrency,
+        full=args.full,
     ))
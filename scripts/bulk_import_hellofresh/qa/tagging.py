@@ -1,11 +1,14 @@
 """Phase 3: Apply intelligent tags and categories to recipes."""
 
+import asyncio
 import json
 import os
 from typing import Any
 
 import anthropic
 
+from ..llm_cache import create_message_text
+
 # Model for tagging
 MODEL = "claude-haiku-4-5-20251001"
 MAX_TOKENS = 8192
@@ -48,16 +51,41 @@ VALID_CATEGORIES = {
 }
 
 
-def _build_tagging_prompt(recipes: list[dict]) -> str:
-    """Build prompt for tagging and categorization.
+
+def _organizer_names(organizers: list[dict]) -> set[str]:
+    """Normalise tag/category dicts to lowercase, hyphenated names."""
+    return {
+        (o.get("name") or o.get("slug") or "").strip().lower().replace(" ", "-")
+        for o in organizers
+    }
+
+
+def needs_tags(recipe: dict) -> bool:
+    """Check if a recipe is missing tags the tagging phase always assigns.
+    
+    Every tagged recipe gets a primary protein, an effort level and a meal
+    type; optional tags (cuisine, dietary, meal prep) don't count.
     
     Args:
-        recipes: List of recipe dicts to tag
+        recipe: Recipe dict from Mealie API
         
     Returns:
-        Formatted prompt string
+        True if any of the always-assigned tags or categories is missing
     """
-    prompt = """You are categorizing recipes for a meal planning system.
+    tags = _organizer_names(recipe.get("tags") or [])
+    categories = _organizer_names(recipe.get("recipeCategory") or [])
+    meal_types = {c.lower().replace(" ", "-") for c in VALID_CATEGORIES["meal_type"]}
+    
+    return (
+        not tags & set(VALID_TAGS["proteins"])
+        or not tags & set(VALID_TAGS["effort"])
+        or not categories & meal_types
+    )
+
+
+# Static instructions, sent as a cacheable system block so only the
+# per-batch recipe payload varies between requests
+TAGGING_INSTRUCTIONS = """You are categorizing recipes for a meal planning system.
 
 ## Categories (assign exactly 2 per recipe)
 
@@ -116,9 +144,19 @@ Return a JSON array using the EXACT recipe index number provided:
 
 IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modify slugs.
 
-## Recipes to Tag
+Return ONLY the JSON array, no other text."""
 
-"""
+
+def _build_tagging_prompt(recipes: list[dict]) -> str:
+    """Build the per-batch part of the tagging prompt.
+    
+    Args:
+        recipes: List of recipe dicts to tag
+        
+    Returns:
+        Formatted prompt string listing the recipes
+    """
+    prompt = "## Recipes to Tag\n\n"
     
     for i, recipe in enumerate(recipes, 1):
         prompt += f"\n### Recipe {i} (index={i}): {recipe.get('name', 'Unknown')}\n"
@@ -150,42 +188,39 @@ IMPORTANT: Use the recipe index number (1, 2, 3, etc.) - do NOT include or modif
     return prompt
 
 
-async def apply_tags_batch(
-    recipes: list[dict],
-    dry_run: bool = False,
-) -> list[dict]:
-    """Apply tags and categories to a batch of recipes.
+def _tagging_params(recipes: list[dict]) -> dict:
+    """Build Messages API parameters for a tagging batch.
     
     Args:
-        recipes: List of recipe dicts from Mealie
-        dry_run: If True, return what would be tagged without making changes
+        recipes: List of recipe dicts to tag
         
     Returns:
-        List of tagging results with slugs
+        Keyword arguments for messages.create
     """
-    if not recipes:
-        return []
-    
-    if dry_run:
-        return [{"slug": r.get("slug"), "would_tag": True} for r in recipes]
-    
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY environment variable required")
-    
-    client = anthropic.Anthropic(api_key=api_key)
-    
-    prompt = _build_tagging_prompt(recipes)
-    
-    response = client.messages.create(
-        model=MODEL,
-        max_tokens=MAX_TOKENS,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    
-    # Parse response
-    content = response.content[0].text
+    return {
+        "model": MODEL,
+        "max_tokens": MAX_TOKENS,
+        "system": [
+            {
+                "type": "text",
+                "text": TAGGING_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ],
+        "messages": [{"role": "user", "content": _build_tagging_prompt(recipes)}],
+    }
+
+
+def parse_tagging_response(content: str, recipes: list[dict]) -> list[dict]:
+    """Parse an LLM tagging response, validate tags and map results to slugs.
     
+    Args:
+        content: Raw response text
+        recipes: The recipe batch the prompt was built from
+        
+    Returns:
+        List of tagging results with slugs
+    """
     # Extract JSON from response
     if "```json" in content:
         content = content.split("```json")[1].split("```")[0]
@@ -223,6 +258,62 @@ async def apply_tags_batch(
     return valid_results
 
 
+def build_tagging_requests(recipes: list[dict], batch_size: int = 15) -> list[dict]:
+    """Build one tagging request per batch of recipes.
+    
+    Used by the Message Batches execution mode, which submits every request
+    up front instead of calling the model batch by batch.
+    
+    Args:
+        recipes: List of recipe dicts
+        batch_size: Number of recipes per request
+        
+    Returns:
+        List of dicts with "params" (messages.create kwargs) and "context"
+        (the recipe batch, passed back to parse_tagging_response)
+    """
+    return [
+        {
+            "params": _tagging_params(recipes[i:i + batch_size]),
+            "context": recipes[i:i + batch_size],
+        }
+        for i in range(0, len(recipes), batch_size)
+    ]
+
+
+async def apply_tags_batch(
+    recipes: list[dict],
+    dry_run: bool = False,
+) -> list[dict]:
+    """Apply tags and categories to a batch of recipes.
+    
+    Args:
+        recipes: List of recipe dicts from Mealie
+        dry_run: If True, return what would be tagged without making changes
+        
+    Returns:
+        List of tagging results with slugs
+    """
+    if not recipes:
+        return []
+    
+    if dry_run:
+        return [{"slug": r.get("slug"), "would_tag": True} for r in recipes]
+    
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable required")
+    
+    client = anthropic.Anthropic(api_key=api_key)
+    
+    # Run the blocking API call off the event loop so phases can overlap
+    content = await asyncio.to_thread(
+        create_message_text, client, phase="tags", **_tagging_params(recipes)
+    )
+    
+    return parse_tagging_response(content, recipes)
+
+
 async def apply_tags_for_recipes(
     recipes: list[dict],
     batch_size: int = 15,
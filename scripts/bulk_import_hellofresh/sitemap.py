@@ -3,6 +3,7 @@
 import json
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator, Iterable, Iterator
 from pathlib import Path
 
 import httpx
@@ -81,6 +82,108 @@ async def fetch_sitemap(country: str = "au", timeout: float = 60.0) -> str:
         return response.text
 
 
+def _recipe_from_url(url: str, lastmod: str | None) -> dict:
+    """Build a recipe dict from a sitemap <url> entry.
+
+    Args:
+        url: Recipe URL from <loc>
+        lastmod: Last modified date from <lastmod>, if present
+
+    Returns:
+        Dict with keys: url, name, slug, lastmod
+    """
+    # Extract slug from URL
+    slug_match = re.search(r"/recipes/(.+)$", url)
+    slug = slug_match.group(1) if slug_match else ""
+
+    return {
+        "url": url,
+        "name": extract_recipe_name_from_url(url),
+        "slug": slug,
+        "lastmod": lastmod,
+    }
+
+
+class SitemapStreamParser:
+    """Incremental sitemap parser that yields recipes as XML chunks arrive.
+
+    Wraps ``ET.XMLPullParser`` so the response body can be fed in as it
+    downloads. The sitemap namespace (http:// or https:// variant, depending
+    on region) is detected once from the root element, and each <url>
+    element is cleared after it has been read so memory stays bounded
+    regardless of sitemap size.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: ET.Element | None = None
+        self._url_tag = "url"
+        self._loc_tag = "loc"
+        self._lastmod_tag = "lastmod"
+
+    def _detect_namespace(self, root: ET.Element) -> None:
+        """Derive the element tag names from the root element's namespace."""
+        if root.tag.startswith("{"):
+            ns = root.tag[1:].split("}", 1)[0]
+            self._url_tag = f"{{{ns}}}url"
+            self._loc_tag = f"{{{ns}}}loc"
+            self._lastmod_tag = f"{{{ns}}}lastmod"
+
+    def feed(self, chunk: str | bytes) -> Iterator[dict]:
+        """Feed a chunk of XML and yield any recipes it completes.
+
+        Args:
+            chunk: Next piece of the sitemap body
+
+        Yields:
+            Recipe dicts with keys: url, name, slug, lastmod
+        """
+        self._parser.feed(chunk)
+        yield from self._drain()
+
+    def close(self) -> Iterator[dict]:
+        """Signal end of input and yield any remaining recipes."""
+        self._parser.close()
+        yield from self._drain()
+
+    def _drain(self) -> Iterator[dict]:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                    self._detect_namespace(elem)
+                continue
+
+            if elem.tag != self._url_tag:
+                continue
+
+            loc = elem.findtext(self._loc_tag)
+            lastmod = elem.findtext(self._lastmod_tag)
+
+            # Release the processed entry (and its detached children)
+            elem.clear()
+            if self._root is not None:
+                self._root.clear()
+
+            if loc:
+                yield _recipe_from_url(loc, lastmod)
+
+
+def iter_parse_sitemap(chunks: Iterable[str | bytes]) -> Iterator[dict]:
+    """Parse sitemap XML incrementally from an iterable of chunks.
+
+    Args:
+        chunks: Pieces of the raw sitemap XML, in order
+
+    Yields:
+        Recipe dicts with keys: url, name, slug, lastmod
+    """
+    parser = SitemapStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
 def parse_sitemap(xml_content: str) -> list[dict]:
     """Parse sitemap XML and extract recipe information.
 
@@ -90,39 +193,42 @@ def parse_sitemap(xml_content: str) -> list[dict]:
     Returns:
         List of dicts with keys: url, name, slug, lastmod
     """
-    root = ET.fromstring(xml_content)
-
-    # Sitemap namespace - try both http and https variants
-    # Some regions use http://, others use https://
-    namespaces = [
-        {"s": "https://www.sitemaps.org/schemas/sitemap/0.9"},
-        {"s": "http://www.sitemaps.org/schemas/sitemap/0.9"},
-    ]
-
-    recipes = []
-    for ns in namespaces:
-        for url_elem in root.findall("s:url", ns):
-            loc_elem = url_elem.find("s:loc", ns)
-            lastmod_elem = url_elem.find("s:lastmod", ns)
-
-            if loc_elem is None or loc_elem.text is None:
-                continue
+    return list(iter_parse_sitemap([xml_content]))
 
-            url = loc_elem.text
-            lastmod = lastmod_elem.text if lastmod_elem is not None else None
 
-            # Extract slug from URL
-            slug_match = re.search(r"/recipes/(.+)$", url)
-            slug = slug_match.group(1) if slug_match else ""
+async def stream_sitemap(country: str = "au", timeout: float = 60.0) -> AsyncIterator[dict]:
+    """Download and parse a HelloFresh sitemap as a stream.
 
-            recipes.append({
-                "url": url,
-                "name": extract_recipe_name_from_url(url),
-                "slug": slug,
-                "lastmod": lastmod,
-            })
+    Recipes are yielded as soon as their <url> entry has been received, so
+    parsing overlaps the download and the full document is never held in
+    memory.
 
-    return recipes
+    Args:
+        country: Country code (au, uk, us, de, nz)
+        timeout: Request timeout in seconds
+
+    Yields:
+        Recipe dicts with keys: url, name, slug, lastmod
+
+    Raises:
+        ValueError: If country code is not supported
+        httpx.HTTPError: On network errors
+    """
+    if country not in SITEMAP_URLS:
+        raise ValueError(f"Unsupported country: {country}. Supported: {list(SITEMAP_URLS.keys())}")
+
+    url = SITEMAP_URLS[country]
+    parser = SitemapStreamParser()
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                for recipe in parser.feed(chunk):
+                    yield recipe
+
+    for recipe in parser.close():
+        yield recipe
 
 
 async def fetch_and_parse_sitemap(
@@ -151,9 +257,8 @@ async def fetch_and_parse_sitemap(
             with open(cache_file) as f:
                 return json.load(f)
 
-    # Fetch fresh data
-    xml_content = await fetch_sitemap(country)
-    recipes = parse_sitemap(xml_content)
+    # Fetch fresh data, parsing as the body streams in
+    recipes = [recipe async for recipe in stream_sitemap(country)]
 
     # Save to cache
     if use_cache:
@@ -1,12 +1,16 @@
 """Async HTTP client wrapper for Mealie API."""
 
+import asyncio
 import base64
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 import httpx
 
+from mealie_mcp.metrics import endpoint_template, record_mealie_request
 from mealie_mcp.models import (
     Category,
     ErrorResponse,
@@ -22,8 +26,117 @@ from mealie_mcp.models import (
     TimelineEventCreate,
     TimelineEventType,
 )
+from mealie_mcp.resilience import (
+    RETRYABLE_STATUS,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
+from mealie_mcp.tracing import annotate, span, traced, validate, validate_many
+
+# Maximum concurrent recipe fetches when resolving several uncached refs
+REF_FETCH_CONCURRENCY = 8
+
+
+class RecipeRef(NamedTuple):
+    """Identity of a recipe: enough to address it without fetching it."""
+
+    id: str
+    slug: str
+    name: str
+
+
+class RecipeRefCache:
+    """Bounded LRU map between recipe slugs and IDs.
+
+    Filled from every recipe the client sees (search results, full
+    recipes, meal plan entries) so tools that only need a recipe's UUID
+    can skip fetching the whole recipe.
+    """
+
+    def __init__(self, max_size: int = 2048):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of recipes remembered
+        """
+        self.max_size = max_size
+        self._by_id: OrderedDict[str, RecipeRef] = OrderedDict()
+        self._slug_to_id: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def put(self, recipe: Any) -> None:
+        """Remember a recipe's id/slug/name.
+
+        Args:
+            recipe: Any object with id, slug and name attributes
+        """
+        recipe_id = getattr(recipe, "id", None)
+        slug = getattr(recipe, "slug", None)
+        if not recipe_id or not slug:
+            return
+
+        previous = self._by_id.pop(recipe_id, None)
+        if previous is not None and previous.slug != slug:
+            # Renamed - drop the stale slug
+            self._slug_to_id.pop(previous.slug, None)
+
+        self._by_id[recipe_id] = RecipeRef(recipe_id, slug, getattr(recipe, "name", slug))
+        self._slug_to_id[slug] = recipe_id
+
+        while len(self._by_id) > self.max_size:
+            _, evicted = self._by_id.popitem(last=False)
+            if self._slug_to_id.get(evicted.slug) == evicted.id:
+                del self._slug_to_id[evicted.slug]
+
+    def get(self, slug_or_id: str) -> RecipeRef | None:
+        """Look up a recipe by slug or ID.
+
+        Args:
+            slug_or_id: Recipe slug or UUID
+
+        Returns:
+            Cached reference, or None on a miss
+        """
+        recipe_id = self._slug_to_id.get(slug_or_id, slug_or_id)
+        ref = self._by_id.get(recipe_id)
+        if ref is not None:
+            self._by_id.move_to_end(recipe_id)
+        return ref
+
+    def discard(self, slug_or_id: str) -> None:
+        """Forget a recipe (e.g. after deleting it).
+
+        Args:
+            slug_or_id: Recipe slug or UUID
+        """
+        recipe_id = self._slug_to_id.pop(slug_or_id, slug_or_id)
+        ref = self._by_id.pop(recipe_id, None)
+        if ref is not None:
+            self._slug_to_id.pop(ref.slug, None)
+
+
+class RecipeChanges(NamedTuple):
+    """Recipes that changed in Mealie since a previous listing."""
+
+    updated: list[Recipe]  # fetched in full
+    removed: list[str]  # IDs no longer listed (full listings only)
+    high_water: str | None  # newest dateUpdated covered by this listing
+
 
+class _Attempt(NamedTuple):
+    """Outcome of a single HTTP attempt."""
 
+    result: dict[str, Any] | list[Any] | ErrorResponse
+    transient: bool = False  # worth retrying
+    sent: bool = True  # False if the request never reached Mealie
+    failed: bool = False  # counts against the circuit breaker
+    retry_after: float | None = None  # server-requested delay in seconds
+
+
+@traced
 class MealieClient:
     """Async client for interacting with the Mealie API."""
 
@@ -32,6 +145,10 @@ class MealieClient:
         base_url: str | None = None,
         token: str | None = None,
         timeout: float = 30.0,
+        coalesce: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize the Mealie client.
 
@@ -39,12 +156,26 @@ class MealieClient:
             base_url: Mealie API base URL (e.g., http://mealie:9000/api)
             token: Mealie API bearer token
             timeout: Request timeout in seconds
+            coalesce: Share one in-flight request between identical concurrent GETs
+            retry_policy: Retries for transient failures (default from MEALIE_RETRIES etc.)
+            circuit_breaker: Fail-fast policy while Mealie is down
+                (default from MEALIE_BREAKER_THRESHOLD/MEALIE_BREAKER_RESET)
+            transport: httpx transport override (e.g. an ASGI fake Mealie for benchmarks)
         """
         self.base_url = base_url or os.getenv("MEALIE_URL", "http://localhost:9000/api")
         self.token = token or os.getenv("MEALIE_TOKEN", "")
         self.timeout = timeout
+        self.transport = transport
         self._client: httpx.AsyncClient | None = None
         self._group_id: str | None = None  # Cache the user's group ID
+        self.recipe_refs = RecipeRefCache()  # slug <-> ID for recipes seen so far
+        self.coalesce = coalesce
+        # In-flight GETs by (method, endpoint, params), shared by identical callers
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._request_counts = {"requests": 0, "sent": 0, "coalesced": 0}
+        self.retry_policy = retry_policy or RetryPolicy.from_env()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker.from_env()
+        self._resilience_counts = {"retries": 0, "short_circuited": 0}
 
     @property
     def headers(self) -> dict[str, str]:
@@ -62,11 +193,15 @@ class MealieClient:
                 base_url=self.base_url,
                 headers=self.headers,
                 timeout=self.timeout,
+                transport=self.transport,
             )
         return self._client
 
     async def get_group_id(self) -> str | None:
-        """Get the current user's group ID (cached after first call)."""
+        """Get the current user's group ID (cached after first call).
+
+        Concurrent calls on a cold cache share one /users/self request.
+        """
         if self._group_id is not None:
             return self._group_id
 
@@ -77,12 +212,42 @@ class MealieClient:
 
         return None
 
+    async def about(self) -> dict[str, Any] | ErrorResponse:
+        """Get Mealie's version and settings; a cheap check that Mealie is up.
+
+        Returns:
+            App info dict, or error
+        """
+        result = await self._request("GET", "/app/about")
+        if isinstance(result, ErrorResponse):
+            return result
+        return result if isinstance(result, dict) else {}
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
             await self._client.aclose()
             self._client = None
 
+    def coalescing_stats(self) -> dict[str, Any]:
+        """Report how many requests were served by another caller's in-flight GET.
+
+        Returns:
+            Dict with total requests, requests actually sent, requests
+            coalesced, the coalesced ratio and GETs currently in flight
+        """
+        counts = self._request_counts
+        ratio = counts["coalesced"] / counts["requests"] if counts["requests"] else 0.0
+        return {**counts, "coalesced_ratio": round(ratio, 3), "in_flight": len(self._inflight)}
+
+    def resilience_stats(self) -> dict[str, Any]:
+        """Report retries, fast failures and the circuit breaker's state.
+
+        Returns:
+            Dict with retry and short-circuit counts plus the breaker's stats
+        """
+        return {**self._resilience_counts, "circuit": self.circuit_breaker.stats()}
+
     async def _request(
         self,
         method: str,
@@ -92,6 +257,10 @@ class MealieClient:
     ) -> dict[str, Any] | list[Any] | ErrorResponse:
         """Make an HTTP request to the Mealie API.
 
+        Identical concurrent GETs (same endpoint and params) are coalesced:
+        the first caller sends the request and the others await its result.
+        The parsed JSON is shared between them, so callers must not mutate it.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
@@ -101,7 +270,89 @@ class MealieClient:
         Returns:
             Parsed JSON response or ErrorResponse on failure
         """
+        self._request_counts["requests"] += 1
+        if method.upper() != "GET" or not self.coalesce:
+            self._request_counts["sent"] += 1
+            return await self._send(method, endpoint, params, json)
+
+        key = (endpoint, tuple(sorted((k, repr(v)) for k, v in (params or {}).items())))
+        task = self._inflight.get(key)
+        if task is not None:
+            self._request_counts["coalesced"] += 1
+        else:
+            self._request_counts["sent"] += 1
+            task = asyncio.ensure_future(self._send(method, endpoint, params, json))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | list[Any] | ErrorResponse:
+        """Send a request, retrying transient failures per the retry policy."""
+        attempt = 0
+        outcome: _Attempt | None = None
+        while True:
+            if not self.circuit_breaker.allow():
+                if outcome is not None:
+                    # Circuit opened during our own retries: report the real error
+                    return outcome.result
+                self._resilience_counts["short_circuited"] += 1
+                return ErrorResponse.api_error(
+                    "Mealie is unavailable (circuit open); "
+                    f"retrying in {self.circuit_breaker.retry_in():.0f}s"
+                )
+
+            probe = self.circuit_breaker.probing
+            with span(
+                f"HTTP {method} {endpoint_template(endpoint)}",
+                **{
+                    "http.request.method": method,
+                    "url.path": endpoint,
+                    "http.resend_count": attempt or None,
+                },
+            ) as http_span:
+                try:
+                    outcome = await self._attempt(method, endpoint, params, json, http_span)
+                except BaseException:
+                    # Cancelled mid-probe: free the slot or the circuit never recovers
+                    if probe:
+                        self.circuit_breaker.release_probe()
+                    raise
+            if outcome.failed:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            if not outcome.transient or not self.retry_policy.should_retry(
+                method, attempt, outcome.sent
+            ):
+                return outcome.result
+
+            delay = self.retry_policy.delay(attempt, outcome.retry_after)
+            if delay is None:
+                return outcome.result
+            self._resilience_counts["retries"] += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _attempt(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        http_span: Any = None,
+    ) -> "_Attempt":
+        """Send one HTTP request, record its metrics and map failures to ErrorResponse."""
         client = await self._get_client()
+        start = time.perf_counter()
+        status = "error"
+        size = None
 
         try:
             response = await client.request(
@@ -110,28 +361,56 @@ class MealieClient:
                 params=params,
                 json=json,
             )
+            status = str(response.status_code)
+            size = len(response.content)
 
             if response.status_code == 401:
-                return ErrorResponse.auth_error("Invalid or expired Mealie API token")
+                return _Attempt(ErrorResponse.auth_error("Invalid or expired Mealie API token"))
 
             if response.status_code == 404:
-                return ErrorResponse.not_found("Resource", endpoint)
+                return _Attempt(ErrorResponse.not_found("Resource", endpoint))
 
             response.raise_for_status()
 
             if response.status_code == 204:
-                return {"success": True}
+                return _Attempt({"success": True})
 
-            return response.json()
+            return _Attempt(response.json())
 
         except httpx.ConnectError:
-            return ErrorResponse.api_error(f"Cannot connect to Mealie at {self.base_url}")
+            status = "connect_error"
+            return _Attempt(
+                ErrorResponse.api_error(f"Cannot connect to Mealie at {self.base_url}"),
+                transient=True,
+                sent=False,
+                failed=True,
+            )
         except httpx.TimeoutException:
-            return ErrorResponse.api_error("Request to Mealie timed out")
+            status = "timeout"
+            return _Attempt(
+                ErrorResponse.api_error("Request to Mealie timed out"), transient=True, failed=True
+            )
         except httpx.HTTPStatusError as e:
-            return ErrorResponse.api_error(f"HTTP {e.response.status_code}: {e.response.text}")
+            status = e.response.status_code
+            return _Attempt(
+                ErrorResponse.api_error(f"HTTP {status}: {e.response.text}"),
+                transient=status in RETRYABLE_STATUS,
+                # Throttling means Mealie is up; only server errors trip the breaker
+                failed=status >= 500,
+                retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+            )
         except Exception as e:
-            return ErrorResponse.api_error(f"Unexpected error: {str(e)}")
+            return _Attempt(ErrorResponse.api_error(f"Unexpected error: {str(e)}"))
+        finally:
+            record_mealie_request(method, endpoint, status, time.perf_counter() - start)
+            annotate(
+                http_span,
+                **{
+                    "http.response.status_code": int(status) if str(status).isdigit() else None,
+                    "http.response.body.size": size,
+                    "error.type": None if str(status).isdigit() else status,
+                },
+            )
 
     # Recipe Methods
     async def search_recipes(
@@ -141,6 +420,7 @@ class MealieClient:
         categories: list[str] | None = None,
         page: int = 1,
         per_page: int = 20,
+        query_filter: str | None = None,
     ) -> list[RecipeSummary] | ErrorResponse:
         """Search recipes with optional filters.
 
@@ -150,6 +430,8 @@ class MealieClient:
             categories: Filter by category slugs
             page: Page number (1-indexed)
             per_page: Results per page
+            query_filter: Mealie queryFilter expression
+                (e.g. 'dateUpdated > "2024-01-01T00:00:00"')
 
         Returns:
             List of recipe summaries or error
@@ -165,6 +447,8 @@ class MealieClient:
             params["tags"] = tags
         if categories:
             params["categories"] = categories
+        if query_filter:
+            params["queryFilter"] = query_filter
 
         result = await self._request("GET", "/recipes", params=params)
 
@@ -172,10 +456,13 @@ class MealieClient:
             return result
 
         # Handle paginated response
-        if isinstance(result, dict) and "items" in result:
-            return [RecipeSummary.model_validate(r) for r in result["items"]]
+        items = result["items"] if isinstance(result, dict) and "items" in result else result
+        summaries = validate_many(RecipeSummary, items)
 
-        return [RecipeSummary.model_validate(r) for r in result]
+        for summary in summaries:
+            self.recipe_refs.put(summary)
+
+        return summaries
 
     async def get_recipe(self, slug: str) -> Recipe | ErrorResponse:
         """Get full recipe details by slug.
@@ -190,67 +477,186 @@ class MealieClient:
 
         if isinstance(result, ErrorResponse):
             if result.code == "NOT_FOUND":
+                self.recipe_refs.discard(slug)
                 return ErrorResponse.not_found("Recipe", slug)
             return result
 
-        return Recipe.model_validate(result)
+        recipe = validate(Recipe, result)
+        self.recipe_refs.put(recipe)
+        return recipe
+
+    async def resolve_recipe_ref(self, slug_or_id: str) -> RecipeRef | ErrorResponse:
+        """Get a recipe's ID, slug and name, fetching it only on a cache miss.
 
-    async def list_tags(self) -> list[Tag] | ErrorResponse:
+        Args:
+            slug_or_id: Recipe slug or UUID
+
+        Returns:
+            Recipe reference or error
+        """
+        ref = self.recipe_refs.get(slug_or_id)
+        if ref is not None:
+            return ref
+
+        recipe = await self.get_recipe(slug_or_id)
+        if isinstance(recipe, ErrorResponse):
+            return recipe
+
+        return RecipeRef(recipe.id, recipe.slug, recipe.name)
+
+    async def resolve_recipe_refs(
+        self, slugs_or_ids: list[str]
+    ) -> dict[str, RecipeRef | ErrorResponse]:
+        """Resolve many recipes at once.
+
+        Cache hits are free. Misses are fetched individually, at most
+        REF_FETCH_CONCURRENCY at a time, which also warms the cache for
+        later calls.
+
+        Args:
+            slugs_or_ids: Recipe slugs or UUIDs
+
+        Returns:
+            Each requested slug/ID -> recipe reference or error
+        """
+        resolved: dict[str, RecipeRef | ErrorResponse] = {}
+        missing = []
+        for key in dict.fromkeys(slugs_or_ids):
+            ref = self.recipe_refs.get(key)
+            if ref is not None:
+                resolved[key] = ref
+            else:
+                missing.append(key)
+
+        semaphore = asyncio.Semaphore(REF_FETCH_CONCURRENCY)
+
+        async def fetch(key: str) -> RecipeRef | ErrorResponse:
+            async with semaphore:
+                return await self.resolve_recipe_ref(key)
+
+        refs = await asyncio.gather(*(fetch(key) for key in missing))
+        resolved.update(zip(missing, refs, strict=True))
+        return resolved
+
+    async def list_tags(self, per_page: int | None = None) -> list[Tag] | ErrorResponse:
         """Get all available tags.
 
+        Args:
+            per_page: Page size (-1 for every tag); Mealie's default if omitted
+
         Returns:
             List of tags or error
         """
-        result = await self._request("GET", "/organizers/tags")
+        params = {"perPage": per_page} if per_page is not None else None
+        result = await self._request("GET", "/organizers/tags", params=params)
 
         if isinstance(result, ErrorResponse):
             return result
 
         # Handle paginated response
         items = result.get("items", result) if isinstance(result, dict) else result
-        return [Tag.model_validate(t) for t in items]
+        return validate_many(Tag, items)
 
-    async def list_categories(self) -> list[Category] | ErrorResponse:
+    async def list_categories(self, per_page: int | None = None) -> list[Category] | ErrorResponse:
         """Get all available categories.
 
+        Args:
+            per_page: Page size (-1 for every category); Mealie's default if omitted
+
         Returns:
             List of categories or error
         """
-        result = await self._request("GET", "/organizers/categories")
+        params = {"perPage": per_page} if per_page is not None else None
+        result = await self._request("GET", "/organizers/categories", params=params)
 
         if isinstance(result, ErrorResponse):
             return result
 
         # Handle paginated response
         items = result.get("items", result) if isinstance(result, dict) else result
-        return [Category.model_validate(c) for c in items]
+        return validate_many(Category, items)
+
+    async def create_tag(self, name: str) -> Tag | ErrorResponse:
+        """Create a tag.
+
+        Args:
+            name: Tag name
+
+        Returns:
+            Created tag or error
+        """
+        result = await self._request("POST", "/organizers/tags", json={"name": name})
+
+        if isinstance(result, ErrorResponse):
+            return result
+
+        return validate(Tag, result)
+
+    async def create_category(self, name: str) -> Category | ErrorResponse:
+        """Create a category.
+
+        Args:
+            name: Category name
+
+        Returns:
+            Created category or error
+        """
+        result = await self._request("POST", "/organizers/categories", json={"name": name})
+
+        if isinstance(result, ErrorResponse):
+            return result
+
+        return validate(Category, result)
 
     # Meal Plan Methods
     async def get_meal_plan(
-        self, start_date: str, end_date: str
+        self,
+        start_date: str,
+        end_date: str,
+        query_filter: str | None = None,
+        page_size: int = 100,
     ) -> list[MealPlanEntry] | ErrorResponse:
-        """Get meal plans for a date range.
+        """Get meal plans for a date range, following every page.
 
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
+            query_filter: Mealie queryFilter expression
+                (e.g. 'updateAt > "2024-01-01T00:00:00"')
+            page_size: Entries per request
 
         Returns:
             List of meal plan entries or error
         """
-        params = {
+        params: dict[str, Any] = {
             "start_date": start_date,
             "end_date": end_date,
+            "page": 1,
+            "perPage": page_size,
         }
-
-        result = await self._request("GET", "/households/mealplans", params=params)
-
-        if isinstance(result, ErrorResponse):
-            return result
-
-        # Handle paginated response
-        items = result.get("items", result) if isinstance(result, dict) else result
-        return [MealPlanEntry.model_validate(e) for e in items]
+        if query_filter:
+            params["queryFilter"] = query_filter
+
+        entries: list[MealPlanEntry] = []
+        while True:
+            result = await self._request("GET", "/households/mealplans", params=dict(params))
+            if isinstance(result, ErrorResponse):
+                return result
+
+            # Handle paginated response
+            items = result.get("items", []) if isinstance(result, dict) else result
+            entries.extend(validate_many(MealPlanEntry, items))
+            if not isinstance(result, dict) or len(items) < page_size:
+                break
+            if params["page"] >= (result.get("totalPages") or params["page"] + 1):
+                break
+            params["page"] += 1
+
+        for entry in entries:
+            if entry.recipe is not None:
+                self.recipe_refs.put(entry.recipe)
+
+        return entries
 
     async def create_meal_plan_entry(
         self, date: str, recipe_id: str, entry_type: str = "dinner"
@@ -267,10 +673,10 @@ class MealieClient:
         """
         # If recipe_id looks like a slug (not a UUID), look up the UUID
         if not self._is_uuid(recipe_id):
-            recipe = await self.get_recipe(recipe_id)
-            if isinstance(recipe, ErrorResponse):
-                return recipe
-            recipe_id = recipe.id
+            ref = await self.resolve_recipe_ref(recipe_id)
+            if isinstance(ref, ErrorResponse):
+                return ref
+            recipe_id = ref.id
 
         body = {
             "date": date,
@@ -283,7 +689,10 @@ class MealieClient:
         if isinstance(result, ErrorResponse):
             return result
 
-        return MealPlanEntry.model_validate(result)
+        entry = validate(MealPlanEntry, result)
+        if entry.recipe is not None:
+            self.recipe_refs.put(entry.recipe)
+        return entry
     
     def _is_uuid(self, value: str) -> bool:
         """Check if a string is a valid UUID."""
@@ -326,7 +735,7 @@ class MealieClient:
 
         # Handle paginated response
         items = result.get("items", result) if isinstance(result, dict) else result
-        return [ShoppingListSummary.model_validate(s) for s in items]
+        return validate_many(ShoppingListSummary, items)
 
     async def get_shopping_list(self, list_id: str) -> ShoppingList | ErrorResponse:
         """Get a specific shopping list with items.
@@ -344,7 +753,7 @@ class MealieClient:
                 return ErrorResponse.not_found("Shopping list", list_id)
             return result
 
-        return ShoppingList.model_validate(result)
+        return validate(ShoppingList, result)
 
     async def add_shopping_list_item(
         self, list_id: str, note: str, quantity: float = 1
@@ -372,7 +781,32 @@ class MealieClient:
         if isinstance(result, ErrorResponse):
             return result
 
-        return ShoppingListItem.model_validate(result)
+        return validate(ShoppingListItem, result)
+
+    async def add_shopping_list_items(
+        self, list_id: str, notes: list[str]
+    ) -> list[ShoppingListItem] | ErrorResponse:
+        """Add several items to a shopping list in one request.
+
+        Args:
+            list_id: Shopping list ID
+            notes: Item descriptions
+
+        Returns:
+            Created (or merged) items, or error
+        """
+        body = [
+            {"shoppingListId": list_id, "note": note, "quantity": 1, "checked": False}
+            for note in notes
+        ]
+
+        result = await self._request("POST", "/households/shopping/items/create-bulk", json=body)
+
+        if isinstance(result, ErrorResponse):
+            return result
+
+        items = result.get("createdItems", []) + result.get("updatedItems", [])
+        return validate_many(ShoppingListItem, items)
 
     async def delete_shopping_list_item(
         self, list_id: str, item_id: str
@@ -445,6 +879,9 @@ class MealieClient:
 
         # API returns the slug as a string
         if isinstance(result, str):
+            # Only the slug comes back; fetching the recipe seeds the ref cache
+            # with its ID so the first meal plan entry for it needs no lookup
+            await self.get_recipe(result)
             return result
 
         return ErrorResponse.api_error("Unexpected response format from create recipe")
@@ -464,7 +901,9 @@ class MealieClient:
         if isinstance(result, ErrorResponse):
             return result
 
-        return Recipe.model_validate(result)
+        recipe = validate(Recipe, result)
+        self.recipe_refs.put(recipe)
+        return recipe
 
     async def delete_recipe(self, slug: str) -> dict[str, Any] | ErrorResponse:
         """Delete a recipe.
@@ -480,6 +919,8 @@ class MealieClient:
         if isinstance(result, ErrorResponse):
             return result
 
+        self.recipe_refs.discard(slug)
+
         return {"success": True, "message": f"Recipe '{slug}' deleted"}
 
     async def import_recipe_from_url(
@@ -573,7 +1014,7 @@ class MealieClient:
         if isinstance(result, ErrorResponse):
             return result
 
-        return TimelineEvent.model_validate(result)
+        return validate(TimelineEvent, result)
 
     async def get_recipe_timeline(
         self, recipe_id: str, page: int = 1, per_page: int = 20
@@ -601,7 +1042,7 @@ class MealieClient:
 
         # Handle paginated response
         items = result.get("items", result) if isinstance(result, dict) else result
-        return [TimelineEvent.model_validate(e) for e in items]
+        return validate_many(TimelineEvent, items)
 
     async def upload_recipe_image(
         self, slug: str, image_data: bytes, extension: str = "jpg"
@@ -669,6 +1110,77 @@ class MealieClient:
         return await self.upload_recipe_image(slug, image_bytes, extension)
 
 
+async def fetch_recipe_changes(
+    client: MealieClient,
+    known: dict[str, str | None],
+    high_water: str | None = None,
+    full: bool = False,
+    page_size: int = 200,
+    concurrency: int = 8,
+) -> RecipeChanges | ErrorResponse:
+    """List recipes changed since a high-water mark and fetch them in full.
+
+    This is the one incremental recipe feed: the sync engine, the search
+    index and the nutrition store each keep their own ``known`` map and
+    mark and call it to catch up.
+
+    Args:
+        client: MealieClient instance
+        known: Recipe ID -> dateUpdated of the recipes the caller already has
+        high_water: Only list recipes with a newer dateUpdated (ignored if full)
+        full: List every recipe, reporting known ones that no longer exist
+        page_size: Recipes per search page
+        concurrency: Maximum number of concurrent recipe fetches
+
+    Returns:
+        Fetched recipes, removed IDs and the new high-water mark, or error
+    """
+    query_filter = None
+    if high_water and not full:
+        query_filter = f'dateUpdated > "{high_water}"'
+
+    summaries: list[RecipeSummary] = []
+    page = 1
+    while True:
+        batch = await client.search_recipes(page=page, per_page=page_size, query_filter=query_filter)
+        if isinstance(batch, ErrorResponse):
+            return batch
+        summaries.extend(batch)
+        if len(batch) < page_size:
+            break
+        page += 1
+
+    changed = [s for s in summaries if s.id not in known or s.date_updated != known[s.id]]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(summary: RecipeSummary) -> Recipe | ErrorResponse:
+        async with semaphore:
+            return await client.get_recipe(summary.slug)
+
+    fetched = await asyncio.gather(*(fetch(s) for s in changed))
+    updated = [recipe for recipe in fetched if isinstance(recipe, Recipe)]
+    failed = [s for s, r in zip(changed, fetched, strict=True) if not isinstance(r, Recipe)]
+
+    removed = []
+    if full:
+        seen = {s.id for s in summaries}
+        removed = [recipe_id for recipe_id in known if recipe_id not in seen]
+
+    # Stop the mark short of the oldest recipe that failed to load, so the
+    # next incremental listing returns it again
+    stamps = [s.date_updated for s in summaries if s.date_updated]
+    if failed:
+        failed_stamps = [s.date_updated for s in failed]
+        if None in failed_stamps:
+            stamps = []
+        else:
+            oldest = min(failed_stamps)
+            stamps = [stamp for stamp in stamps if stamp < oldest]
+    if high_water:
+        stamps.append(high_water)
+    return RecipeChanges(updated, removed, max(stamps) if stamps else None)
+
+
 # Global client instance
 _client: MealieClient | None = None
 
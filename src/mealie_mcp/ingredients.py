@@ -0,0 +1,284 @@
+"""Ingredient quantity/unit parsing and aggregation for shopping lists.
+
+Ingredient lines ("2 x 200g chicken breast, diced", "1 1/2 cups rice",
+"½ tsp salt") are parsed into a quantity, a unit and a normalized food
+key. Units are converted to a base per dimension: grams for mass,
+millilitres for volume, and a count for everything else. Lines for the same
+food and dimension can then be summed, and amounts already on a shopping
+list subtracted.
+"""
+
+import re
+from typing import NamedTuple
+
+from mealie_mcp.models import RecipeIngredient
+
+# Unit spelling -> (dimension, factor to base unit)
+UNITS = {
+    "g": ("mass", 1.0),
+    "gram": ("mass", 1.0),
+    "grams": ("mass", 1.0),
+    "kg": ("mass", 1000.0),
+    "kilogram": ("mass", 1000.0),
+    "kilograms": ("mass", 1000.0),
+    "oz": ("mass", 28.35),
+    "ounce": ("mass", 28.35),
+    "ounces": ("mass", 28.35),
+    "lb": ("mass", 453.6),
+    "lbs": ("mass", 453.6),
+    "pound": ("mass", 453.6),
+    "pounds": ("mass", 453.6),
+    "ml": ("volume", 1.0),
+    "millilitre": ("volume", 1.0),
+    "milliliter": ("volume", 1.0),
+    "l": ("volume", 1000.0),
+    "litre": ("volume", 1000.0),
+    "liter": ("volume", 1000.0),
+    "tsp": ("volume", 5.0),
+    "teaspoon": ("volume", 5.0),
+    "teaspoons": ("volume", 5.0),
+    "tsps": ("volume", 5.0),
+    "tbsp": ("volume", 15.0),
+    "tbsps": ("volume", 15.0),
+    "tbs": ("volume", 15.0),
+    "tbl": ("volume", 15.0),
+    "tbls": ("volume", 15.0),
+    "tablespoon": ("volume", 15.0),
+    "tablespoons": ("volume", 15.0),
+    "cup": ("volume", 250.0),
+    "cups": ("volume", 250.0),
+}
+
+# Count-like units kept as their own dimension so "2 cans" doesn't add to "3"
+COUNT_UNITS = {
+    "clove": "clove",
+    "cloves": "clove",
+    "can": "can",
+    "cans": "can",
+    "tin": "can",
+    "tins": "can",
+    "pack": "pack",
+    "packs": "pack",
+    "packet": "pack",
+    "packets": "pack",
+    "bunch": "bunch",
+    "bunches": "bunch",
+    "sachet": "sachet",
+    "sachets": "sachet",
+    "slice": "slice",
+    "slices": "slice",
+    "pinch": "pinch",
+}
+
+# Words dropped from food names when building the aggregation key
+PREP_WORDS = set(
+    "fresh chopped diced sliced minced grated finely roughly large small medium "
+    "boneless skinless peeled crushed of".split()
+)
+
+_FRACTIONS = {"½": 0.5, "⅓": 1 / 3, "⅔": 2 / 3, "¼": 0.25, "¾": 0.75, "⅛": 0.125}
+
+_QUANTITY = re.compile(
+    r"^\s*(?P<whole>\d+(?:\.\d+)?(?![\d/]))?\s*"  # not a fraction's numerator
+    r"(?:(?P<num>\d+)/(?P<den>\d+)|(?P<vulgar>[½⅓⅔¼¾⅛]))?"
+    r"(?:\s*(?:-|to)\s*(?P<upper>\d+(?:\.\d+)?))?"
+    r"\s*(?P<times>x(?=\s*\d)\s*)?"
+)
+
+
+class ParsedIngredient(NamedTuple):
+    """One ingredient line in base units."""
+
+    food: str  # normalized key
+    name: str  # display name
+    dimension: str  # "mass", "volume", a count unit, or "count"
+    quantity: float | None  # in the dimension's base unit
+
+
+def _parse_quantity(text: str) -> tuple[float | None, str]:
+    """Split a leading quantity (incl. fractions, ranges, "2 x 200g") off a line."""
+    match = _QUANTITY.match(text)
+    if match is None or not any(match.group(g) for g in ("whole", "num", "vulgar")):
+        return None, text.strip()
+
+    value = float(match.group("whole") or 0)
+    if match.group("num"):
+        value += int(match.group("num")) / int(match.group("den"))
+    if match.group("vulgar"):
+        value += _FRACTIONS[match.group("vulgar")]
+    if match.group("upper"):
+        value = float(match.group("upper"))  # buy for the top of a range
+    rest = text[match.end():]
+
+    # "2 x 200g" -> multiply by the inner quantity
+    inner = re.match(r"^(\d+(?:\.\d+)?)\s*(?=[a-zA-Z])", rest)
+    if match.group("times") and inner:
+        value *= float(inner.group(1))
+        rest = rest[inner.end():]
+    return value, rest.strip()
+
+
+def food_key(name: str) -> str:
+    """Normalize a food name for aggregation.
+
+    Args:
+        name: Food text (e.g. "Chicken Breasts, diced")
+
+    Returns:
+        Lowercase singular key without preparation words (e.g. "chicken breast")
+    """
+    name = re.sub(r"\(.*?\)", " ", name.lower()).split(",")[0]
+    words = [w for w in re.findall(r"[a-z]+", name) if w not in PREP_WORDS]
+    singular = []
+    for word in words:
+        if word.endswith("oes") or word.endswith("ches") or word.endswith("shes"):
+            word = word[:-2]
+        elif word.endswith("ies") and len(word) > 4:
+            word = word[:-3] + "y"
+        elif word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+            word = word[:-1]
+        singular.append(word)
+    return " ".join(singular)
+
+
+def parse_line(text: str) -> ParsedIngredient | None:
+    """Parse a free-text ingredient or shopping list line.
+
+    Args:
+        text: e.g. "1 1/2 cups basmati rice", "½ tsp salt", "2 x 200g chicken breast"
+
+    Returns:
+        Parsed ingredient, or None if no food name remains
+    """
+    quantity, rest = _parse_quantity(text)
+    unit_match = re.match(r"^([a-zA-Z]+)\.?\b\s*", rest)
+
+    dimension = "count"
+    if unit_match:
+        unit = unit_match.group(1).lower()
+        if unit in UNITS:
+            dimension, factor = UNITS[unit]
+            rest = rest[unit_match.end():]
+            if quantity is not None:
+                quantity *= factor
+        elif unit in COUNT_UNITS:
+            dimension = COUNT_UNITS[unit]
+            rest = rest[unit_match.end():]
+
+    name = re.sub(r"\(.*?\)", "", rest).split(",")[0].strip(" .-")
+    # Size and preparation words aren't part of what to buy ("1 large onion")
+    name = " ".join(w for w in name.split() if w.lower() not in PREP_WORDS)
+
+    # "1 garlic clove" -> garlic, in cloves
+    words = name.split()
+    if dimension == "count" and len(words) > 1 and words[-1].lower() in COUNT_UNITS:
+        dimension = COUNT_UNITS[words[-1].lower()]
+        name = " ".join(words[:-1])
+
+    key = food_key(name)
+    if not key:
+        return None
+    return ParsedIngredient(key, name, dimension, quantity)
+
+
+def parse_ingredient(ingredient: RecipeIngredient) -> ParsedIngredient | None:
+    """Parse a recipe ingredient, preferring Mealie's structured fields.
+
+    Args:
+        ingredient: Recipe ingredient
+
+    Returns:
+        Parsed ingredient, or None for empty lines
+    """
+    if ingredient.food:
+        text = " ".join(
+            str(part)
+            for part in (ingredient.quantity or "", ingredient.unit or "", ingredient.food)
+            if part
+        )
+        return parse_line(text)
+    return parse_line(ingredient.display or ingredient.note or ingredient.original_text or "")
+
+
+def _format_quantity(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def format_item(item: ParsedIngredient) -> str:
+    """Render an aggregated ingredient as shopping list text.
+
+    Args:
+        item: Aggregated ingredient
+
+    Returns:
+        e.g. "600 g chicken breast", "1.5 kg potatoes", "3 cloves garlic"
+    """
+    if item.quantity is None:
+        return item.name
+    if item.dimension == "mass":
+        if item.quantity >= 1000:
+            return f"{_format_quantity(item.quantity / 1000)} kg {item.name}"
+        return f"{_format_quantity(item.quantity)} g {item.name}"
+    if item.dimension == "volume":
+        if item.quantity >= 1000:
+            return f"{_format_quantity(item.quantity / 1000)} l {item.name}"
+        return f"{_format_quantity(item.quantity)} ml {item.name}"
+    if item.dimension == "count":
+        return f"{_format_quantity(item.quantity)} {item.name}"
+    unit = item.dimension
+    if item.quantity > 1:
+        unit = "bunches" if unit == "bunch" else f"{unit}s"
+    return f"{_format_quantity(item.quantity)} {unit} {item.name}"
+
+
+def aggregate(items: list[ParsedIngredient]) -> list[ParsedIngredient]:
+    """Sum quantities of the same food in the same dimension.
+
+    Args:
+        items: Parsed ingredients
+
+    Returns:
+        One entry per (food, dimension), in first-seen order. The quantity is
+        None if any contributing line had no quantity and none had one.
+    """
+    totals: dict[tuple[str, str], ParsedIngredient] = {}
+    for item in items:
+        key = (item.food, item.dimension)
+        existing = totals.get(key)
+        if existing is None:
+            totals[key] = item
+        elif item.quantity is not None:
+            total = (existing.quantity or 0) + item.quantity
+            totals[key] = existing._replace(quantity=total)
+    return list(totals.values())
+
+
+def subtract(needed: list[ParsedIngredient], have: list[ParsedIngredient]) -> list[ParsedIngredient]:
+    """Remove amounts already on the list.
+
+    An unquantified line on the list covers the whole need for that food.
+
+    Args:
+        needed: Aggregated ingredients to buy
+        have: Aggregated unchecked shopping list items
+
+    Returns:
+        What is still missing
+    """
+    on_list = {(h.food, h.dimension): h for h in have}
+    foods_on_list = {h.food: h for h in have}
+
+    remaining = []
+    for item in needed:
+        existing = on_list.get((item.food, item.dimension))
+        if existing is None:
+            # Same food listed without a comparable amount counts as covered
+            other = foods_on_list.get(item.food)
+            if other is not None and other.quantity is None:
+                continue
+            remaining.append(item)
+        elif existing.quantity is None:
+            continue
+        elif item.quantity is not None and item.quantity > existing.quantity:
+            remaining.append(item._replace(quantity=item.quantity - existing.quantity))
+    return remaining
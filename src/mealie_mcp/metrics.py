@@ -0,0 +1,250 @@
+"""In-process Prometheus metrics for MCP tools and Mealie API calls.
+
+Tool calls are timed by the server's middleware (one histogram per tool,
+split by ok/error/exception) and every HTTP attempt MealieClient makes is
+timed per endpoint template and counted per status. render() produces the
+Prometheus text exposition format served on /metrics, so no client
+library is needed.
+"""
+
+import math
+from typing import Any
+
+# Latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments kept verbatim in endpoint labels; anything else (slugs, IDs) becomes {id}
+STATIC_SEGMENTS = frozenset(
+    {
+        "about",
+        "app",
+        "categories",
+        "create",
+        "create-bulk",
+        "events",
+        "households",
+        "image",
+        "items",
+        "last-made",
+        "lists",
+        "mealplans",
+        "organizers",
+        "recipes",
+        "self",
+        "shopping",
+        "tags",
+        "timeline",
+        "url",
+        "users",
+    }
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse IDs and slugs in an API path so label cardinality stays bounded.
+
+    Args:
+        endpoint: API path (e.g. "/recipes/pasta-bake/image")
+
+    Returns:
+        Template (e.g. "/recipes/{id}/image")
+    """
+    segments = [s for s in endpoint.split("?")[0].split("/") if s]
+    return "/" + "/".join(s if s in STATIC_SEGMENTS else "{id}" for s in segments)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        """Create a counter.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            label_names: Names of the labels every sample carries
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Increment the counter for one label combination."""
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current value for one label combination (0 if never incremented)."""
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        """Exposition lines for every label combination."""
+        items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(v)}"
+            for labels, v in items
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        """Create a histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            label_names: Names of the labels every sample carries
+            buckets: Upper bounds in ascending order (+Inf is implied)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = (*buckets, math.inf)
+        # labels -> [per-bucket counts..., sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        """Record one observation for a label combination."""
+        counts = self._values.setdefault(labels, [0.0] * (len(self.buckets) + 1))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        counts[-1] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for one label combination."""
+        counts = self._values.get(labels)
+        return int(sum(counts[:-1])) if counts else 0
+
+    def samples(self) -> list[str]:
+        """Exposition lines (buckets, sum and count) for every label combination."""
+        items = sorted(self._values.items())
+        lines = []
+        for labels, counts in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, counts, strict=False):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {counts[-1]!r}")
+            lines.append(f"{self.name}_count{label_text} {_format_value(cumulative)}")
+        return lines
+
+
+TOOL_LATENCY = Histogram(
+    "mealie_mcp_tool_duration_seconds",
+    "MCP tool call latency by tool and outcome",
+    ("tool", "outcome"),
+)
+
+MEALIE_REQUEST_LATENCY = Histogram(
+    "mealie_mcp_mealie_request_duration_seconds",
+    "Latency of HTTP attempts to the Mealie API by method and endpoint",
+    ("method", "endpoint"),
+)
+
+MEALIE_RESPONSES = Counter(
+    "mealie_mcp_mealie_responses_total",
+    "HTTP attempts to the Mealie API by method, endpoint and status (or error kind)",
+    ("method", "endpoint", "status"),
+)
+
+REGISTRY: list[Counter | Histogram] = [TOOL_LATENCY, MEALIE_REQUEST_LATENCY, MEALIE_RESPONSES]
+
+
+def record_mealie_request(method: str, endpoint: str, status: str, seconds: float) -> None:
+    """Record one HTTP attempt to Mealie.
+
+    Args:
+        method: HTTP method
+        endpoint: API path (IDs are collapsed into a template)
+        status: Status code, or "connect_error"/"timeout"/"error"
+        seconds: Attempt duration
+    """
+    template = endpoint_template(endpoint)
+    MEALIE_REQUEST_LATENCY.observe(method.upper(), template, value=seconds)
+    MEALIE_RESPONSES.inc(method.upper(), template, str(status))
+
+
+def is_error_result(result: Any) -> bool:
+    """Whether a tool result is an ErrorResponse dump (possibly wrapped as {"result": ...})."""
+    if isinstance(result, dict):
+        if result.get("error") is True:
+            return True
+        return isinstance(result.get("result"), dict) and result["result"].get("error") is True
+    return False
+
+
+def record_tool_call(tool: str, result: Any, seconds: float) -> None:
+    """Record one MCP tool call.
+
+    Args:
+        tool: Tool name
+        result: Structured tool result, or None if the tool raised
+        seconds: Call duration
+    """
+    if result is None:
+        outcome = "exception"
+    else:
+        outcome = "error" if is_error_result(result) else "ok"
+    TOOL_LATENCY.observe(tool, outcome, value=seconds)
+
+
+def render(
+    gauges: dict[str, tuple[str, float]] | None = None,
+    counters: dict[str, tuple[str, float]] | None = None,
+) -> str:
+    """Render every metric in the Prometheus text exposition format.
+
+    Args:
+        gauges: Extra point-in-time values, name -> (help text, value)
+        counters: Extra totals kept elsewhere, name (ending in _total) -> (help text, value)
+
+    Returns:
+        Exposition text
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    for kind, values in (("counter", counters), ("gauge", gauges)):
+        for name, (documentation, value) in (values or {}).items():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
 # Enums
@@ -40,6 +40,7 @@ class Tag(MealieBase):
     id: str
     slug: str
     name: str
+    group_id: str | None = Field(None, alias="groupId")
 
 
 class Category(MealieBase):
@@ -48,6 +49,7 @@ class Category(MealieBase):
     id: str
     slug: str
     name: str
+    group_id: str | None = Field(None, alias="groupId")
 
 
 # Recipe Models
@@ -100,6 +102,7 @@ class RecipeSummary(MealieBase):
     prep_time: str | None = Field(None, alias="prepTime")
     cook_time: str | None = Field(None, alias="cookTime")
     rating: int | None = None
+    date_updated: str | None = Field(None, alias="dateUpdated")
 
 
 class Recipe(RecipeSummary):
@@ -158,6 +161,12 @@ class ShoppingListSummary(MealieBase):
 
     id: str
     name: str
+    # Mealie versions differ on the spelling of the timestamp key
+    updated_at: str | None = Field(
+        None,
+        validation_alias=AliasChoices("updatedAt", "updateAt", "updated_at"),
+        serialization_alias="updatedAt",
+    )
 
 
 class ShoppingList(ShoppingListSummary):
@@ -0,0 +1,132 @@
+"""Numeric parsing of Mealie's free-text nutrition and time fields.
+
+Mealie stores nutrition as strings ("520 kcal", "35g", "1.2 g") and times
+as free text ("20 minutes", "1 hour 10 min", "PT25M"). These helpers
+normalize them to numbers: kcal for calories, grams for macros, and
+milligrams for sodium and cholesterol.
+"""
+
+import re
+
+from mealie_mcp.models import RecipeNutrition
+
+# Short name -> RecipeNutrition field
+NUTRIENT_FIELDS = {
+    "calories": "calories",
+    "protein": "protein_content",
+    "carbs": "carbohydrate_content",
+    "fat": "fat_content",
+    "fiber": "fiber_content",
+    "sugar": "sugar_content",
+    "sodium": "sodium_content",
+    "cholesterol": "cholesterol_content",
+    "saturated_fat": "saturated_fat_content",
+    "trans_fat": "trans_fat_content",
+    "unsaturated_fat": "unsaturated_fat_content",
+}
+
+# Macros the meal planning rules set targets for
+MACROS = ("calories", "protein", "carbs", "fat")
+
+# Nutrients reported in milligrams; everything else except calories is grams
+MILLIGRAM_NUTRIENTS = {"sodium", "cholesterol"}
+
+_NUMBER_UNIT = re.compile(r"(\d+(?:[.,]\d+)?)\s*([a-zµμ]*)", re.IGNORECASE)
+_THOUSANDS = re.compile(r"(?<=\d),(?=\d{3}\b)")
+
+# Unit -> factor to grams
+GRAM_FACTORS = {
+    "": 1.0,
+    "g": 1.0,
+    "gram": 1.0,
+    "grams": 1.0,
+    "kg": 1000.0,
+    "mg": 0.001,
+    "mcg": 1e-6,
+    "µg": 1e-6,
+    "μg": 1e-6,
+}
+
+
+def parse_amount(text: str | None, nutrient: str) -> float | None:
+    """Parse one nutrition string into the nutrient's canonical unit.
+
+    Args:
+        text: Raw value (e.g. "520 kcal", "2,100 kJ", "35g", "450 mg")
+        nutrient: Short nutrient name (see NUTRIENT_FIELDS)
+
+    Returns:
+        kcal for calories, mg for sodium/cholesterol, grams otherwise;
+        None if no number is found
+    """
+    if not text:
+        return None
+    match = _NUMBER_UNIT.search(_THOUSANDS.sub("", text))
+    if match is None:
+        return None
+
+    value = float(match.group(1).replace(",", "."))
+    unit = match.group(2).lower()
+
+    if nutrient == "calories":
+        if unit.startswith("kj"):
+            return round(value / 4.184, 1)
+        return value
+
+    grams = value * GRAM_FACTORS.get(unit, 1.0)
+    if nutrient in MILLIGRAM_NUTRIENTS:
+        # Bare numbers for sodium/cholesterol are already milligrams
+        return value if unit in ("", "mg") else grams * 1000
+    return grams
+
+
+def parse_nutrition(nutrition: RecipeNutrition | None) -> dict[str, float | None]:
+    """Parse every nutrition field of a recipe.
+
+    Args:
+        nutrition: Recipe nutrition as returned by Mealie
+
+    Returns:
+        Short nutrient name -> numeric value (None where missing)
+    """
+    if nutrition is None:
+        return dict.fromkeys(NUTRIENT_FIELDS)
+    return {
+        name: parse_amount(getattr(nutrition, field), name)
+        for name, field in NUTRIENT_FIELDS.items()
+    }
+
+
+_ISO_DURATION = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$", re.IGNORECASE)
+_HOURS = re.compile(r"(\d+(?:\.\d+)?)\s*(?:h|hr|hrs|hour|hours)\b", re.IGNORECASE)
+_MINUTES = re.compile(r"(\d+)\s*(?:m|min|mins|minute|minutes)\b", re.IGNORECASE)
+
+
+def parse_minutes(text: str | None) -> float | None:
+    """Parse a recipe time into minutes.
+
+    Args:
+        text: Time such as "20 minutes", "1 hour 10 min", "1.5 hrs" or "PT25M"
+
+    Returns:
+        Minutes, or None if the text has no recognizable time
+    """
+    if not text:
+        return None
+    text = text.strip()
+
+    iso = _ISO_DURATION.match(text)
+    if iso and any(iso.groups()):
+        days, hours, minutes, seconds = (int(g or 0) for g in iso.groups())
+        return days * 1440 + hours * 60 + minutes + seconds / 60
+
+    hours = _HOURS.search(text)
+    minutes = _MINUTES.search(text)
+    if hours or minutes:
+        return (float(hours.group(1)) * 60 if hours else 0) + (
+            float(minutes.group(1)) if minutes else 0
+        )
+
+    if text.isdigit():
+        return float(text)
+    return None
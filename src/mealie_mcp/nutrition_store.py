@@ -0,0 +1,308 @@
+"""Columnar store of parsed recipe nutrition with vectorized range queries.
+
+Every recipe's nutrition strings are parsed once (see nutrition.py) into one
+NumPy column per nutrient, indexed by recipe position, with NaN for missing
+values. A filter such as ``calories<600 AND protein>=35`` then compiles to a
+handful of array comparisons over the whole library, not a fetch and regex
+pass per recipe. The store is rebuilt only when a recipe's dateUpdated
+changes, and the recipes themselves are kept up to date incrementally
+with fetch_recipe_changes.
+
+Requires NumPy: pip install 'mealie-mcp[planner]'
+"""
+
+import operator
+import re
+import time
+
+from mealie_mcp.client import MealieClient, fetch_recipe_changes
+from mealie_mcp.models import ErrorResponse, Recipe
+from mealie_mcp.nutrition import (
+    GRAM_FACTORS,
+    NUTRIENT_FIELDS,
+    parse_amount,
+    parse_minutes,
+    parse_nutrition,
+)
+from mealie_mcp.search_index import DEFAULT_RECONCILE_SECONDS
+from mealie_mcp.sync import get_sync_engine
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("NumPy not installed. Run: pip install 'mealie-mcp[planner]'") from e
+
+# Filterable columns: every nutrient plus times in minutes
+COLUMNS = (*NUTRIENT_FIELDS, "prep_minutes", "total_minutes")
+
+# Spellings accepted in filters -> column
+COLUMN_ALIASES = {
+    "kcal": "calories",
+    "energy": "calories",
+    "carbohydrates": "carbs",
+    "carbohydrate": "carbs",
+    "fibre": "fiber",
+    "sugars": "sugar",
+    "prep_time": "prep_minutes",
+    "total_time": "total_minutes",
+    "time": "total_minutes",
+}
+
+_OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "==": operator.eq,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+_CLAUSE = re.compile(
+    r"^\s*([a-z_]+)\s*(<=|>=|!=|==|=|<|>)\s*(-?)(\d+(?:\.\d+)?)\s*([a-zµμ]*)\s*$"
+)
+
+# Units accepted for calories in filters (see parse_amount)
+ENERGY_UNITS = ("", "kcal", "cal", "kj")
+
+# Units accepted for the time columns -> factor to minutes
+MINUTE_FACTORS = {
+    "": 1.0,
+    "m": 1.0,
+    "min": 1.0,
+    "mins": 1.0,
+    "minute": 1.0,
+    "minutes": 1.0,
+    "h": 60.0,
+    "hr": 60.0,
+    "hrs": 60.0,
+    "hour": 60.0,
+    "hours": 60.0,
+}
+
+# Sodium per gram of salt; "salt<1.5g" filters on sodium < 600 mg
+SODIUM_PER_SALT = 0.4
+
+# Concurrent full-recipe fetches when loading the library
+LOAD_CONCURRENCY = 8
+
+# Full recipes by ID, kept current with fetch_recipe_changes
+_recipe_cache: dict[str, Recipe] = {}
+
+# High-water mark of _recipe_cache and monotonic time of its last full listing
+_cache_high_water: str | None = None
+_cache_reconciled: float | None = None
+
+# Last store built, keyed by the (id, dateUpdated) of its recipes
+_store_cache: tuple[tuple, "NutritionStore"] | None = None
+
+
+def _filter_value(column: str, number: str, unit: str) -> float | None:
+    """Convert a filter value to the column's unit.
+
+    Args:
+        column: Canonical column name
+        number: Unsigned number as written
+        unit: Lowercase unit as written, "" for none
+
+    Returns:
+        Value in the column's unit, or None if the unit doesn't apply
+    """
+    if column in ("prep_minutes", "total_minutes"):
+        factor = MINUTE_FACTORS.get(unit)
+        return None if factor is None else float(number) * factor
+    if unit not in (ENERGY_UNITS if column == "calories" else GRAM_FACTORS):
+        return None
+    return parse_amount(f"{number} {unit}", column)
+
+
+def parse_filter(expression: str) -> list[list[tuple[str, str, float]]] | ErrorResponse:
+    """Parse a nutrition filter into OR-groups of AND-ed clauses.
+
+    Args:
+        expression: e.g. "calories<600 AND protein>=35 OR fat<10"
+
+    Returns:
+        List of groups, each a list of (column, operator, value), or error
+    """
+    groups = []
+    for group in re.split(r"\s+or\s+", expression.strip().lower()):
+        clauses = []
+        for clause in re.split(r"\s+and\s+|,", group):
+            if not clause.strip():
+                continue
+            match = _CLAUSE.match(clause)
+            if match is None:
+                return ErrorResponse.validation_error(
+                    f"Can't parse '{clause.strip()}'. Use e.g. 'calories<600 AND protein>=35'"
+                )
+            name, op, sign, number, unit = match.groups()
+            if name == "salt":
+                # Salt is given in grams; filter on the sodium it contains
+                column = "sodium"
+                value = _filter_value(column, number, unit or "g")
+                if value is not None:
+                    value *= SODIUM_PER_SALT
+            else:
+                column = COLUMN_ALIASES.get(name, name)
+                if column not in COLUMNS:
+                    return ErrorResponse.validation_error(
+                        f"Unknown field '{column}'. Use one of: {', '.join(COLUMNS)}"
+                    )
+                value = _filter_value(column, number, unit)
+            if value is None:
+                return ErrorResponse.validation_error(f"Unit '{unit}' doesn't apply to {name}")
+            clauses.append((column, op, -value if sign else value))
+        if clauses:
+            groups.append(clauses)
+
+    if not groups:
+        return ErrorResponse.validation_error("Empty nutrition filter")
+    return groups
+
+
+class NutritionStore:
+    """Struct-of-arrays view of the library's nutrition and times."""
+
+    def __init__(self, recipes: list[Recipe]):
+        """Parse every recipe into the columns.
+
+        Args:
+            recipes: Full recipes
+        """
+        self.recipes = recipes
+        parsed = [parse_nutrition(r.nutrition) for r in recipes]
+        self.columns: dict[str, np.ndarray] = {
+            name: np.array(
+                [np.nan if p[name] is None else p[name] for p in parsed], dtype=float
+            )
+            for name in NUTRIENT_FIELDS
+        }
+        for column, attribute in (("prep_minutes", "prep_time"), ("total_minutes", "total_time")):
+            values = [parse_minutes(getattr(r, attribute)) for r in recipes]
+            self.columns[column] = np.array(
+                [np.nan if v is None else v for v in values], dtype=float
+            )
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def mask(self, groups: list[list[tuple[str, str, float]]]) -> "np.ndarray":
+        """Evaluate a parsed filter over every recipe at once.
+
+        Missing values never match (NaN comparisons are False).
+
+        Args:
+            groups: Output of parse_filter
+
+        Returns:
+            Boolean array, True for matching recipes
+        """
+        result = np.zeros(len(self), dtype=bool)
+        for clauses in groups:
+            group_mask = np.ones(len(self), dtype=bool)
+            for column, op, value in clauses:
+                with np.errstate(invalid="ignore"):
+                    group_mask &= _OPERATORS[op](self.columns[column], value)
+                if op == "!=":
+                    group_mask &= ~np.isnan(self.columns[column])
+            result |= group_mask
+        return result
+
+    def query(
+        self,
+        groups: list[list[tuple[str, str, float]]],
+        sort_by: str | None = None,
+        descending: bool = False,
+        limit: int = 20,
+    ) -> list[int]:
+        """Find matching recipes.
+
+        Args:
+            groups: Output of parse_filter
+            sort_by: Column to order by (missing values last)
+            descending: Sort largest first
+            limit: Maximum number of results
+
+        Returns:
+            Row indices of matching recipes
+        """
+        rows = np.flatnonzero(self.mask(groups))
+        if sort_by is not None:
+            keys = self.columns[sort_by][rows]
+            keys = np.where(np.isnan(keys), np.inf, -keys if descending else keys)
+            rows = rows[np.argsort(keys, kind="stable")]
+        return rows[:limit].tolist()
+
+    def values(self, row: int) -> dict[str, float | None]:
+        """Parsed values for one recipe.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Column -> value (None where missing)
+        """
+        values = {}
+        for name, column in self.columns.items():
+            value = column[row]
+            values[name] = None if np.isnan(value) else round(float(value), 1)
+        return values
+
+
+def get_nutrition_store(recipes: list[Recipe]) -> NutritionStore:
+    """Build a NutritionStore, reusing the last one if no recipe changed.
+
+    Args:
+        recipes: Full recipes
+
+    Returns:
+        Store over the recipes
+    """
+    global _store_cache
+    key = tuple(sorted((r.id, r.date_updated or "") for r in recipes))
+    if _store_cache is None or _store_cache[0] != key:
+        _store_cache = (key, NutritionStore(sorted(recipes, key=lambda r: r.id)))
+    return _store_cache[1]
+
+
+async def load_recipes(client: MealieClient) -> list[Recipe] | ErrorResponse:
+    """Load every recipe in full.
+
+    Uses the background sync mirror when it is populated. Otherwise
+    catches the module's recipe cache up with fetch_recipe_changes: only
+    recipes updated since the last load are listed and fetched, with a
+    full listing every MEALIE_SEARCH_INDEX_RECONCILE seconds to drop
+    deleted recipes.
+
+    Args:
+        client: MealieClient instance
+
+    Returns:
+        Full recipes, or error
+    """
+    global _cache_high_water, _cache_reconciled
+    engine = get_sync_engine()
+    if engine is not None and engine.recipes:
+        return list(engine.recipes.values())
+
+    full = (
+        not _recipe_cache
+        or _cache_reconciled is None
+        or time.monotonic() - _cache_reconciled >= DEFAULT_RECONCILE_SECONDS
+    )
+    known = {recipe_id: recipe.date_updated for recipe_id, recipe in _recipe_cache.items()}
+    changes = await fetch_recipe_changes(
+        client, known, _cache_high_water, full=full, concurrency=LOAD_CONCURRENCY
+    )
+    if isinstance(changes, ErrorResponse):
+        return changes
+
+    for recipe in changes.updated:
+        _recipe_cache[recipe.id] = recipe
+    for recipe_id in changes.removed:
+        _recipe_cache.pop(recipe_id, None)
+    _cache_high_water = changes.high_water
+    if full:
+        _cache_reconciled = time.monotonic()
+    return list(_recipe_cache.values())
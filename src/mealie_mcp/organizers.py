@@ -0,0 +1,237 @@
+"""Shared index of Mealie organizers (tags and categories).
+
+Mealie expects recipe tags and categories as full objects with IDs. The
+OrganizerIndex loads every tag and category once, resolves names to those
+objects, and creates any that are missing concurrently, so recipe writes
+don't need an organizer round trip per name. The index refreshes itself
+after a TTL to pick up organizers created elsewhere.
+"""
+
+import asyncio
+import os
+import re
+import time
+from typing import Literal
+
+from mealie_mcp.client import MealieClient, get_client
+from mealie_mcp.models import Category, ErrorResponse, Tag
+
+OrganizerKind = Literal["tags", "categories"]
+
+# Seconds before the index reloads tags and categories from Mealie
+DEFAULT_TTL_SECONDS = float(os.getenv("MEALIE_ORGANIZER_TTL", "300"))
+
+
+def organizer_key(name: str) -> str:
+    """Normalize a tag/category name or slug for lookup.
+
+    Args:
+        name: Organizer name or slug
+
+    Returns:
+        Lowercase hyphenated key
+    """
+    key = name.strip().lower()
+    key = re.sub(r"[\s_]+", "-", key)
+    key = re.sub(r"[^a-z0-9-]", "", key)
+    key = re.sub(r"-+", "-", key)
+    return key.strip("-")
+
+
+class OrganizerIndex:
+    """Name -> object index of a Mealie group's tags and categories."""
+
+    def __init__(
+        self,
+        client: MealieClient | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            client: MealieClient to use (defaults to the global client)
+            ttl_seconds: Age after which the index is reloaded
+        """
+        self._client = client
+        self.ttl_seconds = ttl_seconds
+        self.tags: dict[str, Tag] = {}  # slug -> tag
+        self.categories: dict[str, Category] = {}  # slug -> category
+        self._names: dict[OrganizerKind, dict[str, str]] = {"tags": {}, "categories": {}}
+        self.group_id: str | None = None
+        self._loaded_at: float | None = None
+        self._load_lock = asyncio.Lock()
+        self._pending: dict[tuple[OrganizerKind, str], asyncio.Task] = {}
+
+    @property
+    def client(self) -> MealieClient:
+        """The MealieClient used for organizer requests."""
+        return self._client or get_client()
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the index needs (re)loading."""
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def invalidate(self) -> None:
+        """Force a reload on next use."""
+        self._loaded_at = None
+
+    def _entries(self, kind: OrganizerKind) -> dict:
+        return self.tags if kind == "tags" else self.categories
+
+    def _add(self, kind: OrganizerKind, organizer: Tag | Category) -> None:
+        if organizer.group_id is None:
+            organizer.group_id = self.group_id
+        self._entries(kind)[organizer.slug] = organizer
+        self._names[kind][organizer_key(organizer.name)] = organizer.slug
+        self._names[kind][organizer_key(organizer.slug)] = organizer.slug
+
+    def _lookup(self, kind: OrganizerKind, key: str) -> Tag | Category | None:
+        slug = self._names[kind].get(key)
+        return self._entries(kind).get(slug) if slug is not None else None
+
+    async def ensure_loaded(self, force: bool = False) -> ErrorResponse | None:
+        """Load all tags and categories if the index is empty or expired.
+
+        Args:
+            force: Reload even if the index is fresh
+
+        Returns:
+            ErrorResponse if loading failed, otherwise None
+        """
+        if not force and not self.is_stale:
+            return None
+
+        async with self._load_lock:
+            # Another caller may have loaded while we waited
+            if not force and not self.is_stale:
+                return None
+
+            tags, categories, group_id = await asyncio.gather(
+                self.client.list_tags(per_page=-1),
+                self.client.list_categories(per_page=-1),
+                self.client.get_group_id(),
+            )
+            for result in (tags, categories):
+                if isinstance(result, ErrorResponse):
+                    return result
+
+            self.group_id = group_id
+            self.tags = {}
+            self.categories = {}
+            self._names = {"tags": {}, "categories": {}}
+            for tag in tags:
+                self._add("tags", tag)
+            for category in categories:
+                self._add("categories", category)
+            self._loaded_at = time.monotonic()
+
+        return None
+
+    async def _create(self, kind: OrganizerKind, name: str) -> Tag | Category | ErrorResponse:
+        """Create one organizer, re-checking Mealie if it already exists."""
+        create = self.client.create_tag if kind == "tags" else self.client.create_category
+        result = await create(name)
+
+        if isinstance(result, ErrorResponse):
+            # Most likely created concurrently elsewhere - reload and look again
+            reload_error = await self.ensure_loaded(force=True)
+            existing = self._lookup(kind, organizer_key(name))
+            if reload_error is None and existing is not None:
+                return existing
+            return result
+
+        self._add(kind, result)
+        self._names[kind][organizer_key(name)] = result.slug
+        return result
+
+    async def _resolve(
+        self, kind: OrganizerKind, names: list[str], create_missing: bool
+    ) -> list[Tag] | list[Category] | ErrorResponse:
+        error = await self.ensure_loaded()
+        if error is not None:
+            return error
+
+        # Deduplicate while keeping the caller's order
+        wanted: dict[str, str] = {}
+        for name in names:
+            key = organizer_key(name)
+            if key and key not in wanted:
+                wanted[key] = name.strip()
+
+        missing = [key for key in wanted if self._lookup(kind, key) is None]
+        if missing and create_missing:
+            tasks = []
+            for key in missing:
+                # Share in-flight creations between concurrent callers
+                task = self._pending.get((kind, key))
+                if task is None:
+                    task = asyncio.ensure_future(self._create(kind, wanted[key]))
+                    self._pending[(kind, key)] = task
+                    task.add_done_callback(
+                        lambda _, pending_key=(kind, key): self._pending.pop(pending_key, None)
+                    )
+                tasks.append(task)
+
+            for created in await asyncio.gather(*tasks):
+                if isinstance(created, ErrorResponse):
+                    return created
+
+        resolved = []
+        for key in wanted:
+            organizer = self._lookup(kind, key)
+            if organizer is not None and organizer not in resolved:
+                resolved.append(organizer)
+        return resolved
+
+    async def resolve_tags(
+        self, names: list[str], create_missing: bool = True
+    ) -> list[Tag] | ErrorResponse:
+        """Resolve tag names to full tag objects.
+
+        Args:
+            names: Tag names or slugs (duplicates are collapsed)
+            create_missing: Create tags that don't exist yet
+
+        Returns:
+            Tags in the order given, or error
+        """
+        return await self._resolve("tags", names, create_missing)
+
+    async def resolve_categories(
+        self, names: list[str], create_missing: bool = True
+    ) -> list[Category] | ErrorResponse:
+        """Resolve category names to full category objects.
+
+        Args:
+            names: Category names or slugs (duplicates are collapsed)
+            create_missing: Create categories that don't exist yet
+
+        Returns:
+            Categories in the order given, or error
+        """
+        return await self._resolve("categories", names, create_missing)
+
+
+def organizer_payload(organizers: list[Tag] | list[Category]) -> list[dict]:
+    """Serialize resolved organizers for a recipe PATCH.
+
+    Args:
+        organizers: Tags or categories from an OrganizerIndex
+
+    Returns:
+        List of {id, name, slug, groupId} dicts
+    """
+    return [o.model_dump(by_alias=True, exclude_none=True) for o in organizers]
+
+
+# Global index instance
+_index: OrganizerIndex | None = None
+
+
+def get_organizer_index() -> OrganizerIndex:
+    """Get or create the global organizer index."""
+    global _index
+    if _index is None:
+        _index = OrganizerIndex()
+    return _index
@@ -0,0 +1,300 @@
+"""Meal plan optimizer over a recipe x macro matrix.
+
+Recipes with complete macros in the NutritionStore are packed into a
+matrix (one row per recipe, one column per macro). generate_plan() picks a recipe for each
+meal slot of each day so the day's totals land as close as possible to
+the macro targets, scoring every candidate for a slot in one vectorized
+step and sweeping over days and slots until no pick improves
+(coordinate descent). Dinners respect the planning rules' constraints:
+a prep-time cap on easy days, no main protein two days running, and no
+dinner repeated within the plan.
+
+Requires NumPy: pip install 'mealie-mcp[planner]'
+"""
+
+import re
+from datetime import date
+
+from mealie_mcp.models import Recipe
+from mealie_mcp.nutrition import MACROS
+from mealie_mcp.nutrition_store import NutritionStore
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("NumPy not installed. Run: pip install 'mealie-mcp[planner]'") from e
+
+SLOTS = ("breakfast", "lunch", "dinner")
+
+# Tag/category names (normalized) that mark a recipe as suitable for a slot
+SLOT_KEYWORDS = {
+    "breakfast": ("breakfast", "brunch"),
+    "lunch": ("lunch", "meal prep"),
+    "dinner": ("dinner", "main", "mains"),
+}
+
+# Main protein -> words that identify it in names, tags and ingredients
+PROTEIN_KEYWORDS = {
+    "chicken": ("chicken",),
+    "beef": ("beef", "steak", "brisket"),
+    "pork": ("pork", "bacon", "ham", "chorizo", "prosciutto"),
+    "lamb": ("lamb",),
+    "turkey": ("turkey",),
+    "duck": ("duck",),
+    "salmon": ("salmon",),
+    "fish": ("fish", "cod", "barramundi", "basa", "snapper", "tuna", "hake"),
+    "prawn": ("prawn", "shrimp"),
+    "tofu": ("tofu", "tempeh"),
+    "legumes": ("lentil", "chickpea", "bean"),
+}
+
+_PROTEIN_PATTERNS = {
+    protein: re.compile(r"\b(?:" + "|".join(words) + r")s?\b")
+    for protein, words in PROTEIN_KEYWORDS.items()
+}
+
+# Last matrix built, with the store it was built from
+_matrix_cache: tuple[NutritionStore, "RecipeMatrix"] | None = None
+
+
+def _recipe_words(recipe: Recipe) -> str:
+    organizers = [t.name for t in recipe.tags] + [c.name for c in recipe.recipe_category]
+    organizers += [t.slug for t in recipe.tags] + [c.slug for c in recipe.recipe_category]
+    return " ".join(organizers).lower()
+
+
+def _organizer_names(recipe: Recipe) -> set[str]:
+    """Tag and category names and slugs, lowercased with hyphens as spaces."""
+    organizers = [*recipe.tags, *recipe.recipe_category]
+    names = {o.name for o in organizers} | {o.slug for o in organizers}
+    return {" ".join(name.lower().replace("-", " ").split()) for name in names}
+
+
+def detect_protein(recipe: Recipe) -> str | None:
+    """Guess a recipe's main protein.
+
+    Tags and the recipe name take precedence over the ingredient list;
+    within each, proteins are tried in PROTEIN_KEYWORDS order.
+
+    Args:
+        recipe: Full recipe
+
+    Returns:
+        Protein key from PROTEIN_KEYWORDS, or None
+    """
+    ingredients = " ".join(
+        i.display or i.food or i.note or i.original_text or "" for i in recipe.recipe_ingredient
+    )
+    for text in (_recipe_words(recipe), recipe.name.lower(), ingredients.lower()):
+        for protein, pattern in _PROTEIN_PATTERNS.items():
+            if pattern.search(text):
+                return protein
+    return None
+
+
+def eligible_slots(recipe: Recipe) -> set[str]:
+    """Meal slots a recipe can fill, from its tags and categories.
+
+    A tag or category must match a slot keyword as a whole name, so
+    "Mains" counts for dinner but "Main Ingredient: Tofu" does not.
+    Recipes without any slot keyword are treated as lunch/dinner mains.
+
+    Args:
+        recipe: Full recipe
+
+    Returns:
+        Set of slot names
+    """
+    names = _organizer_names(recipe)
+    slots = {slot for slot, keys in SLOT_KEYWORDS.items() if names.intersection(keys)}
+    return slots or {"lunch", "dinner"}
+
+
+class RecipeMatrix:
+    """Recipes with known macros packed into NumPy arrays."""
+
+    def __init__(self, store: NutritionStore):
+        """Build the matrix, dropping recipes without complete macros.
+
+        Args:
+            store: Parsed nutrition for the library
+        """
+        macros = np.column_stack([store.columns[m] for m in MACROS])
+        rows = np.flatnonzero(np.isfinite(macros).all(axis=1) & (macros[:, 0] > 0))
+        kept = [store.recipes[i] for i in rows]
+
+        self.recipes = kept
+        self.skipped = len(store) - len(kept)
+        self.macros = macros[rows]
+
+        # Prep time, falling back to total time; NaN when unknown
+        prep = store.columns["prep_minutes"][rows]
+        self.minutes = np.where(np.isnan(prep), store.columns["total_minutes"][rows], prep)
+
+        proteins = [detect_protein(r) for r in kept]
+        names = sorted({p for p in proteins if p})
+        self.protein_names = names
+        self.proteins = np.array([names.index(p) if p else -1 for p in proteins], dtype=int)
+
+        slots = [eligible_slots(r) for r in kept]
+        self.slot_mask = {
+            slot: np.array([slot in s for s in slots], dtype=bool) for slot in SLOTS
+        }
+        # Fall back to every recipe for slots nothing is tagged for
+        for slot, mask in self.slot_mask.items():
+            if not mask.any():
+                self.slot_mask[slot] = np.ones(len(kept), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+
+def get_matrix(store: NutritionStore) -> RecipeMatrix:
+    """Build a RecipeMatrix, reusing the last one while the store is unchanged.
+
+    Args:
+        store: Parsed nutrition for the library
+
+    Returns:
+        Matrix over the recipes with complete macros
+    """
+    global _matrix_cache
+    if _matrix_cache is None or _matrix_cache[0] is not store:
+        _matrix_cache = (store, RecipeMatrix(store))
+    return _matrix_cache[1]
+
+
+def _day_cost(totals: "np.ndarray", target: "np.ndarray") -> "np.ndarray":
+    """Sum of squared relative macro errors; works on (..., n_macros) arrays."""
+    return (((totals - target) / target) ** 2).sum(axis=-1)
+
+
+def generate_plan(
+    matrix: RecipeMatrix,
+    days: list[tuple[date, dict[str, float]]],
+    slots: tuple[str, ...] = SLOTS,
+    skip: dict[date, set[str]] | None = None,
+    easy_weekdays: set[str] | None = None,
+    easy_max_minutes: float = 20,
+    max_passes: int = 20,
+) -> list[dict]:
+    """Choose a recipe per slot per day to match daily macro targets.
+
+    Args:
+        matrix: Candidate recipes
+        days: (date, {"calories", "protein", "carbs", "fat"}) per day, in order
+        slots: Meal slots to fill each day
+        skip: Slots to leave empty on given dates (e.g. takeout dinners)
+        easy_weekdays: Lowercase weekday names whose dinner must be quick
+        easy_max_minutes: Prep time cap for easy-day dinners
+        max_passes: Maximum coordinate descent sweeps
+
+    Returns:
+        Per day: date, weekday, picks (slot -> matrix row index), unfilled
+        (planned slots no candidate could fill), totals and targets
+    """
+    skip = skip or {}
+    easy_weekdays = easy_weekdays or set()
+    n_days = len(days)
+    no_pick = -1
+
+    targets = np.array([[t[m] for m in MACROS] for _, t in days], dtype=float)
+    planned = [[slot for slot in slots if slot not in skip.get(d, set())] for d, _ in days]
+    # Scale targets down for days with skipped slots
+    share = np.array([len(p) / len(slots) for p in planned], dtype=float)
+    targets = targets * share[:, None]
+    targets[targets == 0] = 1.0  # avoid dividing by zero for empty days
+
+    picks = np.full((n_days, len(slots)), no_pick, dtype=int)
+
+    def totals_without(day: int, slot_index: int) -> "np.ndarray":
+        others = [picks[day, j] for j in range(len(slots)) if j != slot_index]
+        rows = [matrix.macros[r] for r in others if r != no_pick]
+        return np.sum(rows, axis=0) if rows else np.zeros(len(MACROS))
+
+    def candidate_mask(day: int, slot_index: int) -> "np.ndarray":
+        slot = slots[slot_index]
+        mask = matrix.slot_mask[slot].copy()
+        # Never the same recipe twice in one day
+        same_day = [picks[day, j] for j in range(len(slots)) if j != slot_index]
+        mask[[r for r in same_day if r != no_pick]] = False
+        if slot != "dinner":
+            return mask
+
+        constraints = []
+        if days[day][0].strftime("%A").lower() in easy_weekdays:
+            constraints.append(matrix.minutes <= easy_max_minutes)  # NaN (unknown) is False
+
+        # No main protein on consecutive days
+        no_repeat = np.ones(len(matrix), dtype=bool)
+        for neighbour in (day - 1, day + 1):
+            if not 0 <= neighbour < n_days or picks[neighbour, slot_index] == no_pick:
+                continue
+            if abs((days[neighbour][0] - days[day][0]).days) != 1:
+                continue
+            protein = matrix.proteins[picks[neighbour, slot_index]]
+            if protein >= 0:
+                no_repeat &= matrix.proteins != protein
+        constraints.append(no_repeat)
+
+        # No dinner twice in the plan
+        unused = np.ones(len(matrix), dtype=bool)
+        used = [picks[d, slot_index] for d in range(n_days) if d != day]
+        unused[[r for r in used if r != no_pick]] = False
+        constraints.append(unused)
+
+        # Apply constraints in priority order, skipping any the library can't satisfy
+        for constraint in constraints:
+            if (mask & constraint).any():
+                mask &= constraint
+        return mask
+
+    for _ in range(max_passes):
+        changed = False
+        for day in range(n_days):
+            for slot_index, slot in enumerate(slots):
+                if slot not in planned[day]:
+                    continue
+                mask = candidate_mask(day, slot_index)
+                # Score every candidate for this slot at once
+                cost = _day_cost(totals_without(day, slot_index) + matrix.macros, targets[day])
+                cost[~mask] = np.inf
+                best = int(np.argmin(cost))
+                current = picks[day, slot_index]
+                if not np.isfinite(cost[best]):
+                    # No candidate left for this slot; leave it empty
+                    if current != no_pick:
+                        picks[day, slot_index] = no_pick
+                        changed = True
+                    continue
+                if current == no_pick or cost[best] < cost[current] - 1e-12:
+                    if best != current:
+                        picks[day, slot_index] = best
+                        changed = True
+        if not changed:
+            break
+
+    plan = []
+    for day, (day_date, _) in enumerate(days):
+        rows = [r for r in picks[day] if r != no_pick]
+        totals = matrix.macros[rows].sum(axis=0) if rows else np.zeros(len(MACROS))
+        plan.append(
+            {
+                "date": day_date,
+                "weekday": day_date.strftime("%A").lower(),
+                "picks": {
+                    slot: int(picks[day, j])
+                    for j, slot in enumerate(slots)
+                    if picks[day, j] != no_pick
+                },
+                "unfilled": [
+                    slot
+                    for j, slot in enumerate(slots)
+                    if slot in planned[day] and picks[day, j] == no_pick
+                ],
+                "totals": dict(zip(MACROS, totals.tolist(), strict=True)),
+                "targets": dict(zip(MACROS, targets[day].tolist(), strict=True)),
+            }
+        )
+    return plan
+
@@ -0,0 +1,195 @@
+"""Retry and circuit breaker policies for calls to the Mealie API.
+
+RetryPolicy decides whether a failed request is worth repeating and how
+long to wait first: exponential backoff with full jitter, or the server's
+Retry-After when it sends one. Only idempotent methods are retried after
+the request may have reached Mealie; a connection that was never made is
+safe to retry for any method.
+
+CircuitBreaker counts consecutive failures (connection errors, timeouts,
+5xx). Past a threshold it opens and requests fail fast instead of piling
+onto a Mealie that is restarting or overloaded. After a cool-down it lets
+a single probe through and closes again if the probe succeeds.
+"""
+
+import os
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Status codes that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class RetryPolicy(NamedTuple):
+    """How often and how patiently to retry failed requests."""
+
+    retries: int = 2  # extra attempts after the first
+    backoff: float = 0.5  # base delay in seconds, doubled per attempt
+    max_delay: float = 10.0  # cap on any single wait, including Retry-After
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Build a policy from MEALIE_RETRIES, MEALIE_RETRY_BACKOFF and MEALIE_RETRY_MAX_DELAY."""
+        return cls(
+            retries=int(os.getenv("MEALIE_RETRIES", cls._field_defaults["retries"])),
+            backoff=float(os.getenv("MEALIE_RETRY_BACKOFF", cls._field_defaults["backoff"])),
+            max_delay=float(
+                os.getenv("MEALIE_RETRY_MAX_DELAY", cls._field_defaults["max_delay"])
+            ),
+        )
+
+    def should_retry(self, method: str, attempt: int, sent: bool) -> bool:
+        """Whether a failed attempt may be repeated.
+
+        Args:
+            method: HTTP method
+            attempt: Zero-based number of the attempt that failed
+            sent: False if the request never reached Mealie (connection refused)
+
+        Returns:
+            True if another attempt is allowed
+        """
+        if attempt >= self.retries:
+            return False
+        return not sent or method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Seconds to wait before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Delay in seconds, or None if the server asked for longer than max_delay
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        # Full jitter: spread concurrent retries over the whole window
+        return random.uniform(0, min(self.max_delay, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fail fast while Mealie keeps failing, probing periodically for recovery."""
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize a closed breaker.
+
+        Args:
+            threshold: Consecutive failures that open the circuit (0 disables it)
+            reset_timeout: Seconds to stay open before letting a probe through
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probing = False
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreaker":
+        """Build a breaker from MEALIE_BREAKER_THRESHOLD and MEALIE_BREAKER_RESET."""
+        return cls(
+            threshold=int(os.getenv("MEALIE_BREAKER_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("MEALIE_BREAKER_RESET", "30")),
+        )
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        if self.opened_at is None:
+            return CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now.
+
+        While half-open only one probe is let through at a time.
+
+        Returns:
+            False if the caller should fail fast
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    @property
+    def probing(self) -> bool:
+        """Whether a half-open probe is in flight."""
+        return self._probing
+
+    def release_probe(self) -> None:
+        """Give up a probe that never finished (e.g. was cancelled) without a verdict."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a response from Mealie."""
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening (or re-opening) the circuit past the threshold."""
+        self.failures += 1
+        if self._probing or (self.threshold and self.failures >= self.threshold):
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+    def stats(self) -> dict:
+        """Report the breaker's state.
+
+        Returns:
+            Dict with state, consecutive failures and seconds until the next probe
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "retry_in_seconds": round(self.retry_in(), 1),
+        }
@@ -0,0 +1,407 @@
+"""Optional local full-text index of the recipe library.
+
+Mealie's ``/recipes?search=`` only matches names and descriptions and costs
+a network round trip per query. When ``MEALIE_SEARCH_INDEX=true`` the server
+mirrors every recipe into an SQLite FTS5 table covering name, description,
+ingredients, instructions, tags, categories and nutrition, ranks matches
+with BM25, and answers search_recipes locally.
+
+The index is filled by sync(), which pages through recipes changed since the
+last sync (by ``dateUpdated``) and fetches each one in full; every
+``MEALIE_SEARCH_INDEX_RECONCILE`` seconds it lists the whole library instead
+to drop recipes deleted in Mealie. When the background SyncEngine runs, it
+feeds the index instead. Until the first sync completes, searches fall back
+to the Mealie API.
+"""
+
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from mealie_mcp.client import MealieClient, RecipeChanges, fetch_recipe_changes
+from mealie_mcp.models import ErrorResponse, Recipe
+
+# Where the index lives (":memory:" keeps it per-process)
+DEFAULT_INDEX_PATH = os.getenv("MEALIE_SEARCH_INDEX_PATH", ":memory:")
+
+# Seconds between background refreshes triggered by searches
+DEFAULT_REFRESH_SECONDS = float(os.getenv("MEALIE_SEARCH_INDEX_REFRESH", "300"))
+
+# Seconds between full listings that drop recipes deleted in Mealie
+DEFAULT_RECONCILE_SECONDS = float(os.getenv("MEALIE_SEARCH_INDEX_RECONCILE", "3600"))
+
+# BM25 column weights: name, description, ingredients, instructions, tags, categories, nutrition
+BM25_WEIGHTS = (10.0, 2.0, 4.0, 1.0, 5.0, 5.0, 1.0)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recipes (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    total_time TEXT,
+    rating INTEGER,
+    date_updated TEXT,
+    tags TEXT NOT NULL,
+    categories TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recipe_organizers (
+    recipe_rowid INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recipe_organizers ON recipe_organizers (kind, key);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS recipe_fts USING fts5(
+    name, description, ingredients, instructions, tags, categories, nutrition,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def search_index_enabled() -> bool:
+    """Check whether the local search index is turned on."""
+    return os.getenv("MEALIE_SEARCH_INDEX", "false").lower() == "true"
+
+
+def _fts_query(query: str) -> str | None:
+    """Turn free text into an FTS5 MATCH expression.
+
+    Every word must match; the last word also matches as a prefix so
+    partial input ("chick") still finds results.
+
+    Args:
+        query: User search text
+
+    Returns:
+        MATCH expression, or None if the query has no searchable words
+    """
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    terms = [f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+def _organizer_keys(values: list[str]) -> list[str]:
+    return [v.strip().lower() for v in values if v and v.strip()]
+
+
+class RecipeSearchIndex:
+    """SQLite FTS5 index of full recipes with tag/category filters."""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        """Open (or create) the index.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._sync_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0]
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    @property
+    def last_synced(self) -> float | None:
+        """Unix time of the last completed sync, if any."""
+        with self._lock:
+            value = self._get_meta("last_synced")
+        return float(value) if value else None
+
+    @property
+    def last_reconciled(self) -> float | None:
+        """Unix time of the last sync that listed the whole library, if any."""
+        with self._lock:
+            value = self._get_meta("last_reconciled")
+        return float(value) if value else None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether at least one sync has completed."""
+        return self.last_synced is not None
+
+    def _delete_rowid(self, rowid: int) -> None:
+        self._conn.execute("DELETE FROM recipes WHERE rowid = ?", (rowid,))
+        self._conn.execute("DELETE FROM recipe_fts WHERE rowid = ?", (rowid,))
+        self._conn.execute("DELETE FROM recipe_organizers WHERE recipe_rowid = ?", (rowid,))
+
+    def upsert(self, recipe: Recipe) -> None:
+        """Add or replace a recipe.
+
+        Args:
+            recipe: Full recipe from Mealie
+        """
+        ingredients = "\n".join(
+            i.display or i.note or i.original_text or i.food or "" for i in recipe.recipe_ingredient
+        )
+        instructions = "\n".join(
+            " ".join(filter(None, [step.title, step.text])) for step in recipe.recipe_instructions
+        )
+        nutrition = ""
+        if recipe.nutrition is not None:
+            nutrition = " ".join(
+                f"{field.replace('_', ' ')} {value}"
+                for field, value in recipe.nutrition.model_dump().items()
+                if value
+            )
+        tag_names = [t.name for t in recipe.tags]
+        category_names = [c.name for c in recipe.recipe_category]
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rowid FROM recipes WHERE id = ? OR slug = ?", (recipe.id, recipe.slug)
+            ).fetchone()
+            if row is not None:
+                self._delete_rowid(row[0])
+
+            cursor = self._conn.execute(
+                "INSERT INTO recipes (id, slug, name, description, total_time, rating, "
+                "date_updated, tags, categories) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    recipe.id,
+                    recipe.slug,
+                    recipe.name,
+                    recipe.description,
+                    recipe.total_time,
+                    recipe.rating,
+                    recipe.date_updated,
+                    json.dumps(tag_names),
+                    json.dumps(category_names),
+                ),
+            )
+            rowid = cursor.lastrowid
+            self._conn.execute(
+                "INSERT INTO recipe_fts (rowid, name, description, ingredients, instructions, "
+                "tags, categories, nutrition) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    rowid,
+                    recipe.name,
+                    recipe.description or "",
+                    ingredients,
+                    instructions,
+                    " ".join(tag_names),
+                    " ".join(category_names),
+                    nutrition,
+                ),
+            )
+            organizers = [
+                (rowid, "tag", key)
+                for t in recipe.tags
+                for key in {t.slug.lower(), t.name.lower()}
+            ] + [
+                (rowid, "category", key)
+                for c in recipe.recipe_category
+                for key in {c.slug.lower(), c.name.lower()}
+            ]
+            self._conn.executemany("INSERT INTO recipe_organizers VALUES (?, ?, ?)", organizers)
+            self._conn.commit()
+
+    def remove(self, slug_or_id: str) -> None:
+        """Remove a recipe by slug or ID.
+
+        Args:
+            slug_or_id: Recipe slug or UUID
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rowid FROM recipes WHERE id = ? OR slug = ?", (slug_or_id, slug_or_id)
+            ).fetchone()
+            if row is not None:
+                self._delete_rowid(row[0])
+                self._conn.commit()
+
+    def search(
+        self,
+        query: str | None = None,
+        tags: list[str] | None = None,
+        categories: list[str] | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Search the index.
+
+        Args:
+            query: Free text matched against every indexed field
+            tags: Keep recipes with any of these tag slugs/names
+            categories: Keep recipes with any of these category slugs/names
+            limit: Maximum number of results
+
+        Returns:
+            Recipe summaries (same shape as the search_recipes tool), best first
+        """
+        joins = []
+        where = []
+        params: list[Any] = []
+
+        match = _fts_query(query) if query else None
+        if match:
+            joins.append("JOIN recipe_fts ON recipe_fts.rowid = r.rowid")
+            where.append("recipe_fts MATCH ?")
+            params.append(match)
+            order = f"bm25(recipe_fts, {', '.join(str(w) for w in BM25_WEIGHTS)})"
+        else:
+            order = "r.name COLLATE NOCASE"
+
+        for kind, values in (("tag", tags), ("category", categories)):
+            keys = _organizer_keys(values or [])
+            if keys:
+                placeholders = ", ".join("?" for _ in keys)
+                where.append(
+                    "r.rowid IN (SELECT recipe_rowid FROM recipe_organizers "
+                    f"WHERE kind = ? AND key IN ({placeholders}))"
+                )
+                params.extend([kind, *keys])
+
+        sql = (
+            "SELECT r.id, r.slug, r.name, r.description, r.tags, r.categories, "
+            f"r.total_time, r.rating FROM recipes r {' '.join(joins)}"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "slug": row[1],
+                "name": row[2],
+                "description": row[3],
+                "tags": json.loads(row[4]),
+                "categories": json.loads(row[5]),
+                "total_time": row[6],
+                "rating": row[7],
+            }
+            for row in rows
+        ]
+
+    async def sync(
+        self,
+        client: MealieClient,
+        full: bool = False,
+        page_size: int = 200,
+        concurrency: int = 8,
+    ) -> dict[str, int] | ErrorResponse:
+        """Bring the index up to date with Mealie.
+
+        Incremental syncs only list recipes whose dateUpdated is newer than
+        the newest one already indexed. A full sync lists everything and
+        drops recipes that no longer exist. Either way, only recipes whose
+        dateUpdated differs from the indexed one are fetched.
+
+        Args:
+            client: MealieClient instance
+            full: List the whole library
+            page_size: Recipes per search page
+            concurrency: Maximum number of concurrent recipe fetches
+
+        Returns:
+            Counts of updated and removed recipes, or error
+        """
+        async with self._sync_lock:
+            with self._lock:
+                high_water = self._get_meta("high_water")
+                known = dict(self._conn.execute("SELECT id, date_updated FROM recipes"))
+
+            changes = await fetch_recipe_changes(
+                client, known, high_water, full=full, page_size=page_size, concurrency=concurrency
+            )
+            if isinstance(changes, ErrorResponse):
+                return changes
+
+            self.apply_changes(changes, reconciled=full)
+            return {"updated": len(changes.updated), "removed": len(changes.removed)}
+
+    def apply_changes(self, changes: RecipeChanges, reconciled: bool = False) -> None:
+        """Apply a fetch_recipe_changes result and record the sync.
+
+        Called by sync() and by the background SyncEngine when it feeds the
+        index directly.
+
+        Args:
+            changes: Recipes to upsert and IDs to remove, plus the new high-water mark
+            reconciled: The changes came from a full listing
+        """
+        for recipe in changes.updated:
+            self.upsert(recipe)
+        for recipe_id in changes.removed:
+            self.remove(recipe_id)
+
+        now = str(time.time())
+        with self._lock:
+            if changes.high_water:
+                self._set_meta("high_water", changes.high_water)
+            self._set_meta("last_synced", now)
+            if reconciled:
+                self._set_meta("last_reconciled", now)
+            self._conn.commit()
+
+    def schedule_refresh(
+        self,
+        client: MealieClient,
+        min_interval: float = DEFAULT_REFRESH_SECONDS,
+        reconcile_interval: float = DEFAULT_RECONCILE_SECONDS,
+    ) -> None:
+        """Start a background sync if the index is older than ``min_interval``.
+
+        The sync is a full one (dropping deleted recipes) when the index has
+        not been reconciled within ``reconcile_interval``.
+
+        Args:
+            client: MealieClient instance
+            min_interval: Minimum seconds between syncs
+            reconcile_interval: Maximum seconds between full syncs
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        now = time.time()
+        last = self.last_synced
+        if last is not None and now - last < min_interval:
+            return
+        reconciled = self.last_reconciled
+        full = reconciled is None or now - reconciled >= reconcile_interval
+        self._refresh_task = asyncio.create_task(self.sync(client, full=full))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global index instance
+_index: RecipeSearchIndex | None = None
+
+
+def get_search_index() -> RecipeSearchIndex | None:
+    """Get the global search index, or None when it is disabled."""
+    global _index
+    if not search_index_enabled():
+        return None
+    if _index is None:
+        _index = RecipeSearchIndex()
+    return _index
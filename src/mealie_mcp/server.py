@@ -1,25 +1,38 @@
 """Main MCP server entry point for Mealie integration."""
 
+import json
 import os
 import sys
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
-from fastmcp.server.auth.auth import ClientRegistrationOptions
-from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
-
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+from mealie_mcp.client import get_client
+from mealie_mcp.metrics import is_error_result, record_tool_call, render
+from mealie_mcp.models import ErrorResponse
+from mealie_mcp.sync import get_sync_engine
 from mealie_mcp.tools.mealplans import (
+    create_meal_plan_entries,
     create_meal_plan_entry,
     delete_meal_plan_entry,
+    generate_meal_plan,
     get_meal_plan,
 )
 from mealie_mcp.tools.planning_rules import get_meal_planning_rules
 from mealie_mcp.tools.recipes import (
     get_recipe,
+    get_recipes,
     list_categories,
     list_tags,
     search_recipes,
+    search_recipes_by_nutrition,
 )
 from mealie_mcp.tools.recipes_write import (
     add_recipe_note,
@@ -33,10 +46,12 @@ from mealie_mcp.tools.recipes_write import (
 )
 from mealie_mcp.tools.shopping import (
     add_to_shopping_list,
+    build_shopping_list,
     clear_checked_items,
     get_shopping_list,
     get_shopping_lists,
 )
+from mealie_mcp.tracing import annotate, setup_tracing, span
 
 # Load environment variables
 load_dotenv()
@@ -49,7 +64,11 @@ if os.getenv("MCP_REQUIRE_AUTH", "false").lower() == "true":
         print("Error: MCP_BASE_URL required when MCP_REQUIRE_AUTH=true", file=sys.stderr)
         print("Example: MCP_BASE_URL=https://rainworth-server.tailbf31d9.ts.net", file=sys.stderr)
         sys.exit(1)
-    
+
+    # Imported here so stdio starts (no auth) don't load the OAuth stack
+    from fastmcp.server.auth.auth import ClientRegistrationOptions
+    from fastmcp.server.auth.providers.in_memory import InMemoryOAuthProvider
+
     auth_provider = InMemoryOAuthProvider(
         base_url=base_url,
         client_registration_options=ClientRegistrationOptions(
@@ -59,10 +78,51 @@ if os.getenv("MCP_REQUIRE_AUTH", "false").lower() == "true":
     )
     print(f"OAuth enabled with Dynamic Client Registration at {base_url}", file=sys.stderr)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Run the background sync engine for the server's lifetime, if enabled."""
+    engine = get_sync_engine()
+    if engine is not None:
+        engine.start()
+        print(f"Background sync every {engine.interval_seconds:g}s", file=sys.stderr)
+    try:
+        yield {}
+    finally:
+        if engine is not None:
+            await engine.stop()
+
+
+class MetricsMiddleware(Middleware):
+    """Record latency and outcome of every tool call for /metrics and tracing."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        """Time the call under the tool's name."""
+        name = context.message.name
+        start = time.perf_counter()
+        structured = None  # stays None if the tool raises
+        with span(f"tool {name}", **{"mcp.tool.name": name}) as tool_span:
+            try:
+                result = await call_next(context)
+                structured = result.structured_content or {}
+                return result
+            finally:
+                record_tool_call(name, structured, time.perf_counter() - start)
+                if tool_span is not None and structured is not None:
+                    annotate(
+                        tool_span,
+                        **{
+                            "mcp.tool.error": is_error_result(structured),
+                            "mcp.tool.result_size": len(json.dumps(structured, default=str)),
+                        },
+                    )
+
+
 # Create the MCP server
 mcp = FastMCP(
     name="mealie",
     auth=auth_provider,  # Pass auth provider to FastMCP
+    lifespan=lifespan,
     instructions="""You are connected to a personal Mealie recipe library.
 You can search recipes, view details, create/edit recipes, manage meal plans, and work with shopping lists.
 
@@ -98,7 +158,9 @@ Use create_recipe directly, but you MUST:
 
 **Recipe Search:**
 - search_recipes: Find by name, tags, or categories
+- search_recipes_by_nutrition: Filter the whole library by macros/time (e.g. "calories<600 AND protein>=35")
 - get_recipe: Get full details with ingredients/instructions
+- get_recipes: Get full details for several recipes in one call (prefer over repeated get_recipe)
 - list_tags, list_categories: Get available filters
 
 **Cooking Tracking:**
@@ -109,14 +171,91 @@ Use create_recipe directly, but you MUST:
 **Meal Planning:**
 - get_meal_plan: View planned meals
 - create_meal_plan_entry: Add to meal plan
+- create_meal_plan_entries: Add many entries (e.g. a whole week) in one call
 - delete_meal_plan_entry: Remove from plan
 - get_meal_planning_rules: Get configured rules and macro requirements (ALWAYS call this before generating a meal plan)
+- generate_meal_plan: Build a whole plan that meets the daily macros in one call, then save it with create_meal_plan_entries
 
 **Shopping:**
 - get_shopping_list, get_shopping_lists: View items
 - add_to_shopping_list: Add ingredients
+- build_shopping_list: Add the combined ingredients for a meal plan period in one call
 - clear_checked_items: Remove purchased""",
 )
+mcp.add_middleware(MetricsMiddleware())
+
+
+# Operational endpoints (http transport only; not behind OAuth)
+@mcp.custom_route("/health", methods=["GET"])
+async def health(request: Request) -> Response:
+    """Liveness: the server process is up."""
+    return JSONResponse({"status": "ok"})
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def ready(request: Request) -> Response:
+    """Readiness: Mealie answers and background sync (if enabled) has completed a cycle."""
+    checks: dict[str, Any] = {}
+
+    result = await get_client().about()
+    checks["mealie"] = result.message if isinstance(result, ErrorResponse) else "ok"
+
+    engine = get_sync_engine()
+    if engine is not None:
+        checks["sync"] = "ok" if engine.cycles else "waiting for first sync"
+        checks["sync_freshness"] = engine.freshness()
+
+    is_ready = checks["mealie"] == "ok" and checks.get("sync", "ok") == "ok"
+    return JSONResponse(
+        {"status": "ready" if is_ready else "not ready", "checks": checks},
+        status_code=200 if is_ready else 503,
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Prometheus metrics: tool and Mealie latency plus client and sync counters and gauges."""
+    client = get_client()
+    coalescing = client.coalescing_stats()
+    resilience = client.resilience_stats()
+    counters = {
+        "mealie_mcp_mealie_requests_coalesced_total": (
+            "GETs served by another caller's in-flight request",
+            coalescing["coalesced"],
+        ),
+        "mealie_mcp_mealie_retries_total": (
+            "Retries of transient failures",
+            resilience["retries"],
+        ),
+        "mealie_mcp_mealie_short_circuited_total": (
+            "Requests failed fast by the circuit breaker",
+            resilience["short_circuited"],
+        ),
+    }
+    gauges = {
+        "mealie_mcp_mealie_requests_in_flight": (
+            "Coalescable GETs currently in flight",
+            coalescing["in_flight"],
+        ),
+        "mealie_mcp_circuit_open": (
+            "1 while the circuit breaker is failing fast",
+            int(resilience["circuit"]["state"] == "open"),
+        ),
+    }
+    engine = get_sync_engine()
+    if engine is not None:
+        freshness = engine.freshness()
+        counters["mealie_mcp_sync_cycles_total"] = (
+            "Completed background sync cycles",
+            freshness["cycles"],
+        )
+        for name, status in freshness["resources"].items():
+            if status["age_seconds"] is not None:
+                gauges[f"mealie_mcp_sync_{name}_age_seconds"] = (
+                    f"Seconds since {name} last synced",
+                    status["age_seconds"],
+                )
+    return PlainTextResponse(render(gauges, counters), media_type="text/plain; version=0.0.4")
 
 
 # Register recipe tools
@@ -141,6 +280,32 @@ async def tool_search_recipes(
     return await search_recipes(query, tags, categories, limit)
 
 
+@mcp.tool()
+async def tool_search_recipes_by_nutrition(
+    filter: str,
+    sort_by: str | None = None,
+    descending: bool = False,
+    limit: int = 20,
+) -> list[dict] | dict:
+    """Find recipes whose nutrition or cooking time falls within ranges.
+
+    Use this instead of fetching recipes one by one to compare nutrition.
+
+    Args:
+        filter: Conditions joined by AND/OR (e.g., "calories<600 AND protein>=35").
+            Fields: calories (kcal), protein, carbs, fat, fiber, sugar, saturated_fat,
+            trans_fat, unsaturated_fat (g), sodium, cholesterol (mg),
+            prep_minutes, total_minutes
+        sort_by: Field to order results by (e.g., "protein")
+        descending: Sort largest first
+        limit: Maximum number of results to return (default 20)
+
+    Returns:
+        List of matching recipes with id, slug, name and their parsed nutrition values
+    """
+    return await search_recipes_by_nutrition(filter, sort_by, descending, limit)
+
+
 @mcp.tool()
 async def tool_get_recipe(slug: str) -> dict:
     """Get full recipe details including ingredients and instructions.
@@ -154,6 +319,22 @@ async def tool_get_recipe(slug: str) -> dict:
     return await get_recipe(slug)
 
 
+@mcp.tool()
+async def tool_get_recipes(slugs: list[str]) -> dict:
+    """Get full details for several recipes in one call.
+
+    Prefer this over calling get_recipe repeatedly (e.g., when planning a week).
+
+    Args:
+        slugs: Recipe slugs or IDs (up to 50)
+
+    Returns:
+        Dict with 'recipes' (full details, in request order) and 'errors'
+        (slug -> error for any that couldn't be fetched)
+    """
+    return await get_recipes(slugs)
+
+
 @mcp.tool()
 async def tool_list_tags() -> list[dict] | dict:
     """Get all available tags for filtering recipes.
@@ -208,6 +389,27 @@ async def tool_create_meal_plan_entry(
     return await create_meal_plan_entry(date, recipe_slug, meal_type)
 
 
+@mcp.tool()
+async def tool_create_meal_plan_entries(
+    entries: list[dict],
+    rollback_on_error: bool = False,
+) -> dict:
+    """Add many recipes to the meal plan in one call (e.g., a whole week).
+
+    Prefer this over repeated create_meal_plan_entry calls.
+
+    Args:
+        entries: Items with "date" (YYYY-MM-DD), "recipe_slug" and optional
+            "meal_type" (breakfast, lunch, dinner, side, snack; default dinner)
+        rollback_on_error: Delete the entries created by this call if any entry fails
+
+    Returns:
+        Dict with 'results' (one per entry, in order, each with 'success' and
+        'entry' or 'error'), counts, and whether a rollback happened
+    """
+    return await create_meal_plan_entries(entries, rollback_on_error)
+
+
 @mcp.tool()
 async def tool_delete_meal_plan_entry(entry_id: str) -> dict:
     """Remove an entry from the meal plan.
@@ -221,6 +423,38 @@ async def tool_delete_meal_plan_entry(entry_id: str) -> dict:
     return await delete_meal_plan_entry(entry_id)
 
 
+@mcp.tool()
+async def tool_generate_meal_plan(
+    start_date: str | None = None,
+    days: int = 7,
+    tolerance: float = 0.1,
+    easy_days: list[str] | None = None,
+    easy_max_minutes: int = 20,
+    takeout_days: list[str] | None = None,
+) -> dict:
+    """Build a breakfast/lunch/dinner plan that meets the daily macro targets.
+
+    Picks recipes so each day's calories, protein, carbs and fat land close to
+    the targets from get_meal_planning_rules. Dinners avoid repeating a main
+    protein on consecutive days, and easy-day dinners stay under the prep cap.
+    Review the plan with the user, then save it with create_meal_plan_entries.
+
+    Args:
+        start_date: First day in ISO format (YYYY-MM-DD), default today
+        days: Number of days to plan (1-14)
+        tolerance: Allowed relative deviation per macro (0.1 = within 10%)
+        easy_days: Weekdays whose dinner must be quick (default: monday, tuesday)
+        easy_max_minutes: Maximum prep time for easy-day dinners
+        takeout_days: Weekdays with no dinner to plan (e.g., ["thursday", "friday"])
+
+    Returns:
+        Plan with per-day meals, macro totals vs targets, and whether each day is within tolerance
+    """
+    return await generate_meal_plan(
+        start_date, days, tolerance, easy_days, easy_max_minutes, takeout_days
+    )
+
+
 @mcp.tool()
 async def tool_get_meal_planning_rules() -> dict:
     """Get the configured meal planning rules and daily macro requirements.
@@ -277,6 +511,32 @@ async def tool_add_to_shopping_list(
     return await add_to_shopping_list(items, list_id)
 
 
+@mcp.tool()
+async def tool_build_shopping_list(
+    start_date: str,
+    end_date: str,
+    list_id: str | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Add everything needed for a meal plan period to a shopping list.
+
+    Combines the ingredients of every planned recipe (e.g. 3 x "200g chicken
+    breast" -> "600 g chicken breast"), skips what is already on the list,
+    and adds the rest in one call. Prefer this over fetching each recipe and
+    calling add_to_shopping_list.
+
+    Args:
+        start_date: Start date in ISO format (YYYY-MM-DD)
+        end_date: End date in ISO format (YYYY-MM-DD)
+        list_id: Target shopping list ID. If not provided, uses the first available list.
+        dry_run: Return the items without adding them
+
+    Returns:
+        Items added (or to add), items already covered by the list, and the recipes used
+    """
+    return await build_shopping_list(start_date, end_date, list_id, dry_run)
+
+
 @mcp.tool()
 async def tool_clear_checked_items(list_id: str | None = None) -> dict:
     """Remove all checked items from a shopping list.
@@ -528,6 +788,14 @@ def main():
         print("Error: MEALIE_TOKEN environment variable is required", file=sys.stderr)
         sys.exit(1)
 
+    try:
+        tracing_mode = setup_tracing()
+    except (ImportError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if tracing_mode:
+        print(f"Tracing: exporting spans via {tracing_mode}", file=sys.stderr)
+
     # Determine transport from environment
     transport = os.getenv("MCP_TRANSPORT", "stdio")
 
@@ -561,7 +829,9 @@ def main():
     else:
         # stdio transport for Claude Desktop (default)
         print("Running in stdio mode for Claude Desktop", file=sys.stderr)
-        mcp.run()
+        # No banner: it goes unseen in stdio mode and blocks startup on a PyPI
+        # version check (up to 2s, repeated on every launch while offline)
+        mcp.run(show_banner=False)
 
 
 if __name__ == "__main__":
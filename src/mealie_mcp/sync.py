@@ -0,0 +1,403 @@
+"""Background sync engine that mirrors the Mealie library locally.
+
+When ``MEALIE_SYNC=true`` the server runs a SyncEngine alongside the MCP
+transport. Every ``MEALIE_SYNC_INTERVAL`` seconds it:
+
+- fetches recipes updated since the newest ``dateUpdated`` it has seen
+  (one ``queryFilter`` search, paginated) and loads each in full,
+- periodically reconciles the recipe list to drop deleted recipes,
+- reloads tags/categories into the shared OrganizerIndex,
+- fetches meal plan entries in a window around today that were updated
+  since the previous cycle, and shopping lists whose ``updatedAt`` moved;
+  reconcile cycles (and a new day, for meal plans) reload them in full.
+
+The recipe high-water mark and mirror are checkpointed to
+``MEALIE_SYNC_STATE_PATH`` (if set) off the event loop whenever recipes
+change, so a restart resumes incrementally.
+Changed recipes are pushed into the local search index when it is enabled.
+freshness() reports the age and size of each mirrored resource.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from mealie_mcp.client import MealieClient, fetch_recipe_changes, get_client
+from mealie_mcp.models import ErrorResponse, MealPlanEntry, Recipe, ShoppingList
+from mealie_mcp.organizers import OrganizerIndex, get_organizer_index
+from mealie_mcp.search_index import RecipeSearchIndex, get_search_index
+
+# Seconds between sync cycles
+DEFAULT_INTERVAL_SECONDS = float(os.getenv("MEALIE_SYNC_INTERVAL", "300"))
+
+# JSON checkpoint for the recipe mirror (unset keeps it in memory only)
+DEFAULT_STATE_PATH = os.getenv("MEALIE_SYNC_STATE_PATH")
+
+# Run a full recipe reconcile (deletion check) every N cycles
+DEFAULT_RECONCILE_EVERY = 12
+
+# Meal plan window mirrored around today
+MEAL_PLAN_PAST_DAYS = 7
+MEAL_PLAN_FUTURE_DAYS = 28
+
+# Overlap between incremental meal plan fetches, covering clock skew with Mealie
+MEAL_PLAN_OVERLAP_SECONDS = 120
+
+RESOURCES = ("recipes", "organizers", "meal_plans", "shopping_lists")
+
+
+def sync_enabled() -> bool:
+    """Check whether the background sync engine is turned on."""
+    return os.getenv("MEALIE_SYNC", "false").lower() == "true"
+
+
+class SyncEngine:
+    """Local mirror of recipes, organizers, meal plans and shopping lists."""
+
+    def __init__(
+        self,
+        client: MealieClient | None = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        state_path: str | Path | None = DEFAULT_STATE_PATH,
+        organizers: OrganizerIndex | None = None,
+        search_index: RecipeSearchIndex | None = None,
+        page_size: int = 200,
+        concurrency: int = 8,
+        reconcile_every: int = DEFAULT_RECONCILE_EVERY,
+    ):
+        """Initialize an empty mirror, loading the checkpoint if there is one.
+
+        Args:
+            client: MealieClient to use (defaults to the global client)
+            interval_seconds: Seconds between sync cycles
+            state_path: JSON checkpoint file, or None to keep state in memory
+            organizers: Organizer index to refresh (defaults to the global one)
+            search_index: Search index to feed (defaults to the global one, if enabled)
+            page_size: Recipes per search page
+            concurrency: Maximum number of concurrent requests per resource
+            reconcile_every: Cycles between full recipe reconciles
+        """
+        self._client = client
+        self.interval_seconds = interval_seconds
+        self.state_path = Path(state_path) if state_path else None
+        self.organizers = organizers or get_organizer_index()
+        self.search_index = search_index if search_index is not None else get_search_index()
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.reconcile_every = reconcile_every
+
+        self.recipes: dict[str, Recipe] = {}  # id -> recipe
+        self.meal_plans: dict[str, MealPlanEntry] = {}  # id -> entry
+        self.shopping_lists: dict[str, ShoppingList] = {}  # id -> list
+        self.high_water: str | None = None
+        self.cycles = 0
+        self._meal_plan_window: tuple[str, str] | None = None
+        self._meal_plans_since: float | None = None
+
+        self._status: dict[str, dict[str, Any]] = {
+            name: {"last_success": None, "last_error": None, "changed": 0} for name in RESOURCES
+        }
+        self._cycle_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+        self._load_checkpoint()
+
+    @property
+    def client(self) -> MealieClient:
+        """The MealieClient used for sync requests."""
+        return self._client or get_client()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def _load_checkpoint(self) -> None:
+        if self.state_path is None or not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            recipes = [Recipe.model_validate(r) for r in state.get("recipes", [])]
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable sync checkpoint {self.state_path}: {e}", file=sys.stderr)
+            return
+
+        self.recipes = {r.id: r for r in recipes}
+        self.high_water = state.get("high_water")
+        if self.search_index is not None:
+            for recipe in recipes:
+                self.search_index.upsert(recipe)
+
+    def _write_checkpoint(self, high_water: str | None, recipes: list[Recipe]) -> None:
+        """Write the recipe mirror and high-water mark atomically."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "high_water": high_water,
+            "recipes": [r.model_dump(mode="json", by_alias=True) for r in recipes],
+        }
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        tmp_path.replace(self.state_path)
+
+    async def _save_checkpoint(self) -> None:
+        """Checkpoint the recipe mirror in a worker thread."""
+        if self.state_path is None:
+            return
+        await asyncio.to_thread(
+            self._write_checkpoint, self.high_water, list(self.recipes.values())
+        )
+
+    async def sync_recipes(self, full: bool = False) -> int | ErrorResponse:
+        """Fetch recipes changed since the high-water mark.
+
+        Args:
+            full: List every recipe and drop any that no longer exist
+
+        Returns:
+            Number of recipes added, updated or removed, or error
+        """
+        changes = await fetch_recipe_changes(
+            self.client,
+            {r.id: r.date_updated for r in self.recipes.values()},
+            self.high_water,
+            full=full,
+            page_size=self.page_size,
+            concurrency=self.concurrency,
+        )
+        if isinstance(changes, ErrorResponse):
+            return changes
+
+        for recipe in changes.updated:
+            self.recipes[recipe.id] = recipe
+        for recipe_id in changes.removed:
+            del self.recipes[recipe_id]
+        moved = changes.high_water != self.high_water
+        self.high_water = changes.high_water
+
+        if self.search_index is not None:
+            self.search_index.apply_changes(changes, reconciled=full)
+
+        changed = len(changes.updated) + len(changes.removed)
+        if changed or moved:
+            await self._save_checkpoint()
+        return changed
+
+    async def sync_organizers(self) -> int | ErrorResponse:
+        """Reload tags and categories into the organizer index.
+
+        Returns:
+            Number of tags and categories, or error
+        """
+        error = await self.organizers.ensure_loaded(force=True)
+        if error is not None:
+            return error
+        return len(self.organizers.tags) + len(self.organizers.categories)
+
+    async def sync_meal_plans(self, full: bool = False) -> int | ErrorResponse:
+        """Fetch meal plan entries around today that changed since the last cycle.
+
+        Entries carry no timestamp, so incremental cycles filter on Mealie's
+        ``updateAt`` column from the previous fetch (minus a small overlap)
+        and merge the results. Full reloads, needed to see deletions, run on
+        reconcile cycles, when the window moves to a new day, or if Mealie
+        rejects the filter.
+
+        Args:
+            full: Reload the whole window
+
+        Returns:
+            Number of entries added, changed or removed, or error
+        """
+        today = date.today()
+        window = (
+            (today - timedelta(days=MEAL_PLAN_PAST_DAYS)).isoformat(),
+            (today + timedelta(days=MEAL_PLAN_FUTURE_DAYS)).isoformat(),
+        )
+        started = time.time()
+
+        entries: list[MealPlanEntry] | ErrorResponse | None = None
+        incremental = (
+            not full and window == self._meal_plan_window and self._meal_plans_since is not None
+        )
+        if incremental:
+            since = datetime.fromtimestamp(
+                self._meal_plans_since - MEAL_PLAN_OVERLAP_SECONDS, UTC
+            ).strftime("%Y-%m-%dT%H:%M:%S")
+            entries = await self.client.get_meal_plan(*window, query_filter=f'updateAt > "{since}"')
+            if isinstance(entries, ErrorResponse):
+                incremental = False
+        if not incremental:
+            entries = await self.client.get_meal_plan(*window)
+        if isinstance(entries, ErrorResponse):
+            return entries
+
+        fetched = {str(e.id): e for e in entries}
+        mirrored = {**self.meal_plans, **fetched} if incremental else fetched
+        changed = len(mirrored.keys() ^ self.meal_plans.keys()) + sum(
+            1
+            for entry_id, entry in fetched.items()
+            if entry_id in self.meal_plans and self.meal_plans[entry_id] != entry
+        )
+        self.meal_plans = mirrored
+        self._meal_plan_window = window
+        self._meal_plans_since = started
+        return changed
+
+    async def sync_shopping_lists(self, full: bool = False) -> int | ErrorResponse:
+        """Fetch shopping lists whose ``updatedAt`` changed, with their items.
+
+        The list summaries are read every cycle; a list is fetched in full
+        only if it is new, its timestamp moved or Mealie reports none.
+
+        Args:
+            full: Fetch every list
+
+        Returns:
+            Number of lists added, changed or removed, or error
+        """
+        summaries = await self.client.get_shopping_lists()
+        if isinstance(summaries, ErrorResponse):
+            return summaries
+
+        stale = [
+            s
+            for s in summaries
+            if full
+            or s.updated_at is None
+            or s.id not in self.shopping_lists
+            or self.shopping_lists[s.id].updated_at != s.updated_at
+        ]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(list_id: str) -> ShoppingList | ErrorResponse:
+            async with semaphore:
+                return await self.client.get_shopping_list(list_id)
+
+        lists = await asyncio.gather(*(fetch(s.id) for s in stale))
+        for result in lists:
+            if isinstance(result, ErrorResponse):
+                return result
+
+        listed = {s.id for s in summaries}
+        mirrored = {list_id: sl for list_id, sl in self.shopping_lists.items() if list_id in listed}
+        mirrored.update((sl.id, sl) for sl in lists)
+        changed = len(mirrored.keys() ^ self.shopping_lists.keys()) + sum(
+            1 for sl in lists if sl.id in self.shopping_lists and self.shopping_lists[sl.id] != sl
+        )
+        self.shopping_lists = mirrored
+        return changed
+
+    async def run_once(self, full: bool = False) -> dict[str, int | dict]:
+        """Run one sync cycle over every resource.
+
+        Resources sync concurrently; a failure in one doesn't stop the others.
+
+        Args:
+            full: Force a full reconcile of recipes, meal plans and shopping lists
+
+        Returns:
+            Per-resource change counts, or the error for failed resources
+        """
+        async with self._cycle_lock:
+            full = full or not self.recipes or self.cycles % self.reconcile_every == 0
+            results = await asyncio.gather(
+                self.sync_recipes(full=full),
+                self.sync_organizers(),
+                self.sync_meal_plans(full=full),
+                self.sync_shopping_lists(full=full),
+                return_exceptions=True,
+            )
+            self.cycles += 1
+
+            summary: dict[str, int | dict] = {}
+            now = time.time()
+            for name, result in zip(RESOURCES, results, strict=True):
+                status = self._status[name]
+                if isinstance(result, BaseException):
+                    result = ErrorResponse.api_error(f"Sync failed: {result}")
+                if isinstance(result, ErrorResponse):
+                    status["last_error"] = result.message
+                    summary[name] = result.model_dump()
+                else:
+                    status["last_success"] = now
+                    status["last_error"] = None
+                    status["changed"] = result
+                    summary[name] = result
+            return summary
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:  # keep the loop alive whatever happens
+                print(f"Sync cycle failed: {e}", file=sys.stderr)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the background sync loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the background sync loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def freshness(self) -> dict[str, Any]:
+        """Report how current each mirrored resource is.
+
+        Returns:
+            Dict with per-resource age/size/error, the recipe high-water mark,
+            cycle count and whether the loop is running
+        """
+        now = time.time()
+        sizes = {
+            "recipes": len(self.recipes),
+            "organizers": len(self.organizers.tags) + len(self.organizers.categories),
+            "meal_plans": len(self.meal_plans),
+            "shopping_lists": len(self.shopping_lists),
+        }
+        resources = {}
+        for name in RESOURCES:
+            status = self._status[name]
+            last_success = status["last_success"]
+            resources[name] = {
+                "items": sizes[name],
+                "changed_last_cycle": status["changed"],
+                "age_seconds": round(now - last_success, 1) if last_success else None,
+                "last_error": status["last_error"],
+            }
+        return {
+            "running": self.running,
+            "cycles": self.cycles,
+            "interval_seconds": self.interval_seconds,
+            "recipe_high_water": self.high_water,
+            "resources": resources,
+        }
+
+
+# Global engine instance
+_engine: SyncEngine | None = None
+
+
+def get_sync_engine() -> SyncEngine | None:
+    """Get the global sync engine, or None when sync is disabled."""
+    global _engine
+    if not sync_enabled():
+        return None
+    if _engine is None:
+        _engine = SyncEngine()
+    return _engine
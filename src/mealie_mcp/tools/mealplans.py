@@ -1,7 +1,19 @@
 """Meal planning MCP tools."""
 
+import asyncio
+from datetime import date as date_type
+from datetime import timedelta
+
 from mealie_mcp.client import get_client
-from mealie_mcp.models import ErrorResponse, MealType
+from mealie_mcp.models import ErrorResponse, MealPlanEntry, MealType
+from mealie_mcp.nutrition import MACROS
+from mealie_mcp.portal.rules import get_macros
+
+# Concurrent Mealie writes for create_meal_plan_entries
+BULK_CONCURRENCY = 8
+
+# Maximum entries per create_meal_plan_entries call
+MAX_BULK_ENTRIES = 60
 
 
 async def get_meal_plan(start_date: str, end_date: str) -> list[dict] | dict:
@@ -44,6 +56,24 @@ async def get_meal_plan(start_date: str, end_date: str) -> list[dict] | dict:
     return entries
 
 
+def _format_entry(entry: MealPlanEntry) -> dict:
+    """Format a created meal plan entry for tool output."""
+    entry_data = {
+        "id": entry.id,
+        "date": entry.date.isoformat(),
+        "meal_type": entry.entry_type.value,
+        "recipe_id": entry.recipe_id,
+    }
+
+    if entry.recipe:
+        entry_data["recipe"] = {
+            "name": entry.recipe.name,
+            "slug": entry.recipe.slug,
+        }
+
+    return entry_data
+
+
 async def create_meal_plan_entry(
     date: str,
     recipe_slug: str,
@@ -74,20 +104,108 @@ async def create_meal_plan_entry(
     if isinstance(result, ErrorResponse):
         return result.model_dump()
 
-    entry_data = {
-        "id": result.id,
-        "date": result.date.isoformat(),
-        "meal_type": result.entry_type.value,
-        "recipe_id": result.recipe_id,
-    }
+    return _format_entry(result)
 
-    if result.recipe:
-        entry_data["recipe"] = {
-            "name": result.recipe.name,
-            "slug": result.recipe.slug,
+
+async def create_meal_plan_entries(entries: list[dict], rollback_on_error: bool = False) -> dict:
+    """Add many recipes to the meal plan in one call.
+
+    Every entry is validated before anything is written, recipe slugs are
+    resolved in one batch, and entries are created concurrently.
+
+    Args:
+        entries: Items with "date" (YYYY-MM-DD), "recipe_slug" and optional
+            "meal_type" (breakfast, lunch, dinner, side, snack; default dinner)
+        rollback_on_error: Delete the entries created by this call if any entry fails
+
+    Returns:
+        Dict with 'results' (one per entry, in order, each with 'success' and
+        'entry' or 'error'), counts, and whether a rollback happened
+    """
+    if not entries:
+        return ErrorResponse.validation_error("No entries provided").model_dump()
+    if len(entries) > MAX_BULK_ENTRIES:
+        return ErrorResponse.validation_error(
+            f"At most {MAX_BULK_ENTRIES} entries per call (got {len(entries)})"
+        ).model_dump()
+
+    # Validate everything up front so bad input never causes partial writes
+    valid_types = [mt.value for mt in MealType]
+    problems = []
+    for i, entry in enumerate(entries):
+        meal_type = entry.get("meal_type", "dinner")
+        if not entry.get("recipe_slug"):
+            problems.append(f"entry {i}: missing recipe_slug")
+        try:
+            date_type.fromisoformat(str(entry.get("date")))
+        except ValueError:
+            problems.append(f"entry {i}: invalid date '{entry.get('date')}'")
+        if meal_type not in valid_types:
+            problems.append(f"entry {i}: invalid meal_type '{meal_type}'")
+    if problems:
+        return ErrorResponse.validation_error(
+            f"{'; '.join(problems)}. meal_type must be one of: {', '.join(valid_types)}"
+        ).model_dump()
+
+    client = get_client()
+    refs = await client.resolve_recipe_refs([e["recipe_slug"] for e in entries])
+
+    results: list[dict] = [{} for _ in entries]
+    to_create = []
+    for i, entry in enumerate(entries):
+        ref = refs[entry["recipe_slug"]]
+        if isinstance(ref, ErrorResponse):
+            results[i] = {"success": False, "error": ref.model_dump()}
+        else:
+            to_create.append((i, entry, ref))
+
+    if rollback_on_error and len(to_create) < len(entries):
+        # Unresolvable recipes - don't write a partial plan
+        for i, _, _ in to_create:
+            results[i] = {"success": False, "error": {"code": "SKIPPED", "message": "Not created"}}
+        return {"results": results, "created": 0, "failed": len(entries), "rolled_back": False}
+
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def create(entry: dict, recipe_id: str):
+        async with semaphore:
+            return await client.create_meal_plan_entry(
+                entry["date"], recipe_id, entry.get("meal_type", "dinner")
+            )
+
+    created = await asyncio.gather(*(create(entry, ref.id) for _, entry, ref in to_create))
+    for (i, _, _), result in zip(to_create, created, strict=True):
+        if isinstance(result, ErrorResponse):
+            results[i] = {"success": False, "error": result.model_dump()}
+        else:
+            results[i] = {"success": True, "entry": _format_entry(result)}
+
+    failed = sum(not r["success"] for r in results)
+    rolled_back = False
+    if failed and rollback_on_error:
+        created_ids = [str(r["entry"]["id"]) for r in results if r["success"]]
+
+        async def delete(entry_id: str):
+            async with semaphore:
+                return await client.delete_meal_plan_entry(entry_id)
+
+        deletions = await asyncio.gather(*(delete(entry_id) for entry_id in created_ids))
+        deleted = {
+            entry_id
+            for entry_id, d in zip(created_ids, deletions, strict=True)
+            if not isinstance(d, ErrorResponse)
         }
+        for result in results:
+            if result["success"]:
+                result["rolled_back"] = str(result["entry"]["id"]) in deleted
+        rolled_back = len(deleted) == len(created_ids)
 
-    return entry_data
+    return {
+        "results": results,
+        "created": sum(r["success"] and not r.get("rolled_back") for r in results),
+        "failed": failed,
+        "rolled_back": rolled_back,
+    }
 
 
 async def delete_meal_plan_entry(entry_id: str) -> dict:
@@ -106,3 +224,112 @@ async def delete_meal_plan_entry(entry_id: str) -> dict:
         return result.model_dump()
 
     return result
+
+
+async def generate_meal_plan(
+    start_date: str | None = None,
+    days: int = 7,
+    tolerance: float = 0.1,
+    easy_days: list[str] | None = None,
+    easy_max_minutes: int = 20,
+    takeout_days: list[str] | None = None,
+) -> dict:
+    """Build a breakfast/lunch/dinner plan that meets the daily macro targets.
+
+    Targets come from the meal planning rules (get_meal_planning_rules).
+    Only recipes with calories, protein, carbs and fat are considered.
+
+    Args:
+        start_date: First day in ISO format (YYYY-MM-DD), default today
+        days: Number of days to plan (1-14)
+        tolerance: Relative deviation per macro reported as within tolerance
+            (0.1 = within 10%). Only affects the report; the optimizer always
+            minimizes the squared relative deviation from the targets.
+        easy_days: Weekdays whose dinner must be quick (default: monday, tuesday)
+        easy_max_minutes: Maximum prep time for easy-day dinners
+        takeout_days: Weekdays with no dinner to plan (e.g., ["thursday", "friday"])
+
+    Returns:
+        Plan with per-day meals, macro totals vs targets, and whether each day is within tolerance
+    """
+    try:
+        from mealie_mcp import nutrition_store, planner
+    except ImportError as e:
+        return ErrorResponse(code="DEPENDENCY_ERROR", message=str(e)).model_dump()
+
+    if not 1 <= days <= 14:
+        return ErrorResponse.validation_error("days must be between 1 and 14").model_dump()
+    try:
+        start = date_type.fromisoformat(start_date) if start_date else date_type.today()
+    except ValueError:
+        return ErrorResponse.validation_error(
+            f"Invalid start_date '{start_date}'. Use YYYY-MM-DD"
+        ).model_dump()
+
+    recipes = await nutrition_store.load_recipes(get_client())
+    if isinstance(recipes, ErrorResponse):
+        return recipes.model_dump()
+
+    matrix = planner.get_matrix(nutrition_store.get_nutrition_store(recipes))
+    if not len(matrix):
+        return ErrorResponse.validation_error(
+            "No recipes have calories, protein, carbs and fat to plan with"
+        ).model_dump()
+
+    macros = get_macros()
+    dates = [start + timedelta(days=i) for i in range(days)]
+    weekdays = {d.strftime("%A").lower() for d in dates}
+    incomplete = sorted(
+        day for day in weekdays if not all(m in macros.get(day, {}) for m in MACROS)
+    )
+    if incomplete:
+        return ErrorResponse.validation_error(
+            f"No calories/protein/carbs/fat targets for {', '.join(incomplete)}. "
+            "Set them in the rules portal."
+        ).model_dump()
+    targets = [(d, macros[d.strftime("%A").lower()]) for d in dates]
+    takeout = {day.lower() for day in takeout_days or []}
+    skip = {d: {"dinner"} for d in dates if d.strftime("%A").lower() in takeout}
+    easy = {day.lower() for day in (easy_days if easy_days is not None else ["monday", "tuesday"])}
+
+    plan = planner.generate_plan(
+        matrix,
+        targets,
+        skip=skip,
+        easy_weekdays=easy,
+        easy_max_minutes=easy_max_minutes,
+    )
+
+    result_days = []
+    for day in plan:
+        meals = {}
+        for slot, row in day["picks"].items():
+            recipe = matrix.recipes[row]
+            meals[slot] = {
+                "slug": recipe.slug,
+                "name": recipe.name,
+                **{m: round(v, 1) for m, v in zip(MACROS, matrix.macros[row], strict=True)},
+            }
+        deviation = {
+            m: round((day["totals"][m] - day["targets"][m]) / day["targets"][m], 3)
+            for m in MACROS
+        }
+        result_days.append(
+            {
+                "date": day["date"].isoformat(),
+                "weekday": day["weekday"],
+                "meals": meals,
+                "unfilled": day["unfilled"],
+                "totals": {m: round(v, 1) for m, v in day["totals"].items()},
+                "targets": {m: round(v, 1) for m, v in day["targets"].items()},
+                "deviation": deviation,
+                "within_tolerance": all(abs(d) <= tolerance for d in deviation.values()),
+            }
+        )
+
+    return {
+        "days": result_days,
+        "days_within_tolerance": sum(d["within_tolerance"] for d in result_days),
+        "candidates": len(matrix),
+        "skipped_without_nutrition": matrix.skipped,
+    }
@@ -1,7 +1,17 @@
 """Recipe-related MCP tools."""
 
+import asyncio
+
 from mealie_mcp.client import get_client
-from mealie_mcp.models import ErrorResponse
+from mealie_mcp.models import ErrorResponse, Recipe
+from mealie_mcp.search_index import get_search_index
+from mealie_mcp.sync import get_sync_engine
+
+# Concurrent Mealie requests for get_recipes
+BATCH_CONCURRENCY = 8
+
+# Maximum recipes per get_recipes call
+MAX_BATCH_RECIPES = 50
 
 
 async def search_recipes(
@@ -12,6 +22,10 @@ async def search_recipes(
 ) -> list[dict] | dict:
     """Search the recipe library with optional filters.
 
+    When the local search index is enabled and synced, results come from it
+    (matching ingredients and instructions too, ranked by relevance);
+    otherwise the query goes to Mealie.
+
     Args:
         query: Text search term to find recipes by name or description
         tags: Filter by tag slugs (e.g., ["quick", "vegetarian"])
@@ -22,6 +36,15 @@ async def search_recipes(
         List of recipe summaries with id, slug, name, description, tags, and timing info
     """
     client = get_client()
+
+    index = get_search_index()
+    if index is not None:
+        engine = get_sync_engine()
+        if engine is None or not engine.running:
+            index.schedule_refresh(client)
+        if index.is_ready:
+            return index.search(query=query, tags=tags, categories=categories, limit=limit)
+
     result = await client.search_recipes(
         query=query,
         tags=tags,
@@ -47,24 +70,11 @@ async def search_recipes(
     ]
 
 
-async def get_recipe(slug: str) -> dict:
-    """Get full recipe details including ingredients and instructions.
-
-    Args:
-        slug: Recipe slug or ID (e.g., "spaghetti-carbonara")
-
-    Returns:
-        Complete recipe with ingredients, instructions, nutrition, prep time, etc.
-    """
-    client = get_client()
-    result = await client.get_recipe(slug)
-
-    if isinstance(result, ErrorResponse):
-        return result.model_dump()
-
+def _format_recipe(recipe: Recipe) -> dict:
+    """Format a full recipe for tool output."""
     # Format ingredients for readability
     ingredients = []
-    for ing in result.recipe_ingredient:
+    for ing in recipe.recipe_ingredient:
         parts = []
         if ing.quantity:
             parts.append(str(ing.quantity))
@@ -81,31 +91,142 @@ async def get_recipe(slug: str) -> dict:
 
     # Format instructions
     instructions = []
-    for i, inst in enumerate(result.recipe_instructions, 1):
+    for i, inst in enumerate(recipe.recipe_instructions, 1):
         step = {"step": i, "text": inst.text}
         if inst.title:
             step["title"] = inst.title
         instructions.append(step)
 
     return {
-        "id": result.id,
-        "slug": result.slug,
-        "name": result.name,
-        "description": result.description,
-        "yield": result.recipe_yield,
-        "prep_time": result.prep_time,
-        "cook_time": result.cook_time,
-        "total_time": result.total_time,
-        "tags": [t.name for t in result.tags],
-        "categories": [c.name for c in result.recipe_category],
+        "id": recipe.id,
+        "slug": recipe.slug,
+        "name": recipe.name,
+        "description": recipe.description,
+        "yield": recipe.recipe_yield,
+        "prep_time": recipe.prep_time,
+        "cook_time": recipe.cook_time,
+        "total_time": recipe.total_time,
+        "tags": [t.name for t in recipe.tags],
+        "categories": [c.name for c in recipe.recipe_category],
         "ingredients": ingredients,
         "instructions": instructions,
-        "nutrition": result.nutrition.model_dump() if result.nutrition else None,
-        "rating": result.rating,
-        "source_url": result.org_url,
+        "nutrition": recipe.nutrition.model_dump() if recipe.nutrition else None,
+        "rating": recipe.rating,
+        "source_url": recipe.org_url,
     }
 
 
+async def get_recipe(slug: str) -> dict:
+    """Get full recipe details including ingredients and instructions.
+
+    Args:
+        slug: Recipe slug or ID (e.g., "spaghetti-carbonara")
+
+    Returns:
+        Complete recipe with ingredients, instructions, nutrition, prep time, etc.
+    """
+    client = get_client()
+    result = await client.get_recipe(slug)
+
+    if isinstance(result, ErrorResponse):
+        return result.model_dump()
+
+    return _format_recipe(result)
+
+
+async def get_recipes(slugs: list[str]) -> dict:
+    """Get full details for several recipes at once.
+
+    Recipes are fetched concurrently, so this takes about as long as the
+    slowest single fetch.
+
+    Args:
+        slugs: Recipe slugs or IDs (duplicates are fetched once)
+
+    Returns:
+        Dict with 'recipes' (full details, in request order) and 'errors'
+        (slug -> error for any that couldn't be fetched)
+    """
+    unique = list(dict.fromkeys(slugs))
+    if len(unique) > MAX_BATCH_RECIPES:
+        return ErrorResponse.validation_error(
+            f"At most {MAX_BATCH_RECIPES} recipes per call (got {len(unique)})"
+        ).model_dump()
+
+    client = get_client()
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def fetch(slug: str) -> Recipe | ErrorResponse:
+        async with semaphore:
+            return await client.get_recipe(slug)
+
+    results = await asyncio.gather(*(fetch(slug) for slug in unique))
+
+    recipes = []
+    errors = {}
+    for slug, result in zip(unique, results, strict=True):
+        if isinstance(result, ErrorResponse):
+            errors[slug] = result.model_dump()
+        else:
+            recipes.append(_format_recipe(result))
+
+    return {"recipes": recipes, "errors": errors}
+
+
+async def search_recipes_by_nutrition(
+    filter: str,
+    sort_by: str | None = None,
+    descending: bool = False,
+    limit: int = 20,
+) -> list[dict] | dict:
+    """Find recipes whose nutrition or cooking time falls within ranges.
+
+    Args:
+        filter: Conditions joined by AND/OR (e.g., "calories<600 AND protein>=35").
+            Fields: calories (kcal), protein, carbs, fat, fiber, sugar, saturated_fat,
+            trans_fat, unsaturated_fat (g), sodium, cholesterol (mg),
+            prep_minutes, total_minutes. Values may carry a unit ("sodium<1g",
+            "total_minutes<=1h"); salt in grams filters on the sodium it contains
+        sort_by: Field to order results by (e.g., "protein")
+        descending: Sort largest first
+        limit: Maximum number of results to return (default 20)
+
+    Returns:
+        List of matching recipes with id, slug, name and their parsed nutrition values
+    """
+    try:
+        from mealie_mcp import nutrition_store
+    except ImportError as e:
+        return ErrorResponse(code="DEPENDENCY_ERROR", message=str(e)).model_dump()
+
+    groups = nutrition_store.parse_filter(filter)
+    if isinstance(groups, ErrorResponse):
+        return groups.model_dump()
+    if sort_by is not None:
+        sort_by = nutrition_store.COLUMN_ALIASES.get(sort_by.lower(), sort_by.lower())
+        if sort_by not in nutrition_store.COLUMNS:
+            return ErrorResponse.validation_error(f"Unknown sort field '{sort_by}'").model_dump()
+
+    recipes = await nutrition_store.load_recipes(get_client())
+    if isinstance(recipes, ErrorResponse):
+        return recipes.model_dump()
+
+    store = nutrition_store.get_nutrition_store(recipes)
+    results = []
+    for row in store.query(groups, sort_by=sort_by, descending=descending, limit=limit):
+        recipe = store.recipes[row]
+        values = store.values(row)
+        results.append(
+            {
+                "id": recipe.id,
+                "slug": recipe.slug,
+                "name": recipe.name,
+                "nutrition": {k: v for k, v in values.items() if v is not None},
+            }
+        )
+    return results
+
+
 async def list_tags() -> list[dict] | dict:
     """Get all available tags for filtering recipes.
 
@@ -1,34 +1,48 @@
 """Recipe write/modification MCP tools."""
 
-import re
 import uuid
 from datetime import datetime
 from typing import Any
 
 from mealie_mcp.client import get_client
 from mealie_mcp.models import ErrorResponse, TimelineEventType
+from mealie_mcp.organizers import get_organizer_index, organizer_payload
+from mealie_mcp.search_index import get_search_index
 
 
-def _slugify(text: str) -> str:
-    """Convert text to a URL-friendly slug.
+async def _add_organizers(
+    update_data: dict[str, Any],
+    tags: list[str] | None,
+    categories: list[str] | None,
+) -> ErrorResponse | None:
+    """Resolve tag/category names to full objects and add them to a payload.
+
+    Missing tags and categories are created first, so Mealie receives
+    objects with IDs.
 
     Args:
-        text: Text to slugify
+        update_data: Recipe PATCH payload to extend
+        tags: Tag names
+        categories: Category names
 
     Returns:
-        Lowercase hyphenated slug
+        ErrorResponse if resolution failed, otherwise None
     """
-    # Convert to lowercase
-    slug = text.lower()
-    # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
-    # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
-    # Remove consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
-    # Strip leading/trailing hyphens
-    slug = slug.strip("-")
-    return slug
+    index = get_organizer_index()
+
+    if tags:
+        resolved_tags = await index.resolve_tags(tags)
+        if isinstance(resolved_tags, ErrorResponse):
+            return resolved_tags
+        update_data["tags"] = organizer_payload(resolved_tags)
+
+    if categories:
+        resolved_categories = await index.resolve_categories(categories)
+        if isinstance(resolved_categories, ErrorResponse):
+            return resolved_categories
+        update_data["recipeCategory"] = organizer_payload(resolved_categories)
+
+    return None
 
 
 async def create_recipe(
@@ -244,21 +258,9 @@ async def create_recipe(
     if recipe_yield:
         update_data["recipeYield"] = recipe_yield
 
-    if tags or categories:
-        # Mealie requires groupId for tags and categories
-        group_id = await client.get_group_id()
-
-    if tags:
-        # Tags need name, slug, and groupId
-        update_data["tags"] = [
-            {"name": t, "slug": _slugify(t), "groupId": group_id} for t in tags
-        ]
-
-    if categories:
-        # Categories need name, slug, and groupId
-        update_data["recipeCategory"] = [
-            {"name": c, "slug": _slugify(c), "groupId": group_id} for c in categories
-        ]
+    organizer_error = await _add_organizers(update_data, tags, categories)
+    if organizer_error is not None:
+        return organizer_error.model_dump()
 
     if source_url:
         update_data["orgURL"] = source_url
@@ -273,6 +275,12 @@ async def create_recipe(
                 "warning": f"Recipe created but update failed: {update_result.message}",
             }
 
+    index = get_search_index()
+    if index is not None:
+        created = update_result if update_data else await client.get_recipe(slug)
+        if not isinstance(created, ErrorResponse):
+            index.upsert(created)
+
     return {
         "success": True,
         "slug": slug,
@@ -390,19 +398,9 @@ async def update_recipe(
     if recipe_yield:
         update_data["recipeYield"] = recipe_yield
 
-    if tags or categories:
-        # Mealie requires groupId for tags and categories
-        group_id = await client.get_group_id()
-
-    if tags:
-        update_data["tags"] = [
-            {"name": t, "slug": _slugify(t), "groupId": group_id} for t in tags
-        ]
-
-    if categories:
-        update_data["recipeCategory"] = [
-            {"name": c, "slug": _slugify(c), "groupId": group_id} for c in categories
-        ]
+    organizer_error = await _add_organizers(update_data, tags, categories)
+    if organizer_error is not None:
+        return organizer_error.model_dump()
 
     if rating is not None:
         update_data["rating"] = rating
@@ -435,6 +433,10 @@ async def update_recipe(
                 }
         return result.model_dump()
 
+    index = get_search_index()
+    if index is not None:
+        index.upsert(result)
+
     return {
         "success": True,
         "slug": result.slug,
@@ -458,6 +460,10 @@ async def delete_recipe(slug: str) -> dict:
     if isinstance(result, ErrorResponse):
         return result.model_dump()
 
+    index = get_search_index()
+    if index is not None:
+        index.remove(slug)
+
     return result
 
 
@@ -489,6 +495,10 @@ async def import_recipe_from_url(url: str, include_tags: bool = False) -> dict:
             "message": f"Recipe imported from {url}",
         }
 
+    index = get_search_index()
+    if index is not None:
+        index.upsert(recipe)
+
     # Check for quality issues
     issues: list[str] = []
     ingredients_to_fix: list[str] = []
@@ -582,8 +592,8 @@ async def mark_recipe_made(
 
     # If notes provided, add a timeline event
     if notes:
-        # First get the recipe to get its ID
-        recipe = await client.get_recipe(slug)
+        # Timeline events are keyed by recipe ID (cached after first lookup)
+        recipe = await client.resolve_recipe_ref(slug)
         if isinstance(recipe, ErrorResponse):
             return {
                 **result,
@@ -635,8 +645,8 @@ async def add_recipe_note(
     """
     client = get_client()
 
-    # Get the recipe to get its ID
-    recipe = await client.get_recipe(slug)
+    # Resolve the recipe ID (cached after first lookup)
+    recipe = await client.resolve_recipe_ref(slug)
     if isinstance(recipe, ErrorResponse):
         return recipe.model_dump()
 
@@ -681,8 +691,8 @@ async def get_recipe_timeline(slug: str, limit: int = 20) -> list[dict] | dict:
     """
     client = get_client()
 
-    # Get the recipe to get its ID
-    recipe = await client.get_recipe(slug)
+    # Resolve the recipe ID (cached after first lookup)
+    recipe = await client.resolve_recipe_ref(slug)
     if isinstance(recipe, ErrorResponse):
         return recipe.model_dump()
 
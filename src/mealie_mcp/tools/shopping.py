@@ -1,7 +1,14 @@
 """Shopping list MCP tools."""
 
+import asyncio
+from collections import Counter
+
 from mealie_mcp.client import get_client
-from mealie_mcp.models import ErrorResponse
+from mealie_mcp.ingredients import aggregate, format_item, parse_ingredient, parse_line, subtract
+from mealie_mcp.models import ErrorResponse, Recipe
+
+# Concurrent recipe fetches for build_shopping_list
+RECIPE_CONCURRENCY = 8
 
 
 async def get_shopping_lists() -> list[dict] | dict:
@@ -176,3 +183,118 @@ async def clear_checked_items(list_id: str | None = None) -> dict:
         return result.model_dump()
 
     return result
+
+
+async def build_shopping_list(
+    start_date: str,
+    end_date: str,
+    list_id: str | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """Add everything needed for a meal plan period to a shopping list.
+
+    Ingredients from every planned recipe are parsed, converted to common
+    units and summed per food (e.g. 3 x "200g chicken breast" -> "600 g
+    chicken breast"). Amounts already on the list (unchecked) are
+    subtracted, and the rest is added in one request.
+
+    Args:
+        start_date: Start date in ISO format (YYYY-MM-DD)
+        end_date: End date in ISO format (YYYY-MM-DD)
+        list_id: Target shopping list ID. If not provided, uses the first available list.
+        dry_run: Return the items without adding them
+
+    Returns:
+        Items added (or to add), items already covered by the list, and the recipes used
+    """
+    client = get_client()
+
+    # If no list_id provided, get the first available list
+    if list_id is None:
+        lists = await client.get_shopping_lists()
+        if isinstance(lists, ErrorResponse):
+            return lists.model_dump()
+        if not lists:
+            return {
+                "error": True,
+                "code": "NOT_FOUND",
+                "message": "No shopping lists found",
+            }
+        list_id = lists[0].id
+
+    plan, shopping_list = await asyncio.gather(
+        client.get_meal_plan(start_date, end_date),
+        client.get_shopping_list(list_id),
+    )
+    if isinstance(plan, ErrorResponse):
+        return plan.model_dump()
+    if isinstance(shopping_list, ErrorResponse):
+        return shopping_list.model_dump()
+
+    # A recipe planned twice needs its ingredients twice
+    planned = Counter(
+        entry.recipe.slug if entry.recipe else entry.recipe_id
+        for entry in plan
+        if entry.recipe or entry.recipe_id
+    )
+    if not planned:
+        return ErrorResponse.validation_error(
+            f"No recipes planned between {start_date} and {end_date}"
+        ).model_dump()
+
+    semaphore = asyncio.Semaphore(RECIPE_CONCURRENCY)
+
+    async def fetch(slug: str) -> Recipe | ErrorResponse:
+        async with semaphore:
+            return await client.get_recipe(slug)
+
+    recipes = await asyncio.gather(*(fetch(slug) for slug in planned))
+
+    needed = []
+    used_recipes = []
+    failed_recipes = []
+    for slug, recipe in zip(planned, recipes, strict=True):
+        if isinstance(recipe, ErrorResponse):
+            failed_recipes.append({"slug": slug, "error": recipe.message})
+            continue
+        used_recipes.append({"slug": recipe.slug, "name": recipe.name, "times": planned[slug]})
+        for ingredient in recipe.recipe_ingredient:
+            parsed = parse_ingredient(ingredient)
+            if parsed is None:
+                continue
+            if parsed.quantity is not None:
+                parsed = parsed._replace(quantity=parsed.quantity * planned[slug])
+            needed.append(parsed)
+
+    have = [
+        parsed
+        for item in shopping_list.list_items
+        if not item.checked
+        and (parsed := parse_line(item.display or item.note or item.food or "")) is not None
+    ]
+    needed = aggregate(needed)
+    to_add = subtract(needed, aggregate(have))
+    to_add_keys = {(i.food, i.dimension) for i in to_add}
+    covered = [format_item(i) for i in needed if (i.food, i.dimension) not in to_add_keys]
+    notes = [format_item(i) for i in to_add]
+
+    response = {
+        "list_id": list_id,
+        "recipes": used_recipes,
+        "items": notes,
+        "already_on_list": covered,
+        "dry_run": dry_run,
+    }
+    if failed_recipes:
+        response["failed_recipes"] = failed_recipes
+
+    if dry_run or not notes:
+        response["added_count"] = 0
+        return response
+
+    result = await client.add_shopping_list_items(list_id, notes)
+    if isinstance(result, ErrorResponse):
+        return result.model_dump()
+
+    response["added_count"] = len(notes)
+    return response
@@ -0,0 +1,218 @@
+"""Optional OpenTelemetry tracing from MCP tool call down to Mealie HTTP request.
+
+Set MEALIE_TRACING=otlp to export spans to a collector (configured with the
+standard OTEL_EXPORTER_OTLP_* variables, default http://localhost:4318), or
+MEALIE_TRACING=file to append them as JSON lines to MEALIE_TRACING_FILE for
+offline analysis. Each tool call, MealieClient method, HTTP attempt and
+model validation gets its own span, so a slow import_recipe_from_url shows
+whether the time went to Mealie's scraper, the follow-up fetch or parsing.
+
+Until setup_tracing() runs, span() is a no-op and nothing is imported.
+
+Requires the OpenTelemetry SDK: pip install 'mealie-mcp[tracing]'
+"""
+
+import functools
+import inspect
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+# Method arguments copied onto MealieClient spans as mealie.<name>
+TRACED_ARGUMENTS = frozenset(
+    {
+        "slug",
+        "slug_or_id",
+        "list_id",
+        "entry_id",
+        "item_id",
+        "query",
+        "url",
+        "start_date",
+        "end_date",
+        "per_page",
+    }
+)
+
+# Tracer once setup_tracing() has configured an exporter
+_tracer: Any = None
+
+
+class JsonLinesSpanExporter:
+    """Span exporter that appends one JSON document per span to a file."""
+
+    def __init__(self, path: str):
+        """Create the exporter.
+
+        Args:
+            path: File to append to (created if missing)
+        """
+        self.path = path
+
+    def export(self, spans: Any) -> Any:
+        """Write a batch of finished spans."""
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        with open(self.path, "a", encoding="utf-8") as f:
+            for finished in spans:
+                f.write(finished.to_json(indent=None) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        """Nothing to release; each batch opens and closes the file."""
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Batches are written synchronously, so there is nothing to flush."""
+        return True
+
+
+def setup_tracing(mode: str | None = None) -> str | None:
+    """Install a tracer provider that exports to OTLP or a file.
+
+    Args:
+        mode: "otlp", "file", or None to read MEALIE_TRACING (unset/"off" disables)
+
+    Returns:
+        The mode enabled, or None if tracing is off
+
+    Raises:
+        ImportError: If the OpenTelemetry SDK (or OTLP exporter) isn't installed
+        ValueError: If the mode is unknown
+    """
+    global _tracer
+    mode = (mode or os.getenv("MEALIE_TRACING", "")).strip().lower()
+    if mode in ("", "off", "false", "none"):
+        return None
+    if mode not in ("otlp", "file"):
+        raise ValueError(f"Unknown MEALIE_TRACING mode '{mode}'. Use 'otlp' or 'file'")
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        if mode == "otlp":
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+            exporter = OTLPSpanExporter()
+        else:
+            exporter = JsonLinesSpanExporter(
+                os.getenv("MEALIE_TRACING_FILE", "mealie-mcp-traces.jsonl")
+            )
+    except ImportError as e:
+        raise ImportError(
+            "OpenTelemetry SDK not installed. Run: pip install 'mealie-mcp[tracing]'"
+        ) from e
+
+    service = os.getenv("OTEL_SERVICE_NAME", "mealie-mcp")
+    provider = TracerProvider(resource=Resource.create({"service.name": service}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("mealie_mcp")
+    return mode
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _tracer is not None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Open a span as a child of the current one.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes; None values are dropped
+
+    Yields:
+        The span, or None when tracing is off
+    """
+    if _tracer is None:
+        yield None
+        return
+    attributes = {k: v for k, v in attributes.items() if v is not None}
+    with _tracer.start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def annotate(current: Any, **attributes: Any) -> None:
+    """Set attributes on a span from span(), ignoring None spans and values."""
+    if current is None:
+        return
+    for key, value in attributes.items():
+        if value is not None:
+            current.set_attribute(key, value)
+
+
+def _trace_method(span_name: str, func: Any) -> Any:
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _tracer is None:
+            return await func(*args, **kwargs)
+        bound = signature.bind_partial(*args, **kwargs).arguments
+        attributes = {
+            f"mealie.{k}": v
+            for k, v in bound.items()
+            if k in TRACED_ARGUMENTS and isinstance(v, str | int | float | bool)
+        }
+        with span(span_name, **attributes) as current:
+            result = await func(*args, **kwargs)
+            if getattr(result, "error", False) is True:
+                annotate(current, **{"mealie.error_code": getattr(result, "code", None)})
+            elif isinstance(result, list):
+                annotate(current, **{"mealie.items": len(result)})
+            return result
+
+    return wrapper
+
+
+def traced(cls: type) -> type:
+    """Class decorator: give every public coroutine method its own span.
+
+    Spans are named "<Class>.<method>" and carry the TRACED_ARGUMENTS the
+    call was made with, plus the error code or result count.
+    """
+    for name, func in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(func):
+            setattr(cls, name, _trace_method(f"{cls.__name__}.{name}", func))
+    return cls
+
+
+def validate(model: type[M], data: Any) -> M:
+    """Validate one API payload into a model inside a span.
+
+    Args:
+        model: Pydantic model class
+        data: Parsed JSON
+
+    Returns:
+        Model instance
+    """
+    with span(f"validate {model.__name__}", **{"mealie.model": model.__name__}):
+        return model.model_validate(data)
+
+
+def validate_many(model: type[M], items: list[Any]) -> list[M]:
+    """Validate a list of API payloads into models inside one span.
+
+    Args:
+        model: Pydantic model class
+        items: Parsed JSON objects
+
+    Returns:
+        Model instances
+    """
+    with span(
+        f"validate {model.__name__}[]",
+        **{"mealie.model": model.__name__, "mealie.items": len(items)},
+    ):
+        return [model.model_validate(item) for item in items]
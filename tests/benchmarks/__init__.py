@@ -0,0 +1 @@
+"""Latency and throughput benchmarks against an in-process fake Mealie."""
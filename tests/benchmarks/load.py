@@ -0,0 +1,490 @@
+"""Concurrent MCP session load generator for the HTTP transport.
+
+Opens N simulated MCP sessions against ``mcp.http_app(path="/mcp")``. Each
+session initializes, lists the tools, then makes tool calls drawn from a
+weighted mix until the run ends. The report covers throughput, latency
+percentiles and errors per operation, plus the server's resident memory
+sampled over the run.
+
+By default a server is started in a subprocess, backed by FakeMealie
+(tests/fake_mealie.py), so runs are offline and memory readings cover the
+server alone. Pass --url (and optionally --pid) to load an already running
+server instead.
+
+    python -m tests.benchmarks.load --sessions 50 --duration 60 --latency-ms 20
+    python -m tests.benchmarks.load --mix search_recipes=6,get_recipe=3,add_to_shopping_list=1
+    python -m tests.benchmarks.load --url http://127.0.0.1:8080/mcp --pid 4242
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+
+from mealie_mcp.metrics import is_error_result
+from tests.benchmarks.run import summarize
+from tests.fake_mealie import PANTRY, PROTEINS
+
+# Relative weight of each tool in the default mix
+DEFAULT_MIX = {
+    "search_recipes": 4,
+    "get_recipe": 3,
+    "get_recipes": 1,
+    "get_meal_plan": 1,
+    "get_shopping_list": 1,
+    "add_to_shopping_list": 1,
+}
+
+
+class Workload:
+    """Inputs discovered from the server and shared by every session."""
+
+    def __init__(self, slugs: list[str], list_id: str | None):
+        self.slugs = slugs or ["missing-recipe"]
+        self.list_id = list_id
+
+
+# Tool name -> arguments for one call
+TOOL_ARGUMENTS: dict[str, Callable[[Workload, random.Random], dict[str, Any]]] = {
+    "search_recipes": lambda w, rng: {"query": rng.choice(PROTEINS), "limit": 20},
+    "get_recipe": lambda w, rng: {"slug": rng.choice(w.slugs)},
+    "get_recipes": lambda w, rng: {"slugs": rng.sample(w.slugs, min(5, len(w.slugs)))},
+    "list_tags": lambda w, rng: {},
+    "get_meal_plan": lambda w, rng: {"start_date": "2026-03-02", "end_date": "2026-03-08"},
+    "get_shopping_list": lambda w, rng: {"list_id": w.list_id},
+    "add_to_shopping_list": lambda w, rng: {
+        "items": [f"{rng.randint(1, 3)} {rng.choice(PANTRY)}"],
+        "list_id": w.list_id,
+    },
+}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse a "tool=weight,tool=weight" mix.
+
+    Args:
+        spec: Comma-separated tool names with optional weights (default 1)
+
+    Returns:
+        Tool name -> weight
+
+    Raises:
+        ValueError: If a tool has no argument generator or a weight is invalid
+    """
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        name = name.removeprefix("tool_")
+        if name not in TOOL_ARGUMENTS:
+            raise ValueError(f"Unknown tool '{name}'. Choose from: {', '.join(TOOL_ARGUMENTS)}")
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] < 0:
+            raise ValueError(f"Weight for '{name}' must not be negative")
+    if not any(mix.values()):
+        raise ValueError("Mix needs at least one tool with a positive weight")
+    return mix
+
+
+def read_rss(pid: int) -> int | None:
+    """Resident memory of a process in bytes, or None if it can't be read."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return None
+
+
+def _payload(result: Any) -> Any:
+    """Tool result as JSON: structured content, else the first text block."""
+    if result.structured_content is not None:
+        return result.structured_content.get("result", result.structured_content)
+    for block in result.content:
+        if getattr(block, "text", None):
+            try:
+                return json.loads(block.text)
+            except ValueError:
+                return block.text
+    return None
+
+
+def _failed(result: Any) -> bool:
+    payload = _payload(result)
+    return result.is_error or (isinstance(payload, dict) and is_error_result(payload))
+
+
+async def discover(url: str) -> Workload:
+    """Find recipe slugs and a shopping list to use in tool arguments."""
+    async with Client(url) as client:
+        found = _payload(
+            await client.call_tool("tool_search_recipes", {"limit": 200}, raise_on_error=False)
+        )
+        lists = _payload(
+            await client.call_tool("tool_get_shopping_lists", {}, raise_on_error=False)
+        )
+    slugs = [r["slug"] for r in found] if isinstance(found, list) else []
+    list_id = lists[0]["id"] if isinstance(lists, list) and lists else None
+    return Workload(slugs, list_id)
+
+
+class Recorder:
+    """Latencies and errors per operation for one run."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.messages: dict[str, str] = {}
+
+    def record(self, op: str, seconds: float, error: str | None = None) -> None:
+        self.latencies[op].append(seconds)
+        if error is not None:
+            self.errors[op] += 1
+            self.messages.setdefault(op, error)
+
+    @property
+    def calls(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+
+async def run_session(
+    url: str,
+    workload: Workload,
+    mix: dict[str, float],
+    recorder: Recorder,
+    deadline: float,
+    think: float,
+    rng: random.Random,
+) -> None:
+    """One simulated MCP session: initialize, tools/list, then mixed tool calls.
+
+    Args:
+        url: MCP endpoint
+        workload: Shared tool inputs
+        mix: Tool name -> weight
+        recorder: Where results are recorded
+        deadline: perf_counter() time at which the session stops
+        think: Seconds to pause between calls
+        rng: Session's random source
+    """
+    names, weights = list(mix), list(mix.values())
+    start = time.perf_counter()
+    try:
+        client = Client(url)
+        await client.__aenter__()
+    except Exception as e:
+        recorder.record("initialize", time.perf_counter() - start, f"{type(e).__name__}: {e}")
+        return
+    recorder.record("initialize", time.perf_counter() - start)
+
+    try:
+        start = time.perf_counter()
+        try:
+            await client.list_tools()
+            recorder.record("tools/list", time.perf_counter() - start)
+        except Exception as e:
+            recorder.record("tools/list", time.perf_counter() - start, f"{type(e).__name__}: {e}")
+
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            arguments = TOOL_ARGUMENTS[name](workload, rng)
+            start = time.perf_counter()
+            try:
+                result = await client.call_tool(f"tool_{name}", arguments, raise_on_error=False)
+                error = str(_payload(result))[:200] if _failed(result) else None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            recorder.record(name, time.perf_counter() - start, error)
+            if think:
+                await asyncio.sleep(think)
+    finally:
+        await client.__aexit__(None, None, None)
+
+
+async def run_load(
+    url: str,
+    sessions: int = 10,
+    duration: float = 30.0,
+    mix: dict[str, float] | None = None,
+    ramp_up: float = 0.0,
+    think: float = 0.0,
+    pid: int | None = None,
+    sample_interval: float = 1.0,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Drive concurrent sessions against an MCP endpoint.
+
+    Args:
+        url: MCP endpoint (e.g. http://127.0.0.1:8080/mcp)
+        sessions: Concurrent sessions
+        duration: Seconds of load after the last session has started
+        mix: Tool name -> weight (default DEFAULT_MIX)
+        ramp_up: Seconds over which session starts are spread
+        think: Seconds each session pauses between calls
+        pid: Server process to sample memory from (None to skip)
+        sample_interval: Seconds between memory samples
+        seed: Random seed for tool and argument choice
+
+    Returns:
+        {"config": {...}, "results": {op: summary}, "memory": {...}, "timeline": [...]}
+    """
+    mix = mix or DEFAULT_MIX
+    workload = await discover(url)
+    recorder = Recorder()
+    timeline: list[dict[str, Any]] = []
+
+    began = time.perf_counter()
+    deadline = began + ramp_up + duration
+
+    def snapshot() -> None:
+        rss = read_rss(pid) if pid else None
+        timeline.append(
+            {
+                "t": round(time.perf_counter() - began, 2),
+                "calls": recorder.calls,
+                "rss_mb": round(rss / 2**20, 1) if rss is not None else None,
+            }
+        )
+
+    async def sample() -> None:
+        while True:
+            snapshot()
+            await asyncio.sleep(sample_interval)
+
+    async def start_session(n: int) -> None:
+        if ramp_up and sessions > 1:
+            await asyncio.sleep(ramp_up * n / (sessions - 1))
+        await run_session(
+            url, workload, mix, recorder, deadline, think, random.Random(seed * 100_003 + n)
+        )
+
+    sampler = asyncio.create_task(sample())
+    try:
+        await asyncio.gather(*(start_session(n) for n in range(sessions)))
+    finally:
+        sampler.cancel()
+    elapsed = time.perf_counter() - began
+    snapshot()
+
+    results = {
+        op: summarize(latencies, recorder.errors[op], elapsed)
+        for op, latencies in recorder.latencies.items()
+    }
+    tool_calls = [v for op, v in recorder.latencies.items() if op in TOOL_ARGUMENTS]
+    tool_errors = sum(n for op, n in recorder.errors.items() if op in TOOL_ARGUMENTS)
+    results["all tools"] = summarize(
+        [s for latencies in tool_calls for s in latencies], tool_errors, elapsed
+    )
+
+    rss = [s["rss_mb"] for s in timeline if s["rss_mb"] is not None]
+    memory = (
+        {"start_mb": rss[0], "peak_mb": max(rss), "end_mb": rss[-1], "growth_mb": rss[-1] - rss[0]}
+        if rss
+        else {}
+    )
+    config = {
+        "url": url,
+        "sessions": sessions,
+        "duration_s": duration,
+        "ramp_up_s": ramp_up,
+        "think_ms": think * 1000,
+        "mix": mix,
+    }
+    return {
+        "config": config,
+        "results": results,
+        "error_samples": recorder.messages,
+        "memory": memory,
+        "timeline": timeline,
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a load run as text."""
+    lines = [
+        f"{'operation':<24}{'calls':>8}{'errors':>8}{'err %':>7}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}"
+    ]
+    for op, r in report["results"].items():
+        rate = r["errors"] / r["calls"] if r["calls"] else 0.0
+        lines.append(
+            f"{op:<24}{r['calls']:>8}{r['errors']:>8}{rate:>7.1%}"
+            f"{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['ops_per_sec']:>10.1f}"
+        )
+    for op, message in report["error_samples"].items():
+        lines.append(f"first {op} error: {message}")
+    if memory := report["memory"]:
+        lines.append(
+            f"server RSS: start {memory['start_mb']:.1f} MB, peak {memory['peak_mb']:.1f} MB, "
+            f"end {memory['end_mb']:.1f} MB (growth {memory['growth_mb']:+.1f} MB)"
+        )
+        lines.append("  ".join(f"{s['t']:.0f}s:{s['rss_mb']}MB" for s in report["timeline"]))
+    return "\n".join(lines)
+
+
+def build_server(port: int, recipes: int, latency: float, error_rate: float) -> Any:
+    """Build a uvicorn server for the MCP HTTP app, its client wired to a FakeMealie.
+
+    Replaces the global MealieClient, so run it in its own process (or restore
+    mealie_mcp.client._client afterwards).
+
+    Returns:
+        An unstarted uvicorn.Server
+    """
+    import uvicorn
+
+    from mealie_mcp import client as client_module
+    from mealie_mcp.client import MealieClient
+    from mealie_mcp.server import mcp
+    from tests.fake_mealie import FakeMealie
+
+    fake = FakeMealie(recipes=recipes, latency=latency, error_rate=error_rate)
+    client_module._client = MealieClient(
+        base_url=fake.base_url, token="load-test", transport=fake.transport()
+    )
+    config = uvicorn.Config(
+        mcp.http_app(path="/mcp"), host="127.0.0.1", port=port, log_level="warning"
+    )
+    return uvicorn.Server(config)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(
+    recipes: int, latency: float, error_rate: float, timeout: float = 30.0
+) -> tuple[subprocess.Popen, str]:
+    """Start build_server() in a subprocess and wait until it answers /health.
+
+    Returns:
+        The process and its MCP endpoint URL
+    """
+    import httpx
+
+    port = _free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "tests.benchmarks.load",
+        "--serve",
+        "--port",
+        str(port),
+        "--recipes",
+        str(recipes),
+        "--latency-ms",
+        str(latency * 1000),
+        "--error-rate",
+        str(error_rate),
+    ]
+    env = {**os.environ, "MEALIE_TOKEN": "load-test"}
+    process = subprocess.Popen(command, cwd=Path(__file__).parents[2], env=env)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Load test server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process, f"http://127.0.0.1:{port}/mcp"
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"Load test server did not become healthy within {timeout:.0f}s")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--url", help="MCP endpoint of a running server (default: start one)")
+    parser.add_argument("--pid", type=int, help="server process to sample memory from")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds to start sessions")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="pause between calls")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        help="tool=weight list (default %(default)s)",
+    )
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="memory sample secs")
+    parser.add_argument("--max-error-rate", type=float, help="exit 1 if tool errors exceed this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    # Options for the spawned server
+    parser.add_argument("--recipes", type=int, default=2000, help="fake library size")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="fake Mealie latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake Mealie 503 rate")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=8931, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        server = build_server(args.port, args.recipes, args.latency_ms / 1000, args.error_rate)
+        asyncio.run(server.serve())
+        return 0
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    process = None
+    url, pid = args.url, args.pid
+    if url is None:
+        process, url = start_server(args.recipes, args.latency_ms / 1000, args.error_rate)
+        pid = process.pid
+    try:
+        report = asyncio.run(
+            run_load(
+                url,
+                sessions=args.sessions,
+                duration=args.duration,
+                mix=mix,
+                ramp_up=args.ramp_up,
+                think=args.think_ms / 1000,
+                pid=pid,
+                sample_interval=args.sample_interval,
+                seed=args.seed,
+            )
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    tools = report["results"]["all tools"]
+    error_rate = tools["errors"] / tools["calls"] if tools["calls"] else 0.0
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(
+            f"Tool error rate {error_rate:.1%} exceeds {args.max_error_rate:.1%}", file=sys.stderr
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
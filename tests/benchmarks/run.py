@@ -0,0 +1,279 @@
+"""Benchmark runner for MealieClient and the MCP tools.
+
+Drives each scenario against FakeMealie (tests/fake_mealie.py) with a
+configurable library size, per-request latency and concurrency, then
+reports p50/p95/p99 latency and ops/sec. Results can be saved as a
+baseline and later runs compared against it; a p95 or throughput change
+worse than the threshold is reported as a regression (exit code 1).
+
+    python -m tests.benchmarks.run --recipes 2000 --latency-ms 5 --save
+    python -m tests.benchmarks.run --recipes 2000 --latency-ms 5 --compare
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from mealie_mcp import client as client_module
+from mealie_mcp.client import MealieClient
+from mealie_mcp.metrics import is_error_result
+from mealie_mcp.models import ErrorResponse
+from mealie_mcp.resilience import RetryPolicy
+from mealie_mcp.tools.recipes import get_recipe, get_recipes, search_recipes
+from mealie_mcp.tools.shopping import add_to_shopping_list
+from tests.fake_mealie import PROTEINS, FakeMealie
+
+DEFAULT_BASELINE = Path(".benchmarks/baseline.json")
+
+# Unmeasured calls per scenario before timing starts
+WARMUP_CALLS = 5
+
+
+class Bench:
+    """Client, fake and inputs shared by the scenarios."""
+
+    def __init__(self, fake: FakeMealie, client: MealieClient):
+        self.fake = fake
+        self.client = client
+        self.slugs = [r["slug"] for r in fake.recipes.values()]
+        self.list_id = next(iter(fake.shopping_lists))
+
+    def slug(self, i: int) -> str:
+        return self.slugs[(i * 7919) % len(self.slugs)]  # stride through the library
+
+
+class Scenario(NamedTuple):
+    """A named operation to time; called with the iteration number."""
+
+    name: str
+    call: Callable[[Bench, int], Awaitable[Any]]
+
+
+SCENARIOS = [
+    Scenario("client.get_recipe", lambda b, i: b.client.get_recipe(b.slug(i))),
+    Scenario("client.search_recipes", lambda b, i: b.client.search_recipes(per_page=50)),
+    Scenario(
+        "tool.search_recipes",
+        lambda b, i: search_recipes(query=PROTEINS[i % len(PROTEINS)], limit=20),
+    ),
+    Scenario("tool.get_recipe", lambda b, i: get_recipe(b.slug(i))),
+    Scenario("tool.get_recipes", lambda b, i: get_recipes([b.slug(i + n) for n in range(10)])),
+    Scenario(
+        "tool.add_to_shopping_list",
+        lambda b, i: add_to_shopping_list([f"{i} cups flour", "2 eggs"], list_id=b.list_id),
+    ),
+]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, float]:
+    """Latency percentiles and throughput for one scenario.
+
+    Args:
+        latencies: Per-call durations in seconds
+        errors: Calls that returned an error
+        elapsed: Wall time for all calls in seconds
+
+    Returns:
+        Dict with calls, errors, p50_ms, p95_ms, p99_ms and ops_per_sec
+    """
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "ops_per_sec": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+async def run_scenario(
+    bench: Bench, scenario: Scenario, iterations: int, concurrency: int
+) -> dict[str, float]:
+    """Time a scenario with a fixed number of concurrent workers.
+
+    Args:
+        bench: Shared client and inputs
+        scenario: Operation to time
+        iterations: Measured calls
+        concurrency: Calls in flight at once
+
+    Returns:
+        Output of summarize()
+    """
+    for i in range(WARMUP_CALLS):
+        await scenario.call(bench, i)
+
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(offset: int) -> None:
+        nonlocal errors
+        for i in range(offset, iterations, concurrency):
+            start = time.perf_counter()
+            result = await scenario.call(bench, i)
+            latencies.append(time.perf_counter() - start)
+            if isinstance(result, ErrorResponse) or is_error_result(result):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def run_benchmarks(
+    recipes: int = 500,
+    latency: float = 0.0,
+    iterations: int = 200,
+    concurrency: int = 8,
+    only: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run the scenarios against a fresh FakeMealie.
+
+    The tools' global client is swapped for one wired to the fake for the
+    duration of the run.
+
+    Args:
+        recipes: Synthetic library size
+        latency: Seconds the fake adds to every response
+        iterations: Measured calls per scenario
+        concurrency: Calls in flight at once
+        only: Scenario names to run (default all)
+
+    Returns:
+        {"config": {...}, "results": {scenario: summary}}
+    """
+    fake = FakeMealie(recipes=recipes, latency=latency)
+    client = MealieClient(
+        base_url=fake.base_url,
+        token="benchmark",
+        retry_policy=RetryPolicy(retries=0),
+        transport=fake.transport(),
+    )
+    previous = client_module._client
+    client_module._client = client
+    bench = Bench(fake, client)
+
+    results = {}
+    try:
+        for scenario in SCENARIOS:
+            if only and scenario.name not in only:
+                continue
+            results[scenario.name] = await run_scenario(bench, scenario, iterations, concurrency)
+    finally:
+        client_module._client = previous
+        await client.close()
+
+    config = {
+        "recipes": recipes,
+        "latency_ms": latency * 1000,
+        "iterations": iterations,
+        "concurrency": concurrency,
+    }
+    return {"config": config, "results": results}
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.2
+) -> list[str]:
+    """Find scenarios that got slower than the baseline.
+
+    Args:
+        current: Output of run_benchmarks
+        baseline: A previous run_benchmarks output
+        threshold: Allowed relative change (0.2 = 20%)
+
+    Returns:
+        One message per regression (empty if none)
+    """
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        if before["p95_ms"] and now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {before['p95_ms']:.2f} -> {now['p95_ms']:.2f} ms "
+                f"(+{now['p95_ms'] / before['p95_ms'] - 1:.0%})"
+            )
+        if before["ops_per_sec"] and now["ops_per_sec"] < before["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: {before['ops_per_sec']:.0f} -> {now['ops_per_sec']:.0f} ops/s "
+                f"({now['ops_per_sec'] / before['ops_per_sec'] - 1:.0%})"
+            )
+        if now["errors"] > before["errors"]:
+            regressions.append(f"{name}: errors {before['errors']} -> {now['errors']}")
+    return regressions
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render results as a fixed-width table."""
+    lines = [
+        f"{'scenario':<28}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'errors':>8}"
+    ]
+    for name, r in report["results"].items():
+        lines.append(
+            f"{name:<28}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+            f"{r['ops_per_sec']:>10.1f}{r['errors']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--recipes", type=int, default=500, help="synthetic library size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fake Mealie latency")
+    parser.add_argument("--iterations", type=int, default=200, help="measured calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight at once")
+    parser.add_argument("--scenario", action="append", help="run only this scenario (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2=20%%)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_benchmarks(
+            recipes=args.recipes,
+            latency=args.latency_ms / 1000,
+            iterations=args.iterations,
+            concurrency=args.concurrency,
+            only=args.scenario,
+        )
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    status = 0
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save first", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("config") != report["config"]:
+            print("Warning: baseline was recorded with a different config", file=sys.stderr)
+        regressions = compare(report, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        status = 1 if regressions else 0
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Cold-start budget for the stdio server.
+
+Measures what Claude Desktop waits for when it spawns ``mealie-mcp``: the
+import of mealie_mcp.server (broken down per package from ``-X importtime``)
+and the wall time from spawning the process to the first tools/list
+response. It also checks that modules stdio never needs (the OAuth
+provider, the numpy planner, rarely used tools) are not imported at startup.
+
+Results can be saved as a baseline and compared like the other benchmarks;
+exceeding the budget, regressing past the threshold or importing a lazy
+module exits with code 1.
+
+    python -m tests.benchmarks.startup --save
+    python -m tests.benchmarks.startup --compare --budget-ms 2500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+DEFAULT_BASELINE = Path(".benchmarks/startup.json")
+
+# Default ceiling for median time to the first tools/list response
+DEFAULT_BUDGET_MS = 3000.0
+
+# Modules a stdio start must not import; they load on first use
+LAZY_MODULES = (
+    "fastmcp.server.auth.providers.in_memory",
+    "mealie_mcp.planner",
+    "mealie_mcp.nutrition_store",
+    "numpy",
+)
+
+# Environment for the spawned server: no Mealie is contacted before a tool call
+SERVER_ENV = {
+    "MEALIE_URL": "http://127.0.0.1:9/api",
+    "MEALIE_TOKEN": "startup-benchmark",
+    "MEALIE_SYNC": "false",
+    "MCP_TRANSPORT": "stdio",
+    "MCP_REQUIRE_AUTH": "false",
+}
+
+
+def _server_env() -> dict[str, str]:
+    return {**os.environ, **SERVER_ENV}
+
+
+def parse_importtime(output: str) -> list[tuple[str, float, float]]:
+    """Parse ``python -X importtime`` stderr.
+
+    Args:
+        output: The interpreter's stderr
+
+    Returns:
+        (module, self_ms, cumulative_ms) per imported module, in import order
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # header row
+        modules.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return modules
+
+
+def import_report(module: str = "mealie_mcp.server", top: int = 10) -> dict[str, Any]:
+    """Import a module in a fresh interpreter and break the time down.
+
+    Args:
+        module: Module to import
+        top: Number of packages to list
+
+    Returns:
+        {"total_ms", "packages": {package: self_ms}, "project": {module: self_ms},
+        "lazy_violations": [...]}
+    """
+    code = f"import sys, json, {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=_server_env(),
+        check=True,
+    )
+    modules = parse_importtime(proc.stderr)
+    loaded = set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    packages: dict[str, float] = defaultdict(float)
+    for name, self_ms, _ in modules:
+        packages[name.split(".")[0]] += self_ms
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(self_ms for _, self_ms, _ in modules), 1),
+        "packages": {name: round(ms, 1) for name, ms in ranked},
+        "project": {
+            name: round(self_ms, 1)
+            for name, self_ms, _ in modules
+            if name.split(".")[0] == module.split(".")[0]
+        },
+        "lazy_violations": sorted(m for m in LAZY_MODULES if m in loaded),
+    }
+
+
+async def time_to_tools_list() -> tuple[float, int]:
+    """Spawn the stdio server and time it until tools/list answers.
+
+    Returns:
+        Seconds from spawn to the tools/list response, and the number of tools
+    """
+    transport = StdioTransport(
+        command=sys.executable,
+        args=["-m", "mealie_mcp.server"],
+        env=_server_env(),
+        cwd=str(Path(__file__).parents[2]),
+        keep_alive=False,
+        log_file=Path(os.devnull),
+    )
+    start = time.perf_counter()
+    async with Client(transport) as client:
+        tools = await client.list_tools()
+        elapsed = time.perf_counter() - start
+    return elapsed, len(tools)
+
+
+async def measure(runs: int = 5) -> dict[str, Any]:
+    """Collect the import breakdown and repeated time-to-tools/list samples.
+
+    Args:
+        runs: Server spawns to time
+
+    Returns:
+        {"imports": import_report(), "tools_list_ms": {...}, "tools": count}
+    """
+    samples = []
+    tools = 0
+    for _ in range(runs):
+        elapsed, tools = await time_to_tools_list()
+        samples.append(elapsed * 1000)
+    return {
+        "imports": import_report(),
+        "tools_list_ms": {
+            "median": round(statistics.median(samples), 1),
+            "min": round(min(samples), 1),
+            "max": round(max(samples), 1),
+            "runs": runs,
+        },
+        "tools": tools,
+    }
+
+
+def check(
+    report: dict[str, Any],
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    baseline: dict[str, Any] | None = None,
+    threshold: float = 0.2,
+) -> list[str]:
+    """Find budget overruns, regressions and eagerly imported lazy modules.
+
+    Args:
+        report: Output of measure()
+        budget_ms: Ceiling for the median time to tools/list
+        baseline: A previous measure() output to compare against
+        threshold: Allowed relative slowdown against the baseline (0.2 = 20%)
+
+    Returns:
+        One message per problem (empty if none)
+    """
+    problems = []
+    median = report["tools_list_ms"]["median"]
+    if median > budget_ms:
+        problems.append(f"time to tools/list {median:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    for module in report["imports"]["lazy_violations"]:
+        problems.append(f"{module} is imported at startup")
+    if baseline is not None:
+        before = baseline["tools_list_ms"]["median"]
+        if before and median > before * (1 + threshold):
+            problems.append(
+                f"time to tools/list {before:.0f} -> {median:.0f} ms (+{median / before - 1:.0%})"
+            )
+        before = baseline["imports"]["total_ms"]
+        now = report["imports"]["total_ms"]
+        if before and now > before * (1 + threshold):
+            problems.append(f"import time {before:.0f} -> {now:.0f} ms (+{now / before - 1:.0%})")
+    return problems
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a startup report as text."""
+    imports = report["imports"]
+    timing = report["tools_list_ms"]
+    lines = [
+        f"time to first tools/list: median {timing['median']:.0f} ms "
+        f"(min {timing['min']:.0f}, max {timing['max']:.0f}, {timing['runs']} runs, "
+        f"{report['tools']} tools)",
+        f"import mealie_mcp.server: {imports['total_ms']:.0f} ms",
+        f"{'package':<28}{'self ms':>10}",
+    ]
+    lines += [f"{name:<28}{ms:>10.1f}" for name, ms in imports["packages"].items()]
+    lines.append(f"{'module (mealie_mcp)':<28}{'self ms':>10}")
+    lines += [f"{name:<28}{ms:>10.1f}" for name, ms in imports["project"].items()]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="server spawns to time")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2=20%%)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(measure(args.runs))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    baseline = None
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save first", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text())
+    problems = check(report, args.budget_ms, baseline, args.threshold)
+    for message in problems:
+        print(f"REGRESSION {message}", file=sys.stderr)
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
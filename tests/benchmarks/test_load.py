@@ -0,0 +1,60 @@
+"""Smoke tests for the MCP session load generator."""
+
+import asyncio
+import os
+
+import pytest
+
+from mealie_mcp import client as client_module
+from tests.benchmarks.load import (
+    TOOL_ARGUMENTS,
+    _free_port,
+    build_server,
+    format_report,
+    parse_mix,
+    run_load,
+)
+
+
+@pytest.fixture
+async def mcp_url(monkeypatch):
+    """Serve the MCP HTTP app backed by FakeMealie on a free port."""
+    monkeypatch.setattr(client_module, "_client", None)
+    port = _free_port()
+    server = build_server(port, recipes=100, latency=0.0, error_rate=0.0)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    yield f"http://127.0.0.1:{port}/mcp"
+    server.should_exit = True
+    await task
+
+
+@pytest.mark.asyncio
+async def test_sessions_report_every_operation(mcp_url: str):
+    """Concurrent sessions initialize, list tools and call every tool in the mix."""
+    mix = dict.fromkeys(TOOL_ARGUMENTS, 1)
+
+    report = await run_load(
+        mcp_url, sessions=3, duration=1.0, mix=mix, pid=os.getpid(), sample_interval=0.2
+    )
+
+    results = report["results"]
+    assert results["initialize"]["calls"] == 3
+    assert results["tools/list"]["calls"] == 3
+    assert results["all tools"]["calls"] > len(TOOL_ARGUMENTS)
+    assert results["all tools"]["errors"] == 0, report["error_samples"]
+    assert report["memory"]["peak_mb"] >= report["memory"]["start_mb"] > 0
+    assert "server RSS" in format_report(report)
+
+
+def test_parse_mix():
+    """Weights default to 1, tool_ prefixes are accepted and unknown tools rejected."""
+    assert parse_mix("search_recipes=3,tool_get_recipe") == {
+        "search_recipes": 3.0,
+        "get_recipe": 1.0,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("search_recipes,delete_recipe")
+    with pytest.raises(ValueError):
+        parse_mix("search_recipes=0")
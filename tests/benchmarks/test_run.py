@@ -0,0 +1,35 @@
+"""Smoke tests for the benchmark runner."""
+
+import pytest
+
+from tests.benchmarks.run import SCENARIOS, compare, run_benchmarks
+
+
+@pytest.mark.asyncio
+async def test_every_scenario_runs_cleanly():
+    """Each scenario completes against the fake without errors."""
+    report = await run_benchmarks(recipes=50, iterations=10, concurrency=2)
+
+    assert set(report["results"]) == {s.name for s in SCENARIOS}
+    for result in report["results"].values():
+        assert result["calls"] == 10
+        assert result["errors"] == 0
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+
+
+def test_compare_flags_regressions():
+    """Slower p95, lower throughput and new errors beyond the threshold are flagged."""
+    before = {"p50_ms": 1, "p95_ms": 2.0, "p99_ms": 3, "ops_per_sec": 1000, "errors": 0}
+    baseline = {"results": {"a": before, "b": before}}
+    current = {
+        "results": {
+            "a": {**before, "p95_ms": 2.2, "ops_per_sec": 900},  # within 20%
+            "b": {**before, "p95_ms": 3.0, "ops_per_sec": 500, "errors": 1},
+            "new": before,
+        }
+    }
+
+    regressions = compare(current, baseline, threshold=0.2)
+
+    assert len(regressions) == 3
+    assert all(message.startswith("b:") for message in regressions)
@@ -0,0 +1,26 @@
+"""Regression checks for stdio cold start."""
+
+import pytest
+
+from tests.benchmarks.startup import DEFAULT_BUDGET_MS, check, measure, parse_importtime
+
+
+def test_parse_importtime():
+    """Header rows are skipped and times are converted to milliseconds."""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       150 |        150 |   _io\n"
+        "import time:      2000 |      12500 | mealie_mcp.server\n"
+    )
+
+    assert parse_importtime(output) == [("_io", 0.15, 0.15), ("mealie_mcp.server", 2.0, 12.5)]
+
+
+@pytest.mark.asyncio
+async def test_stdio_start_stays_lean():
+    """The stdio server lists every tool quickly without importing lazy modules."""
+    report = await measure(runs=1)
+
+    assert report["tools"] >= 25
+    # Double the budget so slow CI machines only fail on real regressions
+    assert check(report, budget_ms=DEFAULT_BUDGET_MS * 2) == []
@@ -0,0 +1,601 @@
+"""In-process fake Mealie API for benchmarks, load tests and offline runs.
+
+FakeMealie is an ASGI app implementing every endpoint MealieClient uses:
+recipes (CRUD, create from URL, last-made, image upload, timeline),
+organizers, meal plans and shopping lists. It serves a deterministic
+synthetic library of any size, so the client and the tools run their real
+request, JSON and validation paths without a Mealie instance.
+
+In-process, through httpx:
+
+    fake = FakeMealie(recipes=5000, latency=0.005, error_rate=0.01)
+    client = MealieClient(base_url=fake.base_url, token="x", transport=fake.transport())
+
+Over real HTTP, for the MCP server, load tests or the bulk importer:
+
+    python -m tests.fake_mealie --recipes 5000 --latency-ms 20 --port 9925
+    MEALIE_URL=http://127.0.0.1:9925/api MEALIE_TOKEN=fake mealie-mcp
+
+Faults are injected before a request reaches its handler, in this order:
+a token-bucket rate limit (429 with Retry-After), a random error rate
+(503), then ``latency`` seconds (plus up to ``jitter``) of delay. They can
+be changed between requests by assigning the attributes.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
+import httpx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+# Vocabulary for synthetic recipe names and ingredients
+PROTEINS = ("chicken", "beef", "pork", "salmon", "tofu", "lentil", "prawn", "lamb", "egg")
+STYLES = ("curry", "stir fry", "tacos", "bake", "salad", "soup", "pasta", "bowl", "pie", "stew")
+ADJECTIVES = ("spicy", "creamy", "quick", "smoky", "lemony", "garlic", "herby", "crispy")
+PANTRY = (
+    "rice",
+    "onion",
+    "garlic clove",
+    "tinned tomatoes",
+    "olive oil",
+    "spinach",
+    "coconut milk",
+    "carrot",
+    "potato",
+    "feta",
+    "soy sauce",
+    "chilli",
+)
+TAGS = ("quick", "family", "meal-prep", "vegetarian", "high-protein", "budget")
+CATEGORIES = ("breakfast", "lunch", "dinner", "dessert")
+
+SUMMARY_FIELDS = (
+    "id",
+    "slug",
+    "name",
+    "description",
+    "tags",
+    "recipeCategory",
+    "prepTime",
+    "totalTime",
+    "rating",
+    "dateUpdated",
+)
+
+_NAMESPACE = uuid.UUID("6f1c1d3e-9a0b-4c55-8d3e-2f7a4b1c0e99")
+
+
+def _id(kind: str, key: object) -> str:
+    return str(uuid.uuid5(_NAMESPACE, f"{kind}:{key}"))
+
+
+def _slugify(name: str) -> str:
+    return "-".join("".join(c if c.isalnum() else " " for c in name.lower()).split())
+
+
+def _organizer(kind: str, name: str) -> dict:
+    return {"id": _id(kind, name), "slug": _slugify(name), "name": name.replace("-", " ").title()}
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def make_recipe(index: int, rng: random.Random) -> dict:
+    """Build one synthetic recipe in Mealie's JSON shape.
+
+    Args:
+        index: Position in the library (makes names and slugs unique)
+        rng: Seeded random source
+
+    Returns:
+        Full recipe JSON
+    """
+    protein = rng.choice(PROTEINS)
+    name = f"{rng.choice(ADJECTIVES).title()} {protein.title()} {rng.choice(STYLES).title()}"
+    name = f"{name} {index}"
+    ingredients = [f"{rng.randint(100, 600)}g {protein}"] + [
+        f"{rng.randint(1, 3)} {item}" for item in rng.sample(PANTRY, rng.randint(4, 9))
+    ]
+    prep = rng.choice((10, 15, 20, 30, 45))
+    return {
+        "id": _id("recipe", index),
+        "slug": _slugify(name),
+        "name": name,
+        "description": f"A {rng.choice(ADJECTIVES)} {protein} dish for weeknights.",
+        "tags": [_organizer("tag", t) for t in rng.sample(TAGS, rng.randint(1, 3))],
+        "recipeCategory": [_organizer("category", rng.choice(CATEGORIES))],
+        "prepTime": f"{prep} minutes",
+        "totalTime": f"{prep + rng.choice((10, 20, 30))} minutes",
+        "rating": rng.randint(1, 5),
+        "dateUpdated": f"2026-01-{1 + index % 28:02d}T12:00:00",
+        "recipeYield": "4 servings",
+        "recipeIngredient": [{"display": text, "note": text} for text in ingredients],
+        "recipeInstructions": [
+            {"text": f"Step {n}: prepare and cook the {protein}."} for n in range(1, 6)
+        ],
+        "nutrition": {
+            "calories": f"{rng.randint(350, 900)} kcal",
+            "proteinContent": f"{rng.randint(10, 60)} g",
+            "carbohydrateContent": f"{rng.randint(20, 110)} g",
+            "fatContent": f"{rng.randint(5, 40)} g",
+        },
+        "notes": [],
+        "orgURL": None,
+    }
+
+
+class FakeMealie:
+    """Stateful fake of the Mealie API, usable as an ASGI app."""
+
+    base_url = "http://fake-mealie/api"
+
+    def __init__(
+        self,
+        recipes: int = 500,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: float | None = None,
+        token: str | None = None,
+        seed: int = 0,
+    ):
+        """Generate the library.
+
+        Args:
+            recipes: Number of synthetic recipes
+            latency: Seconds added to every response
+            jitter: Extra random delay of up to this many seconds
+            error_rate: Fraction of requests answered with 503
+            rate_limit: Requests per second before answering 429 (None for unlimited)
+            token: Bearer token to require (None accepts any)
+            seed: Random seed for the library and fault injection
+        """
+        rng = random.Random(seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.token = token
+        self._rng = random.Random(seed + 1)
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+
+        self.recipes: dict[str, dict] = {}
+        self._slugs: dict[str, str] = {}
+        for i in range(recipes):
+            self._store_recipe(make_recipe(i, rng))
+        self.tags = {t["id"]: t for t in (_organizer("tag", n) for n in TAGS)}
+        self.categories = {c["id"]: c for c in (_organizer("category", n) for n in CATEGORIES)}
+        self.meal_plans: dict[int, dict] = {}
+        self.shopping_lists = {
+            _id("list", "groceries"): {"name": "Groceries", "listItems": []},
+        }
+        self.timeline: list[dict] = []
+        self.images: dict[str, int] = {}  # recipe id -> uploaded bytes
+        self._next = Counter()
+
+        # Requests seen, by "METHOD /route" and by status code
+        self.requests: Counter[str] = Counter()
+        self.statuses: Counter[int] = Counter()
+
+        self.router = Starlette(
+            routes=[
+                Route("/api/app/about", self.about),
+                Route("/api/users/self", self.users_self),
+                Route("/api/recipes", self.list_recipes),
+                Route("/api/recipes", self.create_recipe, methods=["POST"]),
+                Route("/api/recipes/create/url", self.create_from_url, methods=["POST"]),
+                Route("/api/recipes/timeline/events", self.list_timeline),
+                Route("/api/recipes/timeline/events", self.create_event, methods=["POST"]),
+                Route("/api/recipes/{key}", self.get_recipe),
+                Route("/api/recipes/{key}", self.update_recipe, methods=["PATCH", "PUT"]),
+                Route("/api/recipes/{key}", self.delete_recipe, methods=["DELETE"]),
+                Route("/api/recipes/{key}/last-made", self.last_made, methods=["PATCH"]),
+                Route("/api/recipes/{key}/image", self.upload_image, methods=["PUT"]),
+                Route("/api/organizers/tags", self.list_tags),
+                Route("/api/organizers/tags", self.create_tag, methods=["POST"]),
+                Route("/api/organizers/categories", self.list_categories),
+                Route("/api/organizers/categories", self.create_category, methods=["POST"]),
+                Route("/api/households/mealplans", self.list_meal_plans),
+                Route("/api/households/mealplans", self.create_meal_plan, methods=["POST"]),
+                Route(
+                    "/api/households/mealplans/{entry_id}",
+                    self.delete_meal_plan,
+                    methods=["DELETE"],
+                ),
+                Route("/api/households/shopping/lists", self.list_shopping_lists),
+                Route("/api/households/shopping/lists/{list_id}", self.get_shopping_list),
+                Route(
+                    "/api/households/shopping/lists/{list_id}/items",
+                    self.add_shopping_list_item,
+                    methods=["POST"],
+                ),
+                Route(
+                    "/api/households/shopping/lists/{list_id}/items/{item_id}",
+                    self.delete_shopping_list_item,
+                    methods=["DELETE"],
+                ),
+                Route(
+                    "/api/households/shopping/items/create-bulk",
+                    self.create_items_bulk,
+                    methods=["POST"],
+                ),
+            ]
+        )
+
+    # ASGI entry point and fault injection
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        """Inject faults, then route the request."""
+        if scope["type"] == "http":
+            fault = await self._fault(scope)
+            if fault is not None:
+                self.statuses[fault.status_code] += 1
+                await fault(scope, receive, send)
+                return
+        await self.router(scope, receive, send)
+
+    def transport(self) -> httpx.ASGITransport:
+        """httpx transport that routes MealieClient requests into this app."""
+        return httpx.ASGITransport(app=self)
+
+    async def _fault(self, scope: dict) -> JSONResponse | None:
+        if self.rate_limit:
+            now = time.monotonic()
+            elapsed, self._refilled = now - self._refilled, now
+            self._tokens = min(self.rate_limit, self._tokens + elapsed * self.rate_limit)
+            if self._tokens < 1:
+                wait = math.ceil((1 - self._tokens) / self.rate_limit)
+                return JSONResponse(
+                    {"detail": "Too many requests"},
+                    status_code=429,
+                    headers={"Retry-After": str(wait)},
+                )
+            self._tokens -= 1
+
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return JSONResponse({"detail": "Injected failure"}, status_code=503)
+
+        if self.token is not None:
+            headers = dict(scope.get("headers") or [])
+            if headers.get(b"authorization", b"").decode() != f"Bearer {self.token}":
+                return JSONResponse({"detail": "Not authenticated"}, status_code=401)
+
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        return None
+
+    # Helpers
+
+    def _respond(self, request: Request, body: object, status_code: int = 200) -> JSONResponse:
+        route = request.scope.get("route")
+        self.requests[f"{request.method} {route.path if route else request.url.path}"] += 1
+        self.statuses[status_code] += 1
+        return JSONResponse(body, status_code=status_code)
+
+    def _not_found(self, request: Request) -> JSONResponse:
+        return self._respond(request, {"detail": "Not found"}, 404)
+
+    def _next_id(self, kind: str) -> int:
+        self._next[kind] += 1
+        return self._next[kind]
+
+    def _store_recipe(self, recipe: dict) -> None:
+        self.recipes[recipe["id"]] = recipe
+        self._slugs[recipe["slug"]] = recipe["id"]
+
+    def _recipe(self, key: str) -> dict | None:
+        return self.recipes.get(self._slugs.get(key, key))
+
+    def _new_recipe(self, name: str, **fields: Any) -> dict:
+        slug = base = _slugify(name) or "recipe"
+        n = 1
+        while slug in self._slugs:
+            n += 1
+            slug = f"{base}-{n}"
+        recipe = {
+            "id": str(uuid.uuid4()),
+            "slug": slug,
+            "name": name,
+            "description": None,
+            "tags": [],
+            "recipeCategory": [],
+            "prepTime": None,
+            "totalTime": None,
+            "rating": None,
+            "dateUpdated": _now(),
+            "recipeYield": None,
+            "recipeIngredient": [],
+            "recipeInstructions": [],
+            "nutrition": None,
+            "notes": [],
+            "orgURL": None,
+            **fields,
+        }
+        self._store_recipe(recipe)
+        return recipe
+
+    @staticmethod
+    def _summary(recipe: dict) -> dict:
+        return {k: recipe[k] for k in SUMMARY_FIELDS}
+
+    @staticmethod
+    def _page(items: list, request: Request) -> dict:
+        page = int(request.query_params.get("page", 1))
+        per_page = int(request.query_params.get("perPage", 50))
+        if per_page < 0:
+            chunk, total_pages = items, 1
+        else:
+            chunk = items[(page - 1) * per_page : page * per_page]
+            total_pages = -(-len(items) // per_page) if per_page else 0
+        return {
+            "page": page,
+            "perPage": per_page,
+            "total": len(items),
+            "totalPages": total_pages,
+            "items": chunk,
+        }
+
+    # App and users
+
+    async def about(self, request: Request) -> JSONResponse:
+        return self._respond(request, {"version": "fake", "production": False})
+
+    async def users_self(self, request: Request) -> JSONResponse:
+        return self._respond(request, {"id": _id("user", 1), "groupId": _id("group", 1)})
+
+    # Recipes
+
+    async def list_recipes(self, request: Request) -> JSONResponse:
+        params = request.query_params
+        matches = list(self.recipes.values())
+        if search := params.get("search"):
+            needle = search.lower()
+            matches = [
+                r
+                for r in matches
+                if needle in r["name"].lower() or needle in (r["description"] or "").lower()
+            ]
+        for key, field in (("tags", "tags"), ("categories", "recipeCategory")):
+            wanted = set(params.getlist(key))
+            if wanted:
+                matches = [r for r in matches if wanted & {o["slug"] for o in r[field]}]
+        if query_filter := params.get("queryFilter"):
+            # Only the dateUpdated > "..." and slug = / IN forms the callers send
+            if "dateUpdated >" in query_filter:
+                since = query_filter.split('"')[1]
+                matches = [r for r in matches if r["dateUpdated"] > since]
+            elif query_filter.startswith("slug"):
+                slugs = set(query_filter.split('"')[1::2])
+                matches = [r for r in matches if r["slug"] in slugs]
+        summaries = [self._summary(r) for r in matches]
+        return self._respond(request, self._page(summaries, request))
+
+    async def get_recipe(self, request: Request) -> JSONResponse:
+        recipe = self._recipe(request.path_params["key"])
+        if recipe is None:
+            return self._not_found(request)
+        return self._respond(request, recipe)
+
+    async def create_recipe(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        recipe = self._new_recipe(body.get("name", "Untitled"))
+        return self._respond(request, recipe["slug"], 201)
+
+    async def create_from_url(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        url = body.get("url", "")
+        name = url.rstrip("/").rsplit("/", 1)[-1].replace("-", " ").title() or "Imported Recipe"
+        recipe = self._new_recipe(
+            name,
+            orgURL=url,
+            recipeIngredient=[{"display": "2 cups flour"}, {"display": "1 packet seasoning"}],
+            recipeInstructions=[{"text": "Cook it."}],
+        )
+        return self._respond(request, recipe["slug"], 201)
+
+    async def update_recipe(self, request: Request) -> JSONResponse:
+        recipe = self._recipe(request.path_params["key"])
+        if recipe is None:
+            return self._not_found(request)
+        body = await request.json()
+        recipe.update({k: v for k, v in body.items() if k not in ("id", "slug")})
+        recipe["dateUpdated"] = _now()
+        return self._respond(request, recipe)
+
+    async def delete_recipe(self, request: Request) -> JSONResponse:
+        recipe = self._recipe(request.path_params["key"])
+        if recipe is None:
+            return self._not_found(request)
+        del self.recipes[recipe["id"]]
+        self._slugs.pop(recipe["slug"], None)
+        return self._respond(request, recipe)
+
+    async def last_made(self, request: Request) -> JSONResponse:
+        recipe = self._recipe(request.path_params["key"])
+        if recipe is None:
+            return self._not_found(request)
+        recipe["lastMade"] = (await request.json()).get("timestamp")
+        return self._respond(request, recipe)
+
+    async def upload_image(self, request: Request) -> JSONResponse:
+        recipe = self._recipe(request.path_params["key"])
+        if recipe is None:
+            return self._not_found(request)
+        self.images[recipe["id"]] = len(await request.body())
+        recipe["image"] = recipe["id"]
+        return self._respond(request, {"image": recipe["id"]})
+
+    # Timeline
+
+    async def list_timeline(self, request: Request) -> JSONResponse:
+        events = self.timeline
+        query_filter = request.query_params.get("queryFilter", "")
+        if "recipeId" in query_filter:
+            recipe_id = query_filter.split('"')[1]
+            events = [e for e in events if e["recipeId"] == recipe_id]
+        events = sorted(events, key=lambda e: e["timestamp"], reverse=True)
+        return self._respond(request, self._page(events, request))
+
+    async def create_event(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        if body.get("recipeId") not in self.recipes:
+            return self._not_found(request)
+        event = {
+            "id": str(uuid.uuid4()),
+            "recipeId": body["recipeId"],
+            "userId": _id("user", 1),
+            "subject": body.get("subject", ""),
+            "eventType": body.get("eventType", "comment"),
+            "eventMessage": body.get("eventMessage"),
+            "timestamp": body.get("timestamp") or _now(),
+        }
+        self.timeline.append(event)
+        return self._respond(request, event, 201)
+
+    # Organizers
+
+    async def list_tags(self, request: Request) -> JSONResponse:
+        return self._respond(request, self._page(list(self.tags.values()), request))
+
+    async def create_tag(self, request: Request) -> JSONResponse:
+        tag = _organizer("tag", (await request.json())["name"])
+        self.tags[tag["id"]] = tag
+        return self._respond(request, tag, 201)
+
+    async def list_categories(self, request: Request) -> JSONResponse:
+        return self._respond(request, self._page(list(self.categories.values()), request))
+
+    async def create_category(self, request: Request) -> JSONResponse:
+        category = _organizer("category", (await request.json())["name"])
+        self.categories[category["id"]] = category
+        return self._respond(request, category, 201)
+
+    # Meal plans
+
+    async def list_meal_plans(self, request: Request) -> JSONResponse:
+        start = request.query_params.get("start_date", "")
+        end = request.query_params.get("end_date", "9999-12-31")
+        entries = [e for e in self.meal_plans.values() if start <= e["date"] <= end]
+        return self._respond(request, self._page(entries, request))
+
+    async def create_meal_plan(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        recipe = self.recipes.get(body.get("recipeId") or "")
+        if body.get("recipeId") and recipe is None:
+            return self._respond(request, {"detail": "Recipe not found"}, 422)
+        entry_id = self._next_id("mealplan")
+        entry = {
+            "id": entry_id,
+            "date": body["date"],
+            "entryType": body.get("entryType", "dinner"),
+            "recipeId": body.get("recipeId"),
+            "recipe": self._summary(recipe) if recipe else None,
+            "title": body.get("title"),
+            "text": body.get("text"),
+        }
+        self.meal_plans[entry_id] = entry
+        return self._respond(request, entry, 201)
+
+    async def delete_meal_plan(self, request: Request) -> JSONResponse:
+        entry = self.meal_plans.pop(int(request.path_params["entry_id"]), None)
+        if entry is None:
+            return self._not_found(request)
+        return self._respond(request, entry)
+
+    # Shopping lists
+
+    def _new_item(self, list_id: str, body: dict) -> dict:
+        item = {
+            "id": str(uuid.uuid4()),
+            "shoppingListId": list_id,
+            "note": body.get("note"),
+            "display": body.get("note"),
+            "quantity": body.get("quantity", 1),
+            "checked": body.get("checked", False),
+        }
+        self.shopping_lists[list_id]["listItems"].append(item)
+        return item
+
+    async def list_shopping_lists(self, request: Request) -> JSONResponse:
+        lists = [{"id": k, "name": v["name"]} for k, v in self.shopping_lists.items()]
+        return self._respond(request, self._page(lists, request))
+
+    async def get_shopping_list(self, request: Request) -> JSONResponse:
+        list_id = request.path_params["list_id"]
+        shopping_list = self.shopping_lists.get(list_id)
+        if shopping_list is None:
+            return self._not_found(request)
+        return self._respond(request, {"id": list_id, **shopping_list})
+
+    async def add_shopping_list_item(self, request: Request) -> JSONResponse:
+        list_id = request.path_params["list_id"]
+        if list_id not in self.shopping_lists:
+            return self._not_found(request)
+        return self._respond(request, self._new_item(list_id, await request.json()), 201)
+
+    async def delete_shopping_list_item(self, request: Request) -> JSONResponse:
+        shopping_list = self.shopping_lists.get(request.path_params["list_id"])
+        if shopping_list is None:
+            return self._not_found(request)
+        items = shopping_list["listItems"]
+        kept = [i for i in items if i["id"] != request.path_params["item_id"]]
+        if len(kept) == len(items):
+            return self._not_found(request)
+        shopping_list["listItems"] = kept
+        return self._respond(request, {"success": True})
+
+    async def create_items_bulk(self, request: Request) -> JSONResponse:
+        created = []
+        for body in await request.json():
+            if body.get("shoppingListId") not in self.shopping_lists:
+                return self._respond(request, {"detail": "Shopping list not found"}, 422)
+            created.append(self._new_item(body["shoppingListId"], body))
+        return self._respond(
+            request, {"createdItems": created, "updatedItems": [], "deletedItems": []}, 201
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve a FakeMealie over HTTP with uvicorn."""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a fake Mealie API")
+    parser.add_argument("--recipes", type=int, default=2000, help="synthetic library size")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="extra random delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests/sec before 429")
+    parser.add_argument("--token", default=None, help="bearer token to require")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9925)
+    args = parser.parse_args(argv)
+
+    fake = FakeMealie(
+        recipes=args.recipes,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        token=args.token,
+        seed=args.seed,
+    )
+    print(f"Fake Mealie with {len(fake.recipes)} recipes at http://{args.host}:{args.port}/api")
+    uvicorn.run(fake, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
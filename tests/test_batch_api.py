@@ -0,0 +1,230 @@
+"""Tests for the Message Batches execution mode of the QA pipeline."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from scripts.bulk_import_hellofresh import llm_usage
+from scripts.bulk_import_hellofresh.llm_cache import LLMResponseCache
+from scripts.bulk_import_hellofresh.qa import batch_api
+
+
+def _message(text: str, stop_reason: str = "end_turn") -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+        stop_reason=stop_reason,
+        model="test-model",
+    )
+
+
+class FakeStream:
+    """Context manager standing in for messages.stream()."""
+
+    def __init__(self, message: SimpleNamespace):
+        self.message = message
+        self.text_stream = iter([message.content[0].text])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_final_message(self):
+        return self.message
+
+
+class FakeBatches:
+    """In-process stand-in for client.messages.batches."""
+
+    def __init__(self, outcomes: dict[str, tuple[str, str]], polls: int = 1):
+        self.outcomes = outcomes
+        self.polls = polls
+        self.submitted: list[dict] = []
+
+    def _batch(self, status: str) -> SimpleNamespace:
+        counts = SimpleNamespace(processing=0, succeeded=0, errored=0)
+        return SimpleNamespace(id="batch-1", processing_status=status, request_counts=counts)
+
+    def create(self, requests):
+        self.submitted.extend(requests)
+        return self._batch("in_progress")
+
+    def retrieve(self, batch_id):
+        self.polls -= 1
+        return self._batch("ended" if self.polls <= 0 else "in_progress")
+
+    def results(self, batch_id):
+        for request in self.submitted:
+            custom_id = request["custom_id"]
+            if custom_id not in self.outcomes:
+                continue  # the batch lost this request entirely
+            kind, text = self.outcomes[custom_id]
+            message = _message(text) if kind == "succeeded" else None
+            yield SimpleNamespace(
+                custom_id=custom_id, result=SimpleNamespace(type=kind, message=message)
+            )
+
+
+class FakeClient:
+    """Anthropic client with batch endpoints and an interactive stream."""
+
+    def __init__(self, outcomes: dict[str, tuple[str, str]], interactive: str = "retried"):
+        self.batches = FakeBatches(outcomes)
+        self.streamed: list[dict] = []
+        self.interactive = interactive
+        self.messages = SimpleNamespace(batches=self.batches, stream=self._stream)
+
+    def _stream(self, **params):
+        self.streamed.append(params)
+        return FakeStream(_message(self.interactive))
+
+
+def request(custom_id: str, prompt: str | None = None) -> dict:
+    return {
+        "custom_id": custom_id,
+        "params": {
+            "model": "test-model",
+            "max_tokens": 100,
+            "messages": [{"role": "user", "content": prompt or custom_id}],
+        },
+        "phase": "test",
+    }
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Route the batch module at a fresh on-disk response cache."""
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    monkeypatch.setattr(batch_api, "get_cache", lambda: cache)
+    monkeypatch.setattr("scripts.bulk_import_hellofresh.llm_cache.get_cache", lambda: cache)
+    llm_usage.reset()
+    yield cache
+    cache.close()
+    llm_usage.reset()
+
+
+class TestRunMessageBatch:
+    """Tests for run_message_batch."""
+
+    @pytest.mark.asyncio
+    async def test_results_mapped_by_custom_id(self, cache):
+        """Results are matched to requests by custom_id, not by position."""
+        client = FakeClient({"b": ("succeeded", "text b"), "a": ("succeeded", "text a")})
+
+        texts = await batch_api.run_message_batch(
+            [request("a"), request("b")], client=client, poll_interval=0
+        )
+
+        assert texts == {"a": "text a", "b": "text b"}
+        assert [r["custom_id"] for r in client.batches.submitted] == ["a", "b"]
+        assert llm_usage.summary()["test"]["requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_entries_are_none_without_retry(self, cache):
+        """Errored, expired and missing entries map to None."""
+        client = FakeClient(
+            {
+                "ok": ("succeeded", "fine"),
+                "err": ("errored", ""),
+                "exp": ("expired", ""),
+            }
+        )
+
+        texts = await batch_api.run_message_batch(
+            [request("ok"), request("err"), request("exp"), request("lost")],
+            client=client,
+            poll_interval=0,
+            retry_failed=False,
+        )
+
+        assert texts == {"ok": "fine", "err": None, "exp": None, "lost": None}
+        assert client.streamed == []
+
+    @pytest.mark.asyncio
+    async def test_failed_entries_fall_back_to_interactive(self, cache):
+        """Requests that fail in the batch are resent as interactive calls."""
+        client = FakeClient(
+            {"ok": ("succeeded", "fine"), "err": ("errored", ""), "exp": ("expired", "")}
+        )
+
+        texts = await batch_api.run_message_batch(
+            [request("ok"), request("err"), request("exp")], client=client, poll_interval=0
+        )
+
+        assert texts == {"ok": "fine", "err": "retried", "exp": "retried"}
+        assert [p["messages"][0]["content"] for p in client.streamed] == ["err", "exp"]
+        # The interactive answers are cached like any other complete response
+        key = LLMResponseCache.make_key(
+            "test-model", [{"role": "user", "content": "err"}], max_tokens=100
+        )
+        assert cache.get(key) == "retried"
+
+    @pytest.mark.asyncio
+    async def test_cached_requests_are_not_submitted(self, cache):
+        """Requests already in the response cache are answered locally."""
+        params = request("a")["params"]
+        key = LLMResponseCache.make_key(
+            params["model"], params["messages"], max_tokens=params["max_tokens"]
+        )
+        cache.set(key, "test-model", "from cache")
+        client = FakeClient({"b": ("succeeded", "text b")})
+
+        texts = await batch_api.run_message_batch(
+            [request("a"), request("b")], client=client, poll_interval=0
+        )
+
+        assert texts == {"a": "from cache", "b": "text b"}
+        assert [r["custom_id"] for r in client.batches.submitted] == ["b"]
+        assert llm_usage.summary()["test"]["local_cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_results_written_to_cache(self, cache):
+        """Successful batch results are cached, so a rerun submits nothing."""
+        client = FakeClient({"a": ("succeeded", "text a")})
+        await batch_api.run_message_batch([request("a")], client=client, poll_interval=0)
+
+        rerun = FakeClient({})
+        texts = await batch_api.run_message_batch([request("a")], client=rerun, poll_interval=0)
+
+        assert texts == {"a": "text a"}
+        assert rerun.batches.submitted == []
+
+
+class TestRunPhasesViaBatchApi:
+    """Tests for run_phases_via_batch_api."""
+
+    @pytest.mark.asyncio
+    async def test_results_parsed_per_phase(self, cache):
+        """Batch texts are parsed back into per-phase update lists by slug."""
+        recipes = [
+            {"slug": "beef-ragu", "name": "Beef Ragu", "recipeIngredient": []},
+            {"slug": "pita-pockets", "name": "Pita Pockets", "recipeIngredient": []},
+        ]
+        answer = json.dumps(
+            [
+                {"index": 2, "nutrition": {"calories": "520 kcal"}},
+                {"index": 1, "nutrition": {"calories": "610 kcal"}},
+            ]
+        )
+        client = FakeClient({"nutrition-0": ("succeeded", answer)})
+
+        results = await batch_api.run_phases_via_batch_api(
+            recipes, ["nutrition"], client=client, poll_interval=0
+        )
+
+        by_slug = {r["slug"]: r["nutrition"]["calories"] for r in results["nutrition"]}
+        assert by_slug == {"pita-pockets": "520 kcal", "beef-ragu": "610 kcal"}
+
+    @pytest.mark.asyncio
+    async def test_unrecoverable_failure_yields_no_updates(self, cache):
+        """A request that fails in the batch and the retry contributes nothing."""
+        recipes = [{"slug": "beef-ragu", "name": "Beef Ragu", "recipeIngredient": []}]
+        client = FakeClient({"nutrition-0": ("errored", "")}, interactive="not json")
+
+        results = await batch_api.run_phases_via_batch_api(
+            recipes, ["nutrition"], client=client, poll_interval=0
+        )
+
+        assert results == {"nutrition": []}
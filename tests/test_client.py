@@ -1,10 +1,15 @@
 """Tests for the Mealie API client."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from mealie_mcp.client import MealieClient
+from mealie_mcp.client import MealieClient, RecipeRef, RecipeRefCache
 from mealie_mcp.models import ErrorResponse
+from mealie_mcp.resilience import CircuitBreaker, RetryPolicy, parse_retry_after
 
 
 @pytest.fixture
@@ -13,6 +18,7 @@ def client():
     return MealieClient(
         base_url="http://test-mealie:9000/api",
         token="test-token",
+        retry_policy=RetryPolicy(retries=0),  # retries are covered in TestResilience
     )
 
 
@@ -64,6 +70,40 @@ class TestRecipes:
         )
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_search_recipes_with_query_filter(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Test recipe search with a queryFilter expression."""
+        httpx_mock.add_response(
+            method="GET",
+            url=httpx.URL(
+                "http://test-mealie:9000/api/recipes",
+                params={
+                    "page": 1,
+                    "perPage": 50,
+                    "queryFilter": 'dateUpdated > "2024-05-01T10:00:00"',
+                },
+            ),
+            json={
+                "items": [
+                    {
+                        "id": "recipe-1",
+                        "slug": "spaghetti-carbonara",
+                        "name": "Spaghetti Carbonara",
+                        "dateUpdated": "2024-05-02T08:30:00",
+                    }
+                ],
+            },
+        )
+
+        result = await client.search_recipes(
+            per_page=50,
+            query_filter='dateUpdated > "2024-05-01T10:00:00"',
+        )
+        assert len(result) == 1
+        assert result[0].date_updated == "2024-05-02T08:30:00"
+
     @pytest.mark.asyncio
     async def test_get_recipe_success(self, client: MealieClient, httpx_mock: HTTPXMock):
         """Test getting a single recipe."""
@@ -133,7 +173,7 @@ class TestMealPlans:
         """Test getting meal plan for a date range."""
         httpx_mock.add_response(
             method="GET",
-            url="http://test-mealie:9000/api/households/mealplans?start_date=2026-01-01&end_date=2026-01-07",
+            url="http://test-mealie:9000/api/households/mealplans?start_date=2026-01-01&end_date=2026-01-07&page=1&perPage=100",
             json={
                 "items": [
                     {
@@ -251,6 +291,32 @@ class TestShoppingLists:
         assert result.id == "new-item"
         assert result.note == "2 cups flour"
 
+    @pytest.mark.asyncio
+    async def test_add_shopping_list_items(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """Several items are added in one bulk request."""
+        httpx_mock.add_response(
+            method="POST",
+            url="http://test-mealie:9000/api/households/shopping/items/create-bulk",
+            json={
+                "createdItems": [
+                    {"id": "a", "shoppingListId": "list-1", "note": "600 g chicken breast"},
+                    {"id": "b", "shoppingListId": "list-1", "note": "2 onions"},
+                ],
+                "updatedItems": [],
+            },
+        )
+
+        result = await client.add_shopping_list_items("list-1", ["600 g chicken breast", "2 onions"])
+
+        assert [i.id for i in result] == ["a", "b"]
+        body = json.loads(httpx_mock.get_requests()[0].content)
+        assert body[1] == {
+            "shoppingListId": "list-1",
+            "note": "2 onions",
+            "quantity": 1,
+            "checked": False,
+        }
+
 
 class TestErrorHandling:
     """Tests for error handling."""
@@ -279,3 +345,310 @@ class TestErrorHandling:
         assert isinstance(result, ErrorResponse)
         assert result.code == "API_ERROR"
         assert "Cannot connect" in result.message
+
+
+class TestRecipeRefs:
+    """Tests for slug/ID resolution without full recipe fetches."""
+
+    RECIPE_UUID = "6c1b3bb2-5d0a-4f0e-9a53-2f2c3f6d7e81"
+
+    @pytest.mark.asyncio
+    async def test_meal_plan_entry_uses_id_from_search(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """A slug seen in search results is resolved without GET /recipes/{slug}."""
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes?page=1&perPage=20",
+            json={
+                "items": [
+                    {"id": self.RECIPE_UUID, "slug": "beef-tacos", "name": "Beef Tacos"},
+                ]
+            },
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://test-mealie:9000/api/households/mealplans",
+            json={
+                "id": 7,
+                "date": "2026-01-05",
+                "entryType": "dinner",
+                "recipeId": self.RECIPE_UUID,
+            },
+        )
+
+        await client.search_recipes()
+        result = await client.create_meal_plan_entry("2026-01-05", "beef-tacos")
+
+        assert result.recipe_id == self.RECIPE_UUID
+        requests = httpx_mock.get_requests()
+        assert [r.method for r in requests] == ["GET", "POST"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_fetches_once(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """A cache miss fetches the recipe once; later lookups by slug or ID hit."""
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/beef-tacos",
+            json={"id": self.RECIPE_UUID, "slug": "beef-tacos", "name": "Beef Tacos"},
+        )
+
+        first = await client.resolve_recipe_ref("beef-tacos")
+        by_slug = await client.resolve_recipe_ref("beef-tacos")
+        by_id = await client.resolve_recipe_ref(self.RECIPE_UUID)
+
+        assert first == by_slug == by_id
+        assert first.name == "Beef Tacos"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_resolve_many_fetches_only_misses(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Cache misses are fetched one recipe each; the library is never listed."""
+        client.recipe_refs.put(RecipeRef("recipe-3", "soup", "Soup"))
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/beef-tacos",
+            json={"id": self.RECIPE_UUID, "slug": "beef-tacos", "name": "Beef Tacos"},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/dahl",
+            json={"id": "recipe-2", "slug": "dahl", "name": "Dahl"},
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/nope",
+            status_code=404,
+            json={"detail": "Not found"},
+        )
+
+        result = await client.resolve_recipe_refs(["beef-tacos", "dahl", "nope", "dahl", "soup"])
+
+        assert result["beef-tacos"].id == self.RECIPE_UUID
+        assert result["dahl"].id == "recipe-2"
+        assert result["nope"].code == "NOT_FOUND"
+        assert result["soup"].id == "recipe-3"
+        assert len(httpx_mock.get_requests()) == 3
+        assert client.recipe_refs.get("dahl").id == "recipe-2"
+
+    @pytest.mark.asyncio
+    async def test_create_recipe_seeds_cache(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """A newly created recipe can be referenced without another lookup."""
+        httpx_mock.add_response(
+            method="POST", url="http://test-mealie:9000/api/recipes", json="beef-tacos"
+        )
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/beef-tacos",
+            json={"id": self.RECIPE_UUID, "slug": "beef-tacos", "name": "Beef Tacos"},
+        )
+
+        assert await client.create_recipe("Beef Tacos") == "beef-tacos"
+        assert (await client.resolve_recipe_ref("beef-tacos")).id == self.RECIPE_UUID
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_cache_is_bounded_and_tracks_renames(self):
+        """Least recently used entries are evicted and renamed slugs are dropped."""
+        from types import SimpleNamespace
+
+        cache = RecipeRefCache(max_size=2)
+        cache.put(SimpleNamespace(id="1", slug="a", name="A"))
+        cache.put(SimpleNamespace(id="2", slug="b", name="B"))
+        cache.get("a")  # touch so "b" is least recently used
+        cache.put(SimpleNamespace(id="3", slug="c", name="C"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").id == "1"
+        assert len(cache) == 2
+
+        cache.put(SimpleNamespace(id="1", slug="a-renamed", name="A"))
+        assert cache.get("a") is None
+        assert cache.get("a-renamed").id == "1"
+
+
+class TestCoalescing:
+    """Tests for single-flight GET coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Concurrent identical GETs send one request and all get the result."""
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/users/self",
+            json={"id": "user-1", "groupId": "group-1"},
+        )
+
+        results = await asyncio.gather(*(client.get_group_id() for _ in range(5)))
+
+        assert results == ["group-1"] * 5
+        assert len(httpx_mock.get_requests()) == 1
+        stats = client.coalescing_stats()
+        assert stats["sent"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_params_and_writes_are_not_coalesced(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Only GETs with the same endpoint and params share a request."""
+        for page in (1, 2):
+            httpx_mock.add_response(
+                method="GET",
+                url=f"http://test-mealie:9000/api/recipes?page={page}&perPage=20",
+                json={"items": []},
+            )
+        httpx_mock.add_response(
+            method="POST",
+            url="http://test-mealie:9000/api/organizers/tags",
+            json={"id": "t", "slug": "t", "name": "T"},
+            is_reusable=True,
+        )
+
+        await asyncio.gather(
+            client.search_recipes(page=1),
+            client.search_recipes(page=2),
+            client.create_tag("T"),
+            client.create_tag("T"),
+        )
+
+        assert len(httpx_mock.get_requests()) == 4
+        assert client.coalescing_stats()["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Cancelling one waiter leaves the shared request running for the rest."""
+        httpx_mock.add_response(
+            method="GET",
+            url="http://test-mealie:9000/api/recipes/pasta",
+            json={"id": "r1", "slug": "pasta", "name": "Pasta"},
+        )
+
+        first = asyncio.ensure_future(client.get_recipe("pasta"))
+        second = asyncio.ensure_future(client.get_recipe("pasta"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        recipe = await second
+        assert recipe.slug == "pasta"
+        assert first.cancelled()
+
+
+class TestResilience:
+    """Tests for retries and the circuit breaker."""
+
+    @pytest.fixture
+    def retrying_client(self):
+        """Client that retries immediately."""
+        return MealieClient(
+            base_url="http://test-mealie:9000/api",
+            token="test-token",
+            retry_policy=RetryPolicy(retries=2, backoff=0),
+            circuit_breaker=CircuitBreaker(threshold=2, reset_timeout=60),
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_retries_transient_errors(
+        self, retrying_client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """A 503 then a success returns the success after one retry."""
+        url = "http://test-mealie:9000/api/recipes/pasta"
+        httpx_mock.add_response(url=url, status_code=503, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=url, json={"id": "r1", "slug": "pasta", "name": "Pasta"})
+
+        recipe = await retrying_client.get_recipe("pasta")
+
+        assert recipe.slug == "pasta"
+        assert retrying_client.resilience_stats()["retries"] == 1
+        assert retrying_client.circuit_breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_post_is_retried_only_if_never_sent(
+        self, retrying_client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """A POST that timed out may have been applied, so it isn't repeated."""
+        httpx_mock.add_exception(httpx.ReadTimeout("slow"))
+
+        result = await retrying_client.create_tag("Quick")
+
+        assert result.code == "API_ERROR"
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(
+        self, retrying_client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Repeated failures open the circuit; later calls skip the network."""
+        httpx_mock.add_exception(httpx.ConnectError("refused"), is_reusable=True)
+
+        first = await retrying_client.search_recipes()
+        second = await retrying_client.search_recipes()
+
+        assert "Cannot connect" in first.message
+        assert "circuit open" in second.message
+        assert len(httpx_mock.get_requests()) == 2
+        stats = retrying_client.resilience_stats()
+        assert stats["circuit"]["state"] == "open"
+        assert stats["short_circuited"] == 1
+
+    def test_breaker_probes_after_reset_timeout(self):
+        """After the cool-down one probe is allowed; success closes the circuit."""
+        breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()  # only one probe at a time
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_half_open_slot(self, httpx_mock: HTTPXMock):
+        """A half-open probe cancelled mid-request lets the next request probe."""
+        breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        client = MealieClient(
+            base_url="http://test-mealie:9000/api",
+            token="test-token",
+            retry_policy=RetryPolicy(retries=0),
+            circuit_breaker=breaker,
+        )
+        started = asyncio.Event()
+
+        async def hang(request: httpx.Request):
+            started.set()
+            await asyncio.Event().wait()
+
+        httpx_mock.add_callback(hang, url="http://test-mealie:9000/api/recipes/pasta")
+        httpx_mock.add_response(
+            url="http://test-mealie:9000/api/recipes/soup",
+            json={"id": "r2", "slug": "soup", "name": "Soup"},
+        )
+
+        probe = asyncio.ensure_future(client._send("GET", "/recipes/pasta"))
+        await started.wait()
+        assert breaker.probing
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert not breaker.probing
+        recipe = await client.get_recipe("soup")
+        assert recipe.slug == "soup"
+        assert breaker.state == "closed"
+
+    def test_retry_policy_delays(self):
+        """Backoff is jittered under the cap; long Retry-After gives up."""
+        policy = RetryPolicy(retries=3, backoff=1, max_delay=5)
+
+        assert 0 <= policy.delay(4) <= 5
+        assert policy.delay(0, retry_after=2) == 2
+        assert policy.delay(0, retry_after=60) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,114 @@
+"""Tests for the fake Mealie API used by benchmarks and load tests."""
+
+from datetime import datetime
+
+import httpx
+import pytest
+
+from mealie_mcp.client import MealieClient
+from mealie_mcp.models import ErrorResponse
+from mealie_mcp.resilience import CircuitBreaker, RetryPolicy
+from tests.fake_mealie import FakeMealie
+
+
+def make_client(fake: FakeMealie, retries: int = 0) -> MealieClient:
+    return MealieClient(
+        base_url=fake.base_url,
+        token="test-token",
+        retry_policy=RetryPolicy(retries=retries, backoff=0.001),
+        circuit_breaker=CircuitBreaker(threshold=1000),
+        transport=fake.transport(),
+    )
+
+
+@pytest.fixture
+def fake():
+    """A small fake library."""
+    return FakeMealie(recipes=50)
+
+
+class TestFakeMealie:
+    """MealieClient end to end against FakeMealie."""
+
+    @pytest.mark.asyncio
+    async def test_recipe_lifecycle(self, fake: FakeMealie):
+        """Recipes can be searched, created, imported, updated and deleted."""
+        client = make_client(fake)
+
+        everything = await client.search_recipes(per_page=-1)
+        assert len(everything) == 50
+
+        slug = await client.create_recipe("Weeknight Dal")
+        assert slug == "weeknight-dal"
+        updated = await client.update_recipe(slug, {"description": "Lentils"})
+        assert updated.description == "Lentils"
+
+        imported = await client.import_recipe_from_url("https://example.com/recipes/green-curry")
+        recipe = await client.get_recipe(imported)
+        assert recipe.org_url == "https://example.com/recipes/green-curry"
+
+        await client.update_recipe_last_made(slug, datetime(2026, 3, 1))
+        await client.create_timeline_event(updated.id, "Cooked it")
+        events = await client.get_recipe_timeline(updated.id)
+        assert [e.subject for e in events] == ["Cooked it"]
+
+        assert await client.upload_recipe_image(slug, b"\xff\xd8jpeg") == {"image": updated.id}
+        assert fake.images[updated.id] > 0
+
+        await client.delete_recipe(slug)
+        missing = await client.get_recipe(slug)
+        assert isinstance(missing, ErrorResponse) and missing.code == "NOT_FOUND"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_meal_plans_and_shopping(self, fake: FakeMealie):
+        """Meal plan entries and shopping items are stored and returned."""
+        client = make_client(fake)
+        slug = next(iter(fake.recipes.values()))["slug"]
+
+        entry = await client.create_meal_plan_entry("2026-03-02", slug)
+        assert entry.recipe.slug == slug
+        assert [e.id for e in await client.get_meal_plan("2026-03-01", "2026-03-07")] == [entry.id]
+        assert await client.get_meal_plan("2026-04-01", "2026-04-07") == []
+
+        list_id = (await client.get_shopping_lists())[0].id
+        await client.add_shopping_list_items(list_id, ["flour", "eggs"])
+        shopping_list = await client.get_shopping_list(list_id)
+        assert [i.note for i in shopping_list.list_items] == ["flour", "eggs"]
+        assert fake.requests["POST /api/households/shopping/items/create-bulk"] == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retried(self):
+        """A 503 error rate is absorbed by retries for reads."""
+        fake = FakeMealie(recipes=10, error_rate=0.3, seed=3)
+        client = make_client(fake, retries=5)
+
+        for _ in range(20):
+            result = await client.search_recipes(per_page=5)
+            assert not isinstance(result, ErrorResponse)
+        assert fake.statuses[503] > 0
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_returns_429_with_retry_after(self):
+        """Requests beyond the token bucket get 429 and a Retry-After header."""
+        fake = FakeMealie(recipes=10, rate_limit=2)
+        transport = fake.transport()
+
+        async with httpx.AsyncClient(transport=transport, base_url=fake.base_url) as http:
+            statuses = [(await http.get("/app/about")) for _ in range(4)]
+
+        assert [r.status_code for r in statuses[:2]] == [200, 200]
+        assert statuses[-1].status_code == 429
+        assert statuses[-1].headers["Retry-After"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_token_is_enforced(self):
+        """With a token configured, other bearer tokens are rejected."""
+        fake = FakeMealie(recipes=5, token="secret")
+        client = make_client(fake)
+
+        result = await client.search_recipes()
+        assert isinstance(result, ErrorResponse) and result.code == "AUTH_ERROR"
+        await client.close()
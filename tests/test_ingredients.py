@@ -0,0 +1,62 @@
+"""Tests for ingredient parsing and aggregation."""
+
+from mealie_mcp.ingredients import aggregate, format_item, parse_ingredient, parse_line, subtract
+from mealie_mcp.models import RecipeIngredient
+
+
+class TestParseLine:
+    """Tests for parse_line."""
+
+    def test_units_convert_to_base(self):
+        """Mass, volume and count units normalize per dimension."""
+        assert parse_line("1kg potatoes")[2:] == ("mass", 1000)
+        assert parse_line("1 1/2 cups basmati rice")[2:] == ("volume", 375)
+        assert parse_line("½ tsp salt")[2:] == ("volume", 2.5)
+        assert parse_line("1/2 cup milk") == ("milk", "milk", "volume", 125)
+        assert parse_line("3/4 tsp salt") == ("salt", "salt", "volume", 3.75)
+        assert parse_line("1/4 red onion") == ("red onion", "red onion", "count", 0.25)
+        assert parse_line("2 tbsp. olive oil").food == "olive oil"
+        assert parse_line("3 cloves garlic, minced")[2:] == ("clove", 3)
+        assert parse_line("1 garlic clove")[2:] == ("clove", 1)
+
+    def test_multipliers_ranges_and_names(self):
+        """'2 x 200g' multiplies, ranges take the top, and food keys are normalized."""
+        item = parse_line("2 x 200g Chicken Breasts, diced")
+        assert item.food == "chicken breast"
+        assert item.quantity == 400
+        assert parse_line("2x200g beef mince") == ("beef mince", "beef mince", "mass", 400)
+        assert parse_line("2-3 tomatoes").quantity == 3
+        assert parse_line("salt and pepper").quantity is None
+        assert parse_line("  ") is None
+
+    def test_unit_spellings_and_size_words(self):
+        """Short tablespoon spellings are units; size words leave the display name."""
+        assert parse_line("2 tbs soy sauce") == ("soy sauce", "soy sauce", "volume", 30)
+        assert parse_line("1 tbl. honey")[2:] == ("volume", 15)
+        assert parse_line("1 large onion") == ("onion", "onion", "count", 1)
+        assert parse_line("1 pinch of salt")[:2] == ("salt", "salt")
+
+    def test_structured_ingredient(self):
+        """Mealie's parsed quantity/unit/food fields are preferred."""
+        item = parse_ingredient(RecipeIngredient(quantity=250, unit="ml", food="milk"))
+        assert item[2:] == ("volume", 250)
+        assert item.food == "milk"
+
+
+class TestAggregate:
+    """Tests for aggregation and subtraction."""
+
+    def test_sums_same_food_and_formats(self):
+        """Identical foods sum across lines and render in a readable unit."""
+        items = aggregate(
+            [parse_line(t) for t in ["200g chicken breast"] * 3 + ["1.2kg potatoes", "300 g potato"]]
+        )
+
+        assert [format_item(i) for i in items] == ["600 g chicken breast", "1.5 kg potatoes"]
+
+    def test_subtracts_what_is_on_the_list(self):
+        """Quantities on the list are subtracted; unquantified items cover the need."""
+        needed = aggregate([parse_line(t) for t in ["600g chicken breast", "3 cloves garlic", "4 eggs"]])
+        have = aggregate([parse_line(t) for t in ["500 g chicken breast", "garlic", "6 eggs"]])
+
+        assert [format_item(i) for i in subtract(needed, have)] == ["100 g chicken breast"]
@@ -0,0 +1,130 @@
+"""Tests for the LLM response cache and per-phase usage accounting."""
+
+from types import SimpleNamespace
+
+import pytest
+from scripts.bulk_import_hellofresh import llm_cache, llm_usage
+from scripts.bulk_import_hellofresh.llm_cache import LLMResponseCache, create_message_text
+
+MESSAGES = [{"role": "user", "content": "Match these titles"}]
+
+
+class FakeStream:
+    """Context manager standing in for messages.stream()."""
+
+    def __init__(self, text: str, stop_reason: str):
+        self.text_stream = iter([text])
+        self.message = SimpleNamespace(
+            content=[SimpleNamespace(text=text)],
+            usage=SimpleNamespace(input_tokens=100, cache_read_input_tokens=300, output_tokens=20),
+            stop_reason=stop_reason,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_final_message(self):
+        return self.message
+
+
+class FakeClient:
+    """Anthropic client whose stream returns the queued responses in order."""
+
+    def __init__(self, *responses: tuple[str, str]):
+        self.responses = list(responses)
+        self.calls = 0
+        self.messages = SimpleNamespace(stream=self._stream)
+
+    def _stream(self, **params):
+        self.calls += 1
+        return FakeStream(*self.responses.pop(0))
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """A fresh on-disk cache used as the shared module cache."""
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    monkeypatch.setattr(llm_cache, "get_cache", lambda: cache)
+    llm_usage.reset()
+    yield cache
+    cache.close()
+    llm_usage.reset()
+
+
+class TestLLMResponseCache:
+    """Tests for the SQLite-backed store."""
+
+    def test_miss_then_hit(self, cache):
+        """An unknown key misses; a stored response is returned on the next get."""
+        key = LLMResponseCache.make_key("model", MESSAGES, max_tokens=100)
+
+        assert cache.get(key) is None
+        cache.set(key, "model", "answer")
+
+        assert cache.get(key) == "answer"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_key_covers_request_parameters(self):
+        """Different parameters produce different keys; dict order does not matter."""
+        key = LLMResponseCache.make_key("model", MESSAGES, max_tokens=100, system="a")
+
+        assert key == LLMResponseCache.make_key("model", MESSAGES, system="a", max_tokens=100)
+        assert key != LLMResponseCache.make_key("model", MESSAGES, max_tokens=200, system="a")
+        assert key != LLMResponseCache.make_key("other", MESSAGES, max_tokens=100, system="a")
+
+    def test_expired_entries_miss(self, tmp_path):
+        """Entries older than the TTL are treated as misses."""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_hours=0)
+        cache.set("key", "model", "answer")
+
+        assert cache.get("key") is None
+        cache.close()
+
+    def test_size_cap_evicts_least_recently_used(self, tmp_path):
+        """Going over max_mb drops the least recently accessed entries first."""
+        cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_mb=2.5 / 1024)
+        cache.set("old", "model", "x" * 1024)
+        cache.set("new", "model", "y" * 1024)
+        cache.get("old")
+        cache.set("newest", "model", "z" * 1024)
+
+        assert cache.get("new") is None
+        assert cache.get("old") is not None
+        assert cache.get("newest") is not None
+        cache.close()
+
+
+class TestCreateMessageText:
+    """Tests for the cached Messages API call."""
+
+    def test_hit_skips_the_api(self, cache):
+        """A repeated request is answered from the cache and counted as a local hit."""
+        client = FakeClient(("matched", "end_turn"))
+
+        first = create_message_text(
+            client, model="model", max_tokens=100, messages=MESSAGES, phase="match"
+        )
+        second = create_message_text(
+            client, model="model", max_tokens=100, messages=MESSAGES, phase="match"
+        )
+
+        assert first == second == "matched"
+        assert client.calls == 1
+        usage = llm_usage.summary()["match"]
+        assert usage["requests"] == 1
+        assert usage["local_cache_hits"] == 1
+        assert usage["prompt_cache_hit_rate"] == "75.0%"
+
+    def test_truncated_response_not_cached(self, cache):
+        """A response cut off by max_tokens is returned but asked for again next time."""
+        client = FakeClient(('[{"index": 1', "max_tokens"), ("[]", "end_turn"))
+
+        first = create_message_text(client, model="model", max_tokens=10, messages=MESSAGES)
+        second = create_message_text(client, model="model", max_tokens=10, messages=MESSAGES)
+
+        assert first == '[{"index": 1'
+        assert second == "[]"
+        assert client.calls == 2
@@ -5,8 +5,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from mealie_mcp.client import RecipeRef
 from mealie_mcp.models import ErrorResponse, MealPlanEntry, MealType, RecipeSummary
 from mealie_mcp.tools.mealplans import (
+    create_meal_plan_entries,
     create_meal_plan_entry,
     delete_meal_plan_entry,
     get_meal_plan,
@@ -96,6 +98,76 @@ class TestCreateMealPlanEntry:
         assert result["code"] == "VALIDATION_ERROR"
 
 
+class TestCreateMealPlanEntries:
+    """Tests for create_meal_plan_entries tool."""
+
+    ENTRIES = [
+        {"date": "2026-01-05", "recipe_slug": "oats", "meal_type": "breakfast"},
+        {"date": "2026-01-05", "recipe_slug": "tacos"},
+    ]
+
+    @staticmethod
+    def created(recipe_date, recipe_id, meal_type):
+        """Echo a created entry back like Mealie does."""
+        return MealPlanEntry(
+            id=f"{recipe_id}-{meal_type}",
+            date=date.fromisoformat(recipe_date),
+            entryType=meal_type,
+            recipeId=recipe_id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_creates_all_entries(self, mock_client):
+        """Slugs resolve in one batch and every entry is created."""
+        mock_client.resolve_recipe_refs.return_value = {
+            "oats": RecipeRef("id-oats", "oats", "Oats"),
+            "tacos": RecipeRef("id-tacos", "tacos", "Tacos"),
+        }
+        mock_client.create_meal_plan_entry.side_effect = self.created
+
+        result = await create_meal_plan_entries(self.ENTRIES)
+
+        mock_client.resolve_recipe_refs.assert_awaited_once_with(["oats", "tacos"])
+        assert result["created"] == 2
+        assert [r["entry"]["meal_type"] for r in result["results"]] == ["breakfast", "dinner"]
+        assert result["results"][1]["entry"]["recipe_id"] == "id-tacos"
+
+    @pytest.mark.asyncio
+    async def test_validates_everything_before_writing(self, mock_client):
+        """Any invalid entry rejects the whole batch."""
+        result = await create_meal_plan_entries(
+            [*self.ENTRIES, {"date": "Monday", "recipe_slug": "x", "meal_type": "brunch"}]
+        )
+
+        assert result["code"] == "VALIDATION_ERROR"
+        assert "entry 2" in result["message"]
+        mock_client.create_meal_plan_entry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rollback_on_failure(self, mock_client):
+        """With rollback, entries created before a failure are deleted again."""
+        mock_client.resolve_recipe_refs.return_value = {
+            "oats": RecipeRef("id-oats", "oats", "Oats"),
+            "tacos": RecipeRef("id-tacos", "tacos", "Tacos"),
+        }
+
+        async def create(recipe_date, recipe_id, meal_type):
+            if recipe_id == "id-tacos":
+                return ErrorResponse.api_error("boom")
+            return self.created(recipe_date, recipe_id, meal_type)
+
+        mock_client.create_meal_plan_entry.side_effect = create
+        mock_client.delete_meal_plan_entry.return_value = {"success": True}
+
+        result = await create_meal_plan_entries(self.ENTRIES, rollback_on_error=True)
+
+        mock_client.delete_meal_plan_entry.assert_awaited_once_with("id-oats-breakfast")
+        assert result["rolled_back"] is True
+        assert result["created"] == 0
+        assert result["failed"] == 1
+        assert result["results"][0]["rolled_back"] is True
+
+
 class TestDeleteMealPlanEntry:
     """Tests for delete_meal_plan_entry tool."""
 
@@ -0,0 +1,142 @@
+"""Tests for Prometheus metrics and the operational HTTP endpoints."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from pytest_httpx import HTTPXMock
+
+from mealie_mcp import metrics
+from mealie_mcp.client import MealieClient
+from mealie_mcp.metrics import Histogram, endpoint_template
+from mealie_mcp.resilience import RetryPolicy
+from mealie_mcp.server import MetricsMiddleware, mcp
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return MealieClient(
+        base_url="http://test-mealie:9000/api",
+        token="test-token",
+        retry_policy=RetryPolicy(retries=0),
+    )
+
+
+class TestMetrics:
+    """Tests for metric types and recording."""
+
+    def test_endpoint_template_collapses_ids(self):
+        """Slugs and UUIDs become {id}; known path segments are kept."""
+        assert endpoint_template("/recipes/pasta-bake") == "/recipes/{id}"
+        assert endpoint_template("/recipes/pasta-bake/last-made") == "/recipes/{id}/last-made"
+        assert (
+            endpoint_template("/households/shopping/lists/3f2a/items/9b1c")
+            == "/households/shopping/lists/{id}/items/{id}"
+        )
+        assert endpoint_template("/recipes/timeline/events") == "/recipes/timeline/events"
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Bucket counts are cumulative and end with +Inf, _sum and _count."""
+        histogram = Histogram("latency_seconds", "Latency", ("tool",), buckets=(0.1, 1.0))
+        histogram.observe("a", value=0.05)
+        histogram.observe("a", value=0.5)
+        histogram.observe("a", value=5)
+
+        assert histogram.samples() == [
+            'latency_seconds_bucket{tool="a",le="0.1"} 1',
+            'latency_seconds_bucket{tool="a",le="1"} 2',
+            'latency_seconds_bucket{tool="a",le="+Inf"} 3',
+            'latency_seconds_sum{tool="a"} 5.55',
+            'latency_seconds_count{tool="a"} 3',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_client_records_each_attempt(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """Every HTTP attempt is timed per endpoint template and counted per status."""
+        httpx_mock.add_response(
+            url="http://test-mealie:9000/api/recipes/missing-recipe", status_code=404
+        )
+        before = metrics.MEALIE_RESPONSES.value("GET", "/recipes/{id}", "404")
+
+        await client.get_recipe("missing-recipe")
+
+        assert metrics.MEALIE_RESPONSES.value("GET", "/recipes/{id}", "404") == before + 1
+        assert metrics.MEALIE_REQUEST_LATENCY.count("GET", "/recipes/{id}") >= 1
+
+    @pytest.mark.asyncio
+    async def test_middleware_times_tool_calls(self):
+        """Tool calls are recorded as ok, error (ErrorResponse dump) or exception."""
+        server = FastMCP("metrics-test")
+        server.add_middleware(MetricsMiddleware())
+
+        @server.tool()
+        async def fine() -> dict:
+            return {"ok": True}
+
+        @server.tool()
+        async def failing() -> dict:
+            return {"error": True, "code": "API_ERROR", "message": "down"}
+
+        @server.tool()
+        async def broken() -> dict:
+            raise RuntimeError("bug")
+
+        async with Client(server) as mcp_client:
+            await mcp_client.call_tool("fine", {})
+            await mcp_client.call_tool("failing", {})
+            await mcp_client.call_tool("broken", {}, raise_on_error=False)
+
+        assert metrics.TOOL_LATENCY.count("fine", "ok") == 1
+        assert metrics.TOOL_LATENCY.count("failing", "error") == 1
+        assert metrics.TOOL_LATENCY.count("broken", "exception") == 1
+
+
+class TestEndpoints:
+    """Tests for /health, /ready and /metrics on the HTTP app."""
+
+    @pytest.fixture
+    def http(self):
+        """HTTP client for the server's ASGI app."""
+        app = mcp.http_app(path="/mcp")
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://mcp")
+
+    @pytest.mark.asyncio
+    async def test_health(self, http: httpx.AsyncClient):
+        """Liveness needs nothing but the process."""
+        response = await http.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_ready_reflects_mealie(
+        self, http: httpx.AsyncClient, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Readiness is 200 when Mealie answers and 503 when it doesn't."""
+        httpx_mock.add_response(url="http://test-mealie:9000/api/app/about", json={})
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+
+        with patch("mealie_mcp.server.get_client", return_value=client):
+            up = await http.get("/ready")
+            down = await http.get("/ready")
+
+        assert up.status_code == 200
+        assert down.status_code == 503
+        assert "Cannot connect" in down.json()["checks"]["mealie"]
+
+    @pytest.mark.asyncio
+    async def test_metrics_exposition(self, http: httpx.AsyncClient, client: MealieClient):
+        """Metrics are served in the Prometheus text format."""
+        with patch("mealie_mcp.server.get_client", return_value=client):
+            response = await http.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE mealie_mcp_tool_duration_seconds histogram" in response.text
+        assert "mealie_mcp_circuit_open 0" in response.text
+        # Monotonic client totals are counters with the _total suffix
+        assert "# TYPE mealie_mcp_mealie_retries_total counter" in response.text
+        assert "mealie_mcp_mealie_short_circuited_total 0" in response.text
+        assert "# TYPE mealie_mcp_mealie_requests_in_flight gauge" in response.text
@@ -0,0 +1,158 @@
+"""Tests for the columnar nutrition store and search_recipes_by_nutrition."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mealie_mcp.models import ErrorResponse, Recipe, RecipeNutrition, RecipeSummary
+
+pytest.importorskip("numpy")
+
+from mealie_mcp import nutrition_store  # noqa: E402
+from mealie_mcp.nutrition_store import NutritionStore, parse_filter  # noqa: E402
+from mealie_mcp.tools.recipes import search_recipes_by_nutrition  # noqa: E402
+
+
+def make_recipe(slug, calories=None, protein=None, sodium=None, prep=None):
+    """Build a recipe with free-text nutrition."""
+    return Recipe(
+        id=slug,
+        slug=slug,
+        name=slug.title(),
+        prepTime=prep,
+        nutrition=RecipeNutrition(calories=calories, proteinContent=protein, sodiumContent=sodium),
+    )
+
+
+LIBRARY = [
+    make_recipe("salad", "420 kcal", "38g", "0.6 g", "10 min"),
+    make_recipe("lasagne", "780 kcal", "42g", "1200mg", "1 hour"),
+    make_recipe("soup", "350 kcal", "12 g", None, "PT20M"),
+    make_recipe("mystery"),
+]
+
+
+class TestParseFilter:
+    """Tests for filter parsing."""
+
+    def test_and_or_groups_and_aliases(self):
+        """AND binds within OR groups; aliases map to canonical columns."""
+        assert parse_filter("calories<600 AND protein>=35 OR carbohydrates < 20g") == [
+            [("calories", "<", 600.0), ("protein", ">=", 35.0)],
+            [("carbs", "<", 20.0)],
+        ]
+
+    def test_units_are_normalized(self):
+        """Values with units convert to the column's unit; salt becomes sodium."""
+        assert parse_filter("sodium<1g AND protein>0.03kg") == [
+            [("sodium", "<", 1000.0), ("protein", ">", 30.0)]
+        ]
+        assert parse_filter("energy<2100kj OR time<=1.5h") == [
+            [("calories", "<", pytest.approx(501.9))],
+            [("total_minutes", "<=", 90.0)],
+        ]
+        assert parse_filter("salt<1.5") == [[("sodium", "<", pytest.approx(600.0))]]
+
+    def test_rejects_mismatched_units(self):
+        """Units that don't fit the field are validation errors, not ignored."""
+        assert parse_filter("calories<500g").code == "VALIDATION_ERROR"
+        assert parse_filter("protein>30kcal").code == "VALIDATION_ERROR"
+        assert parse_filter("prep_minutes<20g").code == "VALIDATION_ERROR"
+
+    def test_rejects_bad_clauses(self):
+        """Unknown fields and malformed clauses are validation errors."""
+        assert parse_filter("vitamin_c>5").code == "VALIDATION_ERROR"
+        assert parse_filter("calories about 500").code == "VALIDATION_ERROR"
+        assert parse_filter("  ").code == "VALIDATION_ERROR"
+
+
+class TestNutritionStore:
+    """Tests for NutritionStore."""
+
+    def test_columns_are_parsed_once(self):
+        """Strings become numeric columns with NaN for missing values."""
+        store = NutritionStore(LIBRARY)
+
+        assert store.columns["calories"].tolist()[:3] == [420, 780, 350]
+        assert store.columns["sodium"][0] == 600
+        assert store.values(3)["calories"] is None
+        assert store.columns["prep_minutes"].tolist()[:3] == [10, 60, 20]
+
+    def test_query_filters_and_sorts(self):
+        """Range predicates run over every row; missing values never match."""
+        store = NutritionStore(LIBRARY)
+
+        rows = store.query(parse_filter("calories<600 AND protein>=35"))
+        assert [store.recipes[r].slug for r in rows] == ["salad"]
+
+        rows = store.query(parse_filter("calories>0"), sort_by="protein", descending=True)
+        assert [store.recipes[r].slug for r in rows] == ["lasagne", "salad", "soup"]
+
+        rows = store.query(parse_filter("sodium!=600"))
+        assert [store.recipes[r].slug for r in rows] == ["lasagne"]
+
+
+class TestSearchRecipesByNutrition:
+    """Tests for the search_recipes_by_nutrition tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_matches_with_values(self):
+        """The tool loads the library once and returns parsed values."""
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id=r.id, slug=r.slug, name=r.name) for r in LIBRARY
+        ]
+        client.get_recipe.side_effect = lambda slug: next(r for r in LIBRARY if r.slug == slug)
+        nutrition_store._recipe_cache.clear()
+
+        with patch("mealie_mcp.tools.recipes.get_client", return_value=client):
+            result = await search_recipes_by_nutrition("prep_minutes<=20", sort_by="kcal")
+
+        assert [r["slug"] for r in result] == ["soup", "salad"]
+        assert result[1]["nutrition"] == {
+            "calories": 420,
+            "protein": 38,
+            "sodium": 600,
+            "prep_minutes": 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_reload_fetches_only_changed_recipes(self):
+        """Later loads list recipes updated since the last one and fetch only those."""
+        stamped = [r.model_copy(update={"date_updated": "2026-01-01T00:00:00"}) for r in LIBRARY]
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id=r.id, slug=r.slug, name=r.name, dateUpdated=r.date_updated)
+            for r in stamped
+        ]
+        client.get_recipe.side_effect = lambda slug: next(r for r in stamped if r.slug == slug)
+        nutrition_store._recipe_cache.clear()
+
+        assert len(await nutrition_store.load_recipes(client)) == 4
+        edited = stamped[0].model_copy(update={"date_updated": "2026-02-01T00:00:00"})
+        client.search_recipes.return_value = [
+            RecipeSummary(
+                id=edited.id, slug=edited.slug, name=edited.name, dateUpdated="2026-02-01T00:00:00"
+            )
+        ]
+        client.get_recipe.side_effect = lambda slug: edited
+        client.get_recipe.reset_mock()
+
+        recipes = await nutrition_store.load_recipes(client)
+
+        assert len(recipes) == 4
+        assert client.search_recipes.call_args.kwargs["query_filter"] == (
+            'dateUpdated > "2026-01-01T00:00:00"'
+        )
+        client.get_recipe.assert_called_once_with(edited.slug)
+
+    @pytest.mark.asyncio
+    async def test_load_error_is_returned(self):
+        """A failed library load surfaces the error."""
+        client = AsyncMock()
+        client.search_recipes.return_value = ErrorResponse.api_error("down")
+
+        with patch("mealie_mcp.tools.recipes.get_client", return_value=client):
+            result = await search_recipes_by_nutrition("calories<500")
+
+        assert result["code"] == "API_ERROR"
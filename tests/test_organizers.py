@@ -0,0 +1,130 @@
+"""Tests for the shared tag/category index."""
+
+import asyncio
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from mealie_mcp.client import MealieClient
+from mealie_mcp.models import ErrorResponse
+from mealie_mcp.organizers import OrganizerIndex, organizer_key, organizer_payload
+
+BASE = "http://test-mealie:9000/api"
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return MealieClient(base_url=BASE, token="test-token")
+
+
+def mock_load(httpx_mock: HTTPXMock, tags=None, categories=None, reusable=False):
+    """Register responses for one full index load."""
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE}/organizers/tags?perPage=-1",
+        json={"items": tags or []},
+        is_reusable=reusable,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE}/organizers/categories?perPage=-1",
+        json={"items": categories or []},
+        is_reusable=reusable,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE}/users/self",
+        json={"id": "user-1", "groupId": "group-1"},
+        is_optional=True,
+    )
+
+
+class TestOrganizerIndex:
+    """Tests for OrganizerIndex."""
+
+    def test_organizer_key(self):
+        """Names and slugs normalize to the same key."""
+        assert organizer_key("Middle Eastern") == "middle-eastern"
+        assert organizer_key("middle-eastern") == "middle-eastern"
+        assert organizer_key(" Quick & Easy ") == "quick-easy"
+
+    @pytest.mark.asyncio
+    async def test_resolves_existing_without_creating(
+        self, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Known names resolve to full objects with IDs and the group ID."""
+        mock_load(
+            httpx_mock,
+            tags=[
+                {"id": "tag-1", "slug": "quick", "name": "Quick"},
+                {"id": "tag-2", "slug": "high-protein", "name": "High Protein"},
+            ],
+        )
+        index = OrganizerIndex(client)
+
+        result = await index.resolve_tags(["High Protein", "quick", "QUICK"])
+
+        assert [t.id for t in result] == ["tag-2", "tag-1"]
+        assert organizer_payload(result)[0] == {
+            "id": "tag-2",
+            "slug": "high-protein",
+            "name": "High Protein",
+            "groupId": "group-1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_once(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """Missing categories are created once, even across concurrent callers."""
+        mock_load(httpx_mock, categories=[{"id": "cat-1", "slug": "dinner", "name": "Dinner"}])
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{BASE}/organizers/categories",
+            json={"id": "cat-2", "slug": "hellofresh", "name": "HelloFresh"},
+        )
+        index = OrganizerIndex(client)
+
+        first, second = await asyncio.gather(
+            index.resolve_categories(["HelloFresh", "Dinner"]),
+            index.resolve_categories(["HelloFresh"]),
+        )
+
+        assert [c.id for c in first] == ["cat-2", "cat-1"]
+        assert [c.id for c in second] == ["cat-2"]
+        posts = [r for r in httpx_mock.get_requests() if r.method == "POST"]
+        assert len(posts) == 1
+        assert json.loads(posts[0].content) == {"name": "HelloFresh"}
+
+    @pytest.mark.asyncio
+    async def test_loads_once_within_ttl(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """Repeated resolves reuse the loaded index until the TTL expires."""
+        mock_load(httpx_mock, tags=[{"id": "tag-1", "slug": "quick", "name": "Quick"}], reusable=True)
+        index = OrganizerIndex(client, ttl_seconds=60)
+
+        await index.resolve_tags(["Quick"])
+        await index.resolve_tags(["Quick"], create_missing=False)
+        tag_loads = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/tags")]
+        assert len(tag_loads) == 1
+
+        index.ttl_seconds = 0
+        await index.resolve_tags(["Quick"])
+        tag_loads = [r for r in httpx_mock.get_requests() if r.url.path.endswith("/tags")]
+        assert len(tag_loads) == 2
+
+    @pytest.mark.asyncio
+    async def test_load_error_is_returned(self, client: MealieClient, httpx_mock: HTTPXMock):
+        """A failed load surfaces as an ErrorResponse."""
+        httpx_mock.add_response(
+            method="GET", url=f"{BASE}/organizers/tags?perPage=-1", status_code=401
+        )
+        httpx_mock.add_response(
+            method="GET", url=f"{BASE}/organizers/categories?perPage=-1", json={"items": []}
+        )
+        httpx_mock.add_response(method="GET", url=f"{BASE}/users/self", status_code=401)
+        index = OrganizerIndex(client)
+
+        result = await index.resolve_tags(["Quick"])
+
+        assert isinstance(result, ErrorResponse)
+        assert result.code == "AUTH_ERROR"
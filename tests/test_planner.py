@@ -0,0 +1,192 @@
+"""Tests for nutrition parsing and the meal plan optimizer."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mealie_mcp.models import Category, Recipe, RecipeIngredient, RecipeNutrition, RecipeSummary
+from mealie_mcp.nutrition import parse_amount, parse_minutes, parse_nutrition
+
+pytest.importorskip("numpy")
+
+from mealie_mcp import nutrition_store, planner  # noqa: E402
+from mealie_mcp.nutrition_store import NutritionStore  # noqa: E402
+from mealie_mcp.tools.mealplans import generate_meal_plan  # noqa: E402
+
+MACROS = {"calories": 2000, "protein": 150, "carbs": 200, "fat": 70}
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def make_recipe(slug, calories, protein, carbs, fat, slot=None, protein_food=None, prep=None):
+    """Build a recipe with nutrition, an optional slot category and main protein."""
+    return Recipe(
+        id=slug,
+        slug=slug,
+        name=slug.replace("-", " ").title(),
+        prepTime=prep,
+        recipeCategory=[Category(id=slot, slug=slot, name=slot.title())] if slot else [],
+        recipeIngredient=[RecipeIngredient(display=f"300g {protein_food}")] if protein_food else [],
+        nutrition=RecipeNutrition(
+            calories=f"{calories} kcal",
+            proteinContent=f"{protein}g",
+            carbohydrateContent=f"{carbs}g",
+            fatContent=f"{fat}g",
+        ),
+    )
+
+
+LIBRARY = [
+    make_recipe("oats", 450, 30, 60, 12, slot="breakfast"),
+    make_recipe("eggs-on-toast", 500, 35, 40, 20, slot="breakfast"),
+    make_recipe("chicken-rice-bowl", 700, 55, 70, 20, slot="lunch", protein_food="chicken"),
+    make_recipe("tuna-salad", 600, 50, 40, 22, slot="lunch", protein_food="tuna"),
+    make_recipe("chicken-stir-fry", 800, 60, 80, 25, protein_food="chicken thigh", prep="15 min"),
+    make_recipe("chicken-curry", 850, 62, 85, 28, protein_food="chicken breast", prep="40 min"),
+    make_recipe("beef-tacos", 820, 55, 85, 30, protein_food="beef mince", prep="20 minutes"),
+    make_recipe("salmon-bake", 780, 58, 70, 30, protein_food="salmon fillet", prep="PT15M"),
+    make_recipe("lentil-dahl", 750, 40, 100, 18, protein_food="red lentils", prep="1 hour"),
+    Recipe(id="no-nutrition", slug="no-nutrition", name="No Nutrition"),
+]
+
+
+class TestNutritionParsing:
+    """Tests for nutrition and time parsing."""
+
+    def test_parse_amount_units(self):
+        """Strings normalize to kcal, grams and milligrams."""
+        assert parse_amount("520 kcal", "calories") == 520
+        assert parse_amount("2,100 kJ", "calories") == pytest.approx(501.9)
+        assert parse_amount("1,5 g", "fat") == 1.5
+        assert parse_amount("0.45 g", "sodium") == 450
+        assert parse_amount("n/a", "protein") is None
+
+    def test_parse_nutrition_and_minutes(self):
+        """Every field is parsed; times accept words and ISO durations."""
+        parsed = parse_nutrition(RecipeNutrition(calories="400", proteinContent="30 g"))
+        assert parsed["calories"] == 400
+        assert parsed["protein"] == 30
+        assert parsed["fat"] is None
+        assert parse_minutes("1 hour 10 min") == 70
+        assert parse_minutes("PT25M") == 25
+        assert parse_minutes("quick") is None
+
+
+class TestPlanner:
+    """Tests for the optimizer."""
+
+    def test_matrix_drops_incomplete_recipes(self):
+        """Recipes without complete macros are skipped and slots come from categories."""
+        matrix = planner.RecipeMatrix(NutritionStore(LIBRARY))
+
+        assert len(matrix) == 9
+        assert matrix.skipped == 1
+        assert matrix.macros.shape == (9, 4)
+        breakfasts = [
+            r.slug
+            for r, ok in zip(matrix.recipes, matrix.slot_mask["breakfast"], strict=True)
+            if ok
+        ]
+        assert breakfasts == ["oats", "eggs-on-toast"]
+
+    def test_plan_respects_dinner_constraints(self):
+        """Easy days get quick dinners, and no protein repeats on consecutive days."""
+        matrix = planner.RecipeMatrix(NutritionStore(LIBRARY))
+        days = [(date(2026, 1, 5) + timedelta(days=i), MACROS) for i in range(5)]
+
+        plan = planner.generate_plan(matrix, days, easy_weekdays={"monday", "tuesday"})
+
+        dinners = [matrix.recipes[d["picks"]["dinner"]] for d in plan]
+        assert len({r.slug for r in dinners}) == 5
+        proteins = [planner.detect_protein(r) for r in dinners]
+        assert all(a != b for a, b in zip(proteins, proteins[1:], strict=False))
+        for day, dinner in zip(plan[:2], dinners[:2], strict=True):
+            assert day["weekday"] in ("monday", "tuesday")
+            assert parse_minutes(dinner.prep_time) <= 20
+        for day in plan:
+            assert day["totals"]["calories"] == pytest.approx(2000, rel=0.15)
+
+    def test_skipped_slots_scale_targets(self):
+        """A takeout dinner leaves the slot empty and shrinks the day's targets."""
+        matrix = planner.RecipeMatrix(NutritionStore(LIBRARY))
+        day = date(2026, 1, 8)
+
+        plan = planner.generate_plan(matrix, [(day, MACROS)], skip={day: {"dinner"}})
+
+        assert set(plan[0]["picks"]) == {"breakfast", "lunch"}
+        assert plan[0]["targets"]["calories"] == pytest.approx(2000 * 2 / 3)
+
+    def test_slots_match_whole_names(self):
+        """Slot keywords match whole tag/category names, not substrings."""
+        mains = make_recipe("pasta", 700, 40, 80, 20, slot="mains")
+        maintenance = make_recipe("broth", 100, 5, 5, 2, slot="maintenance-lunches")
+        prep = make_recipe("bowls", 600, 40, 60, 20, slot="Meal-Prep")
+
+        assert planner.eligible_slots(mains) == {"dinner"}
+        assert planner.eligible_slots(maintenance) == {"lunch", "dinner"}
+        assert planner.eligible_slots(prep) == {"lunch"}
+
+    def test_unfillable_slot_left_empty(self):
+        """A slot with no candidate left is reported unfilled, not given row 0."""
+        matrix = planner.RecipeMatrix(NutritionStore([LIBRARY[0]]))
+        day = date(2026, 1, 8)
+
+        plan = planner.generate_plan(matrix, [(day, MACROS)], slots=("breakfast", "lunch"))
+
+        assert plan[0]["picks"] == {"breakfast": 0}
+        assert plan[0]["unfilled"] == ["lunch"]
+
+
+class TestGenerateMealPlanTool:
+    """Tests for the generate_meal_plan tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_plan_from_library(self):
+        """One call loads the library and returns a formatted plan."""
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id=r.id, slug=r.slug, name=r.name) for r in LIBRARY
+        ]
+        client.get_recipe.side_effect = lambda slug: next(r for r in LIBRARY if r.slug == slug)
+        nutrition_store._recipe_cache.clear()
+
+        with (
+            patch("mealie_mcp.tools.mealplans.get_client", return_value=client),
+            patch(
+                "mealie_mcp.tools.mealplans.get_macros",
+                return_value=dict.fromkeys(WEEKDAYS, MACROS),
+            ),
+        ):
+            result = await generate_meal_plan(start_date="2026-01-05", days=3)
+
+        assert [d["weekday"] for d in result["days"]] == ["monday", "tuesday", "wednesday"]
+        assert set(result["days"][0]["meals"]) == {"breakfast", "lunch", "dinner"}
+        assert result["candidates"] == 9
+        assert result["skipped_without_nutrition"] == 1
+        assert result["days_within_tolerance"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_missing_weekday_targets(self):
+        """Days without macro targets are a validation error, not a KeyError."""
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id=r.id, slug=r.slug, name=r.name) for r in LIBRARY
+        ]
+        client.get_recipe.side_effect = lambda slug: next(r for r in LIBRARY if r.slug == slug)
+        nutrition_store._recipe_cache.clear()
+
+        with (
+            patch("mealie_mcp.tools.mealplans.get_client", return_value=client),
+            patch("mealie_mcp.tools.mealplans.get_macros", return_value={"monday": MACROS}),
+        ):
+            result = await generate_meal_plan(start_date="2026-01-05", days=2)
+
+        assert result["code"] == "VALIDATION_ERROR"
+        assert "tuesday" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_start_date(self):
+        """A malformed date is a validation error."""
+        result = await generate_meal_plan(start_date="next monday")
+
+        assert result["code"] == "VALIDATION_ERROR"
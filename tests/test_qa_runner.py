@@ -0,0 +1,119 @@
+"""Tests for the QA runner's merged update stage."""
+
+import pytest
+from scripts.bulk_import_hellofresh.qa import runner
+
+from mealie_mcp.client import MealieClient
+from mealie_mcp.resilience import CircuitBreaker, RetryPolicy
+from tests.fake_mealie import FakeMealie
+
+
+@pytest.fixture
+def fake():
+    return FakeMealie(recipes=3)
+
+
+@pytest.fixture
+def client(fake: FakeMealie):
+    return MealieClient(
+        base_url=fake.base_url,
+        token="test-token",
+        retry_policy=RetryPolicy(retries=0),
+        circuit_breaker=CircuitBreaker(threshold=1000),
+        transport=fake.transport(),
+    )
+
+
+async def snapshot(client: MealieClient, fake: FakeMealie) -> dict[str, dict]:
+    slugs = [recipe["slug"] for recipe in fake.recipes.values()]
+    recipes = await runner.fetch_recipes_by_category(client, concurrency=2)
+    assert [recipe["slug"] for recipe in recipes] == slugs
+    return {recipe["slug"]: recipe for recipe in recipes}
+
+
+def nutrition_updates(slugs: list[str]) -> dict[str, list[dict]]:
+    return {"nutrition": [{"slug": slug, "nutrition": {"calories": "500 kcal"}} for slug in slugs]}
+
+
+class TestApplyMergedUpdates:
+    """Optimistic concurrency on dateUpdated."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_recipes_are_patched(self, fake, client):
+        """Recipes untouched since the snapshot get one PATCH each."""
+        recipes_by_slug = await snapshot(client, fake)
+
+        counts = await runner.apply_merged_updates(
+            client, nutrition_updates(list(recipes_by_slug)), recipes_by_slug=recipes_by_slug
+        )
+
+        assert counts == {"success": 3, "failed": 0, "conflicts": 0}
+        assert fake.requests["PATCH /api/recipes/{key}"] == 3
+        assert all(r["nutrition"]["calories"] == "500 kcal" for r in fake.recipes.values())
+
+    @pytest.mark.asyncio
+    async def test_stale_recipe_detected_by_bulk_check(self, fake, client):
+        """A recipe edited before the update stage starts is skipped as a conflict."""
+        recipes_by_slug = await snapshot(client, fake)
+        edited = next(iter(fake.recipes.values()))
+        edited["dateUpdated"] = "2099-01-01T00:00:00"
+
+        counts = await runner.apply_merged_updates(
+            client, nutrition_updates(list(recipes_by_slug)), recipes_by_slug=recipes_by_slug
+        )
+
+        assert counts == {"success": 2, "failed": 0, "conflicts": 1}
+        assert edited["nutrition"]["calories"] != "500 kcal"
+
+    @pytest.mark.asyncio
+    async def test_edit_after_bulk_check_caught_before_patch(self, fake, client, monkeypatch):
+        """An edit landing after the bulk check is caught by the per-recipe re-check."""
+        recipes_by_slug = await snapshot(client, fake)
+        edited = next(iter(fake.recipes.values()))
+
+        async def bulk_check_then_edit(client, recipes_by_slug):
+            edited["dateUpdated"] = "2099-01-01T00:00:00"
+            return set()
+
+        monkeypatch.setattr(runner, "find_modified_since_snapshot", bulk_check_then_edit)
+
+        counts = await runner.apply_merged_updates(
+            client, nutrition_updates(list(recipes_by_slug)), recipes_by_slug=recipes_by_slug
+        )
+
+        assert counts == {"success": 2, "failed": 0, "conflicts": 1}
+        assert fake.requests["PATCH /api/recipes/{key}"] == 2
+        assert edited["nutrition"]["calories"] != "500 kcal"
+
+
+class TestPhaseNeeds:
+    """Need checks deciding whether an untouched recipe passed a phase."""
+
+    def test_tagged_recipe_needs_nothing(self):
+        """A recipe with a protein, an effort level and a meal type is done."""
+        recipe = {
+            "tags": [{"name": "Chicken"}, {"name": "quick-easy"}, {"name": "thai"}],
+            "recipeCategory": [{"name": "HelloFresh"}, {"name": "Meal Prep"}],
+        }
+
+        assert not runner.PHASE_NEEDS["tags"](recipe)
+
+    @pytest.mark.parametrize(
+        ("tags", "categories"),
+        [
+            ([], []),
+            (["chicken"], ["Dinner"]),
+            (["quick-easy"], ["Dinner"]),
+            (["chicken", "quick-easy"], ["HelloFresh"]),
+            # Substrings of a valid tag don't count
+            (["chicken-stock", "quick-easy"], ["Dinner"]),
+        ],
+    )
+    def test_missing_required_tags(self, tags, categories):
+        """Any missing always-assigned tag or category means the recipe needs tagging."""
+        recipe = {
+            "tags": [{"name": name} for name in tags],
+            "recipeCategory": [{"name": name} for name in categories],
+        }
+
+        assert runner.PHASE_NEEDS["tags"](recipe)
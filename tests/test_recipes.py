@@ -1,11 +1,18 @@
 """Tests for recipe MCP tools."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from mealie_mcp.models import Category, ErrorResponse, Recipe, RecipeSummary, Tag
-from mealie_mcp.tools.recipes import get_recipe, list_categories, list_tags, search_recipes
+from mealie_mcp.tools.recipes import (
+    get_recipe,
+    get_recipes,
+    list_categories,
+    list_tags,
+    search_recipes,
+)
 
 
 @pytest.fixture
@@ -91,6 +98,43 @@ class TestGetRecipe:
         assert result["instructions"][0]["step"] == 1
 
 
+class TestGetRecipes:
+    """Tests for get_recipes tool."""
+
+    @pytest.mark.asyncio
+    async def test_get_recipes_fetches_concurrently(self, mock_client):
+        """Fetches overlap, results keep request order, and errors are inline."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_get_recipe(slug):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if slug == "missing":
+                return ErrorResponse.not_found("Recipe", slug)
+            return Recipe(id=slug, slug=slug, name=slug.title())
+
+        mock_client.get_recipe.side_effect = fake_get_recipe
+
+        result = await get_recipes(["soup", "missing", "stew", "soup"])
+
+        assert [r["slug"] for r in result["recipes"]] == ["soup", "stew"]
+        assert result["errors"]["missing"]["code"] == "NOT_FOUND"
+        assert mock_client.get_recipe.await_count == 3
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_get_recipes_rejects_oversized_batches(self, mock_client):
+        """Too many slugs is a validation error."""
+        result = await get_recipes([f"recipe-{i}" for i in range(51)])
+
+        assert result["code"] == "VALIDATION_ERROR"
+        mock_client.get_recipe.assert_not_called()
+
+
 class TestListTags:
     """Tests for list_tags tool."""
 
@@ -0,0 +1,214 @@
+"""Tests for the local recipe search index."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mealie_mcp.models import (
+    Category,
+    ErrorResponse,
+    Recipe,
+    RecipeIngredient,
+    RecipeInstruction,
+    RecipeSummary,
+    Tag,
+)
+from mealie_mcp.search_index import RecipeSearchIndex
+from mealie_mcp.tools.recipes import search_recipes
+from mealie_mcp.tools.recipes_write import create_recipe, import_recipe_from_url
+
+
+def make_recipe(recipe_id, slug, name, ingredients=(), steps=(), tags=(), updated=None, **kwargs):
+    """Build a full recipe for indexing."""
+    return Recipe(
+        id=recipe_id,
+        slug=slug,
+        name=name,
+        recipeIngredient=[RecipeIngredient(display=text) for text in ingredients],
+        recipeInstructions=[RecipeInstruction(text=text) for text in steps],
+        tags=[Tag(id=f"t-{t}", slug=t, name=t.title()) for t in tags],
+        dateUpdated=updated,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def index():
+    """Create an in-memory index with a few recipes."""
+    index = RecipeSearchIndex(":memory:")
+    index.upsert(
+        make_recipe(
+            "r1",
+            "chicken-tikka",
+            "Chicken Tikka Masala",
+            ingredients=["500g chicken thigh", "1 cup yoghurt"],
+            tags=["indian", "quick"],
+            recipeCategory=[Category(id="c1", slug="dinner", name="Dinner")],
+        )
+    )
+    index.upsert(
+        make_recipe(
+            "r2",
+            "lemon-pasta",
+            "Lemon Pasta",
+            ingredients=["200g spaghetti", "1 lemon"],
+            steps=["Toss the chicken stock through the pasta"],
+            tags=["quick"],
+        )
+    )
+    index.upsert(make_recipe("r3", "banana-bread", "Banana Bread", ingredients=["3 bananas"]))
+    yield index
+    index.close()
+
+
+class TestRecipeSearchIndex:
+    """Tests for RecipeSearchIndex."""
+
+    def test_matches_ingredients_and_ranks_name_first(self, index):
+        """Name matches outrank matches buried in instructions."""
+        result = index.search("chicken")
+
+        assert [r["slug"] for r in result] == ["chicken-tikka", "lemon-pasta"]
+        assert result[0]["tags"] == ["Indian", "Quick"]
+        assert result[0]["categories"] == ["Dinner"]
+
+    def test_prefix_and_filters(self, index):
+        """The last word matches as a prefix; tag filters accept slugs or names."""
+        assert [r["slug"] for r in index.search("banan")] == ["banana-bread"]
+        assert [r["slug"] for r in index.search(tags=["Indian"])] == ["chicken-tikka"]
+        assert [r["slug"] for r in index.search("chicken", tags=["quick"], limit=1)] == [
+            "chicken-tikka"
+        ]
+        assert index.search("\"'*") == index.search(limit=20)
+
+    def test_upsert_replaces_and_remove_deletes(self, index):
+        """Re-indexing a recipe replaces its old text; remove drops it."""
+        index.upsert(make_recipe("r3", "banana-bread", "Walnut Loaf"))
+
+        assert index.search("banana") == []
+        assert [r["slug"] for r in index.search("walnut")] == ["banana-bread"]
+
+        index.remove("r3")
+        assert len(index) == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_is_incremental(self):
+        """Later syncs only ask for recipes updated after the newest one seen."""
+        index = RecipeSearchIndex(":memory:")
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id="r1", slug="soup", name="Soup", dateUpdated="2024-05-01T10:00:00"),
+        ]
+        client.get_recipe.return_value = make_recipe(
+            "r1", "soup", "Soup", ingredients=["2 leeks"], updated="2024-05-01T10:00:00"
+        )
+
+        assert not index.is_ready
+        assert await index.sync(client) == {"updated": 1, "removed": 0}
+        assert index.is_ready
+        assert [r["slug"] for r in index.search("leek")] == ["soup"]
+
+        client.search_recipes.return_value = []
+        await index.sync(client)
+        assert client.search_recipes.call_args.kwargs["query_filter"] == (
+            'dateUpdated > "2024-05-01T10:00:00"'
+        )
+
+        assert await index.sync(client, full=True) == {"updated": 0, "removed": 1}
+        assert len(index) == 0
+
+    @pytest.mark.asyncio
+    async def test_sync_error_is_returned(self):
+        """A failed listing surfaces as an ErrorResponse and leaves the index unsynced."""
+        index = RecipeSearchIndex(":memory:")
+        client = AsyncMock()
+        client.search_recipes.return_value = ErrorResponse.api_error("boom")
+
+        result = await index.sync(client)
+
+        assert isinstance(result, ErrorResponse)
+        assert not index.is_ready
+
+    @pytest.mark.asyncio
+    async def test_refresh_reconciles_deletions_periodically(self):
+        """Refreshes list the whole library once the reconcile interval passes."""
+        index = RecipeSearchIndex(":memory:")
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id="r1", slug="soup", name="Soup", dateUpdated="2024-05-01T10:00:00"),
+        ]
+        client.get_recipe.return_value = make_recipe(
+            "r1", "soup", "Soup", updated="2024-05-01T10:00:00"
+        )
+        await index.sync(client, full=True)
+
+        # Deleted in Mealie: incremental refreshes never list it again
+        client.search_recipes.return_value = []
+        index.schedule_refresh(client, min_interval=0, reconcile_interval=3600)
+        await index._refresh_task
+        assert len(index) == 1
+
+        index.schedule_refresh(client, min_interval=0, reconcile_interval=0)
+        await index._refresh_task
+        assert client.search_recipes.call_args.kwargs["query_filter"] is None
+        assert len(index) == 0
+        assert index.last_reconciled is not None
+
+    @pytest.mark.asyncio
+    async def test_full_sync_fetches_only_changed_recipes(self, index):
+        """A full sync re-lists everything but only fetches recipes whose dateUpdated moved."""
+        client = AsyncMock()
+        client.search_recipes.return_value = [
+            RecipeSummary(id="r1", slug="chicken-tikka", name="Chicken Tikka Masala"),
+            RecipeSummary(id="r2", slug="lemon-pasta", name="Lemon Pasta", dateUpdated="2024-06"),
+        ]
+        client.get_recipe.return_value = make_recipe(
+            "r2", "lemon-pasta", "Lemon Pasta", updated="2024-06"
+        )
+
+        assert await index.sync(client, full=True) == {"updated": 1, "removed": 1}
+        client.get_recipe.assert_awaited_once_with("lemon-pasta")
+        assert index.search("banana") == []
+
+
+class TestWriteThrough:
+    """Recipe write tools keep the index current."""
+
+    @pytest.mark.asyncio
+    async def test_created_and_imported_recipes_are_indexed(self):
+        """create_recipe and import_recipe_from_url upsert the new recipe."""
+        index = RecipeSearchIndex(":memory:")
+        client = AsyncMock()
+        client.create_recipe.return_value = "leek-soup"
+        client.get_recipe.side_effect = lambda slug: make_recipe(
+            f"id-{slug}", slug, slug.replace("-", " ").title(), ingredients=["2 leeks"]
+        )
+        client.import_recipe_from_url.return_value = "pea-soup"
+
+        with (
+            patch("mealie_mcp.tools.recipes_write.get_client", return_value=client),
+            patch("mealie_mcp.tools.recipes_write.get_search_index", return_value=index),
+        ):
+            await create_recipe(name="Leek Soup")
+            await import_recipe_from_url("https://example.com/pea-soup")
+
+        assert {r["slug"] for r in index.search("soup")} == {"leek-soup", "pea-soup"}
+
+
+class TestSearchRecipesTool:
+    """Tests for search_recipes served from the index."""
+
+    @pytest.mark.asyncio
+    async def test_serves_from_synced_index(self, index):
+        """A synced index answers without calling Mealie's search."""
+        index.schedule_refresh = lambda client: None
+        client = AsyncMock()
+        with (
+            patch("mealie_mcp.tools.recipes.get_client", return_value=client),
+            patch("mealie_mcp.tools.recipes.get_search_index", return_value=index),
+            patch.object(RecipeSearchIndex, "is_ready", True),
+        ):
+            result = await search_recipes(query="yoghurt")
+
+        assert [r["slug"] for r in result] == ["chicken-tikka"]
+        client.search_recipes.assert_not_called()
@@ -4,13 +4,26 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from mealie_mcp.models import ShoppingList, ShoppingListItem, ShoppingListSummary
+from mealie_mcp.client import MealieClient
+from mealie_mcp.models import (
+    ErrorResponse,
+    MealPlanEntry,
+    Recipe,
+    RecipeIngredient,
+    RecipeSummary,
+    ShoppingList,
+    ShoppingListItem,
+    ShoppingListSummary,
+)
+from mealie_mcp.resilience import CircuitBreaker, RetryPolicy
 from mealie_mcp.tools.shopping import (
     add_to_shopping_list,
+    build_shopping_list,
     clear_checked_items,
     get_shopping_list,
     get_shopping_lists,
 )
+from tests.fake_mealie import FakeMealie
 
 
 @pytest.fixture
@@ -128,3 +141,99 @@ class TestClearCheckedItems:
 
         assert result["success"] is True
         assert result["removed_count"] == 3
+
+
+class TestBuildShoppingList:
+    """Tests for build_shopping_list tool."""
+
+    @staticmethod
+    def entry(entry_id, slug):
+        """Build a dinner entry for a recipe."""
+        return MealPlanEntry(
+            id=entry_id,
+            date="2026-01-05",
+            entryType="dinner",
+            recipe=RecipeSummary(id=f"id-{slug}", slug=slug, name=slug.title()),
+        )
+
+    @pytest.mark.asyncio
+    async def test_aggregates_and_bulk_adds(self, mock_client):
+        """Ingredients are summed across planned recipes, minus what's on the list."""
+        mock_client.get_meal_plan.return_value = [
+            self.entry(1, "stir-fry"),
+            self.entry(2, "stir-fry"),
+            self.entry(3, "tray-bake"),
+        ]
+        mock_client.get_shopping_list.return_value = ShoppingList(
+            id="list-1",
+            name="Weekly",
+            listItems=[
+                ShoppingListItem(id="i1", shoppingListId="list-1", note="garlic"),
+                ShoppingListItem(id="i2", shoppingListId="list-1", note="rice", checked=True),
+            ],
+        )
+        ingredients = {
+            "stir-fry": ["200g chicken breast", "2 cloves garlic", "1 cup rice"],
+            "tray-bake": ["200 g chicken breasts, diced", "500g potatoes"],
+        }
+        mock_client.get_recipe.side_effect = lambda slug: Recipe(
+            id=f"id-{slug}",
+            slug=slug,
+            name=slug.title(),
+            recipeIngredient=[RecipeIngredient(display=t) for t in ingredients[slug]],
+        )
+        mock_client.add_shopping_list_items.return_value = []
+
+        result = await build_shopping_list("2026-01-05", "2026-01-11", list_id="list-1")
+
+        assert mock_client.get_recipe.await_count == 2
+        assert result["items"] == ["600 g chicken breast", "500 ml rice", "500 g potatoes"]
+        assert result["already_on_list"] == ["4 cloves garlic"]
+        assert result["added_count"] == 3
+        mock_client.add_shopping_list_items.assert_awaited_once_with("list-1", result["items"])
+
+    @pytest.mark.asyncio
+    async def test_dry_run_and_errors(self, mock_client):
+        """Dry runs don't write; an empty plan is a validation error."""
+        mock_client.get_meal_plan.return_value = [self.entry(1, "soup")]
+        mock_client.get_shopping_list.return_value = ShoppingList(id="list-1", name="Weekly")
+        mock_client.get_recipe.return_value = ErrorResponse.not_found("Recipe", "soup")
+
+        result = await build_shopping_list("2026-01-05", "2026-01-11", "list-1", dry_run=True)
+
+        assert result["items"] == []
+        assert result["failed_recipes"][0]["slug"] == "soup"
+        mock_client.add_shopping_list_items.assert_not_called()
+
+        mock_client.get_meal_plan.return_value = []
+        result = await build_shopping_list("2026-01-05", "2026-01-11", "list-1")
+        assert result["code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.asyncio
+    async def test_uses_every_page_of_the_plan(self):
+        """Periods with more entries than one page of meal plans use every recipe."""
+        fake = FakeMealie(recipes=20)
+        recipes = list(fake.recipes.values())
+        for i in range(60):
+            recipe = recipes[i % len(recipes)]
+            fake.meal_plans[i + 1] = {
+                "id": i + 1,
+                "date": f"2026-01-{1 + i // 3:02d}",
+                "entryType": "dinner",
+                "recipeId": recipe["id"],
+                "recipe": fake._summary(recipe),
+            }
+        client = MealieClient(
+            base_url=fake.base_url,
+            token="test-token",
+            retry_policy=RetryPolicy(retries=0),
+            circuit_breaker=CircuitBreaker(threshold=1000),
+            transport=fake.transport(),
+        )
+
+        with patch("mealie_mcp.tools.shopping.get_client", return_value=client):
+            result = await build_shopping_list(
+                "2026-01-01", "2026-01-31", next(iter(fake.shopping_lists)), dry_run=True
+            )
+
+        assert sum(r["times"] for r in result["recipes"]) == 60
@@ -0,0 +1,90 @@
+"""Tests for the streaming HelloFresh sitemap parser."""
+
+import pytest
+from pytest_httpx import HTTPXMock, IteratorStream
+from scripts.bulk_import_hellofresh.sitemap import (
+    SITEMAP_URLS,
+    SitemapStreamParser,
+    iter_parse_sitemap,
+    parse_sitemap,
+    stream_sitemap,
+)
+
+SITEMAP = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    "<url><loc>https://www.hellofresh.com.au/recipes/"
+    "texan-chicken-pita-pockets-68be74849f91a82a63be9274</loc>"
+    "<lastmod>2026-01-02</lastmod></url>"
+    "<url><loc>https://www.hellofresh.com.au/recipes/"
+    "fancify-r50298-1-cheddar-cheese-and-lime-68bf8dd03cfb1178587558b5</loc></url>"
+    "<url><loc>https://www.hellofresh.com.au/recipes/beef-ragu</loc>"
+    "<lastmod>2026-02-03</lastmod></url>"
+    "</urlset>"
+)
+
+EXPECTED = [
+    (
+        "https://www.hellofresh.com.au/recipes/texan-chicken-pita-pockets-68be74849f91a82a63be9274",
+        "Texan Chicken Pita Pockets",
+        "2026-01-02",
+    ),
+    (
+        "https://www.hellofresh.com.au/recipes/"
+        "fancify-r50298-1-cheddar-cheese-and-lime-68bf8dd03cfb1178587558b5",
+        "Cheddar Cheese And Lime",
+        None,
+    ),
+    ("https://www.hellofresh.com.au/recipes/beef-ragu", "Beef Ragu", "2026-02-03"),
+]
+
+
+def summary(recipes):
+    return [(r["url"], r["name"], r["lastmod"]) for r in recipes]
+
+
+class TestSitemapStreamParser:
+    """Tests for incremental parsing."""
+
+    def test_whole_document(self):
+        """A single chunk parses to every recipe."""
+        assert summary(parse_sitemap(SITEMAP)) == EXPECTED
+
+    @pytest.mark.parametrize("size", [1, 7, 64])
+    def test_chunks_split_mid_tag(self, size):
+        """Chunks cut anywhere, including inside tags, yield the same recipes."""
+        data = SITEMAP.encode()
+        chunks = [data[i : i + size] for i in range(0, len(data), size)]
+
+        assert summary(iter_parse_sitemap(chunks)) == EXPECTED
+
+    def test_recipes_yielded_as_entries_complete(self):
+        """A recipe is yielded once its </url> arrives, before the document ends."""
+        parser = SitemapStreamParser()
+        split = SITEMAP.index("</url>") + len("</url>")
+        # Cut the second entry in the middle of its <loc> tag
+        middle = SITEMAP.index("<lo", split) + 3
+
+        first = list(parser.feed(SITEMAP[:middle]))
+        assert summary(first) == EXPECTED[:1]
+        rest = list(parser.feed(SITEMAP[middle:])) + list(parser.close())
+        assert summary(rest) == EXPECTED[1:]
+
+    def test_https_namespace(self):
+        """Regional sitemaps using the https:// namespace variant are recognised."""
+        xml = SITEMAP.replace("http://www.sitemaps.org", "https://www.sitemaps.org")
+
+        assert summary(parse_sitemap(xml)) == EXPECTED
+
+    @pytest.mark.asyncio
+    async def test_stream_sitemap(self, httpx_mock: HTTPXMock):
+        """stream_sitemap parses the response body as it arrives in chunks."""
+        data = SITEMAP.encode()
+        httpx_mock.add_response(
+            url=SITEMAP_URLS["au"],
+            stream=IteratorStream([data[i : i + 50] for i in range(0, len(data), 50)]),
+        )
+
+        recipes = [recipe async for recipe in stream_sitemap("au")]
+
+        assert summary(recipes) == EXPECTED
@@ -0,0 +1,218 @@
+"""Tests for the background sync engine."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mealie_mcp.client import MealieClient
+from mealie_mcp.models import (
+    ErrorResponse,
+    MealPlanEntry,
+    Recipe,
+    RecipeSummary,
+    ShoppingList,
+    ShoppingListSummary,
+)
+from mealie_mcp.organizers import OrganizerIndex
+from mealie_mcp.resilience import CircuitBreaker, RetryPolicy
+from mealie_mcp.search_index import RecipeSearchIndex
+from mealie_mcp.sync import SyncEngine
+from tests.fake_mealie import FakeMealie
+
+
+def summary(recipe_id, updated):
+    """Build a recipe summary with an update timestamp."""
+    return RecipeSummary(id=recipe_id, slug=recipe_id, name=recipe_id.title(), dateUpdated=updated)
+
+
+@pytest.fixture
+def client():
+    """Create a mock Mealie client with one recipe, meal plan entry and list."""
+    client = AsyncMock()
+    client.search_recipes.return_value = [summary("soup", "2024-05-01T10:00:00")]
+    client.get_recipe.side_effect = lambda slug: Recipe(
+        id=slug, slug=slug, name=slug.title(), dateUpdated="2024-05-01T10:00:00"
+    )
+    client.list_tags.return_value = []
+    client.list_categories.return_value = []
+    client.get_group_id.return_value = "group-1"
+    client.get_meal_plan.return_value = [
+        MealPlanEntry(id=1, date="2024-05-02", entryType="dinner", recipeId="soup")
+    ]
+    client.get_shopping_lists.return_value = [ShoppingListSummary(id="list-1", name="Weekly")]
+    client.get_shopping_list.return_value = ShoppingList(id="list-1", name="Weekly")
+    return client
+
+
+def make_engine(client, **kwargs):
+    """Create an engine isolated from the global organizer/search singletons."""
+    return SyncEngine(
+        client,
+        organizers=OrganizerIndex(client),
+        search_index=kwargs.pop("search_index", None),
+        state_path=kwargs.pop("state_path", None),
+        **kwargs,
+    )
+
+
+class TestSyncEngine:
+    """Tests for SyncEngine."""
+
+    @pytest.mark.asyncio
+    async def test_first_cycle_mirrors_everything(self, client):
+        """The first cycle loads every resource and records freshness."""
+        engine = make_engine(client)
+
+        result = await engine.run_once()
+
+        assert result == {"recipes": 1, "organizers": 0, "meal_plans": 1, "shopping_lists": 1}
+        assert list(engine.recipes) == ["soup"]
+        assert list(engine.shopping_lists) == ["list-1"]
+        freshness = engine.freshness()
+        assert freshness["recipe_high_water"] == "2024-05-01T10:00:00"
+        assert freshness["resources"]["recipes"]["items"] == 1
+        assert freshness["resources"]["recipes"]["age_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_later_cycles_fetch_only_changes(self, client):
+        """After the first cycle, recipes are listed with a dateUpdated filter."""
+        engine = make_engine(client)
+        await engine.run_once()
+        client.get_recipe.reset_mock()
+        client.search_recipes.return_value = [summary("stew", "2024-05-03T08:00:00")]
+
+        result = await engine.run_once()
+
+        assert client.search_recipes.call_args.kwargs["query_filter"] == (
+            'dateUpdated > "2024-05-01T10:00:00"'
+        )
+        assert result["recipes"] == 1
+        assert result["meal_plans"] == 0
+        client.get_recipe.assert_awaited_once_with("stew")
+        assert set(engine.recipes) == {"soup", "stew"}
+        assert engine.high_water == "2024-05-03T08:00:00"
+
+    @pytest.mark.asyncio
+    async def test_full_sync_drops_deleted_recipes(self, client):
+        """A full reconcile removes recipes Mealie no longer lists, including from the index."""
+        index = RecipeSearchIndex(":memory:")
+        engine = make_engine(client, search_index=index)
+        await engine.run_once()
+        assert index.is_ready and len(index) == 1
+
+        client.search_recipes.return_value = []
+        assert await engine.sync_recipes(full=True) == 1
+
+        assert engine.recipes == {}
+        assert len(index) == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_and_reported(self, client):
+        """One failing resource doesn't block the others."""
+        client.get_shopping_lists.return_value = ErrorResponse.api_error("down")
+        engine = make_engine(client)
+
+        result = await engine.run_once()
+
+        assert result["shopping_lists"]["code"] == "API_ERROR"
+        assert result["recipes"] == 1
+        assert engine.freshness()["resources"]["shopping_lists"]["last_error"] == "down"
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resumes_incrementally(self, client, tmp_path):
+        """A restarted engine reloads its mirror and high-water mark."""
+        state_path = tmp_path / "sync.json"
+        await make_engine(client, state_path=state_path).run_once()
+
+        engine = make_engine(client, state_path=state_path)
+
+        assert list(engine.recipes) == ["soup"]
+        assert engine.high_water == "2024-05-01T10:00:00"
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_only_written_on_change(self, client, tmp_path, monkeypatch):
+        """Cycles that change no recipes leave the checkpoint alone."""
+        engine = make_engine(client, state_path=tmp_path / "sync.json")
+        writes = []
+        write = engine._write_checkpoint
+        monkeypatch.setattr(
+            engine, "_write_checkpoint", lambda *args: writes.append(1) or write(*args)
+        )
+
+        await engine.run_once()
+        client.search_recipes.return_value = []
+        await engine.run_once()
+
+        assert len(writes) == 1
+
+    @pytest.mark.asyncio
+    async def test_high_water_stops_before_failed_fetch(self, client):
+        """A recipe that fails to load is listed again on the next cycle."""
+        client.search_recipes.return_value = [
+            summary("soup", "2024-05-01T10:00:00"),
+            summary("stew", "2024-05-02T10:00:00"),
+            summary("pie", "2024-05-03T10:00:00"),
+        ]
+        client.get_recipe.side_effect = lambda slug: (
+            ErrorResponse.api_error("timeout")
+            if slug == "stew"
+            else Recipe(id=slug, slug=slug, name=slug.title(), dateUpdated="2024-05-01T10:00:00")
+        )
+        engine = make_engine(client)
+
+        await engine.sync_recipes()
+
+        assert set(engine.recipes) == {"soup", "pie"}
+        assert engine.high_water == "2024-05-01T10:00:00"
+
+    @pytest.mark.asyncio
+    async def test_meal_plans_and_lists_are_incremental(self, client):
+        """Later cycles filter meal plans by update time and skip unchanged lists."""
+        client.get_shopping_lists.return_value = [
+            ShoppingListSummary(id="list-1", name="Weekly", updatedAt="2024-05-01T10:00:00")
+        ]
+        client.get_shopping_list.return_value = ShoppingList(
+            id="list-1", name="Weekly", updatedAt="2024-05-01T10:00:00"
+        )
+        engine = make_engine(client)
+        await engine.run_once()
+        client.get_shopping_list.reset_mock()
+        client.get_meal_plan.return_value = [
+            MealPlanEntry(id=2, date="2024-05-03", entryType="lunch", recipeId="soup")
+        ]
+
+        result = await engine.run_once()
+
+        assert "updateAt >" in client.get_meal_plan.call_args.kwargs["query_filter"]
+        assert result["meal_plans"] == 1
+        assert set(engine.meal_plans) == {"1", "2"}
+        assert result["shopping_lists"] == 0
+        client.get_shopping_list.assert_not_awaited()
+
+        # A reconcile reloads the whole window, dropping deleted entries
+        await engine.sync_meal_plans(full=True)
+        assert "query_filter" not in client.get_meal_plan.call_args.kwargs
+        assert set(engine.meal_plans) == {"2"}
+
+    @pytest.mark.asyncio
+    async def test_meal_plan_window_is_not_cut_at_one_page(self):
+        """Windows with more entries than Mealie's default page size mirror every entry."""
+        fake = FakeMealie(recipes=1)
+        today = date.today()
+        for i in range(60):
+            entry_date = (today + timedelta(days=i // 3)).isoformat()
+            fake.meal_plans[i + 1] = {"id": i + 1, "date": entry_date, "entryType": "dinner"}
+        client = MealieClient(
+            base_url=fake.base_url,
+            token="test-token",
+            retry_policy=RetryPolicy(retries=0),
+            circuit_breaker=CircuitBreaker(threshold=1000),
+            transport=fake.transport(),
+        )
+        engine = make_engine(client)
+
+        first_day = await client.get_meal_plan(today.isoformat(), today.isoformat(), page_size=2)
+        assert len(first_day) == 3
+        assert await engine.sync_meal_plans(full=True) == 60
+        assert len(engine.meal_plans) == 60
@@ -0,0 +1,149 @@
+"""Tests for OpenTelemetry tracing spans."""
+
+from contextlib import contextmanager
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+from pytest_httpx import HTTPXMock
+
+from mealie_mcp import tracing
+from mealie_mcp.client import MealieClient
+from mealie_mcp.resilience import RetryPolicy
+from mealie_mcp.server import MetricsMiddleware
+
+
+class FakeSpan:
+    """Recorded span with its parent's name."""
+
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class FakeTracer:
+    """Tracer that records spans in start order (sequential code only)."""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes or {}, self._stack[-1].name if self._stack else None)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+    def find(self, name):
+        return next(s for s in self.spans if s.name == name)
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """Record spans for the duration of a test."""
+    fake = FakeTracer()
+    monkeypatch.setattr(tracing, "_tracer", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    """Create a test client."""
+    return MealieClient(
+        base_url="http://test-mealie:9000/api",
+        token="test-token",
+        retry_policy=RetryPolicy(retries=0),
+    )
+
+
+class TestTracing:
+    """Tests for span creation."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Without MEALIE_TRACING spans are no-ops; unknown modes are rejected."""
+        monkeypatch.delenv("MEALIE_TRACING", raising=False)
+
+        assert tracing.setup_tracing() is None
+        with tracing.span("anything") as current:
+            assert current is None
+        with pytest.raises(ValueError):
+            tracing.setup_tracing("jaeger")
+
+    @pytest.mark.asyncio
+    async def test_client_method_http_and_validation_spans(
+        self, tracer: FakeTracer, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """A client call nests the HTTP attempt and model validation spans."""
+        httpx_mock.add_response(
+            url="http://test-mealie:9000/api/recipes/pasta",
+            json={"id": "r1", "slug": "pasta", "name": "Pasta"},
+        )
+
+        await client.get_recipe("pasta")
+
+        assert [s.name for s in tracer.spans] == [
+            "MealieClient.get_recipe",
+            "HTTP GET /recipes/{id}",
+            "validate Recipe",
+        ]
+        method = tracer.find("MealieClient.get_recipe")
+        assert method.attributes["mealie.slug"] == "pasta"
+        http = tracer.find("HTTP GET /recipes/{id}")
+        assert http.parent == "MealieClient.get_recipe"
+        assert http.attributes["url.path"] == "/recipes/pasta"
+        assert http.attributes["http.response.status_code"] == 200
+        assert http.attributes["http.response.body.size"] > 0
+        assert tracer.find("validate Recipe").parent == "MealieClient.get_recipe"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_annotated(
+        self, tracer: FakeTracer, client: MealieClient, httpx_mock: HTTPXMock
+    ):
+        """Failed calls carry the error code; failed attempts the error kind."""
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+
+        await client.search_recipes(query="soup")
+
+        method = tracer.find("MealieClient.search_recipes")
+        assert method.attributes["mealie.query"] == "soup"
+        assert method.attributes["mealie.error_code"] == "API_ERROR"
+        assert tracer.find("HTTP GET /recipes").attributes["error.type"] == "connect_error"
+
+    @pytest.mark.asyncio
+    async def test_tool_span_records_outcome_and_size(self, tracer: FakeTracer):
+        """Tool calls get a span with the tool name, error flag and result size."""
+        server = FastMCP("tracing-test")
+        server.add_middleware(MetricsMiddleware())
+
+        @server.tool()
+        async def lookup() -> dict:
+            return {"error": True, "code": "NOT_FOUND", "message": "missing"}
+
+        async with Client(server) as mcp_client:
+            await mcp_client.call_tool("lookup", {})
+
+        span = tracer.find("tool lookup")
+        assert span.attributes["mcp.tool.name"] == "lookup"
+        assert span.attributes["mcp.tool.error"] is True
+        assert span.attributes["mcp.tool.result_size"] > 0
+
+    def test_file_exporter_writes_json_lines(self, tmp_path):
+        """Each exported span becomes one line in the trace file."""
+        pytest.importorskip("opentelemetry.sdk")
+
+        class Finished:
+            def to_json(self, indent=None):
+                return '{"name": "span"}'
+
+        path = tmp_path / "traces.jsonl"
+        tracing.JsonLinesSpanExporter(str(path)).export([Finished(), Finished()])
+
+        assert path.read_text().splitlines() == ['{"name": "span"}'] * 2